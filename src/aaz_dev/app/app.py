@@ -1,5 +1,7 @@
+import importlib
 import json
 
+import click
 from flask import Flask, jsonify
 from flask.cli import FlaskGroup, shell_command, routes_command
 from flask.logging import create_logger
@@ -7,6 +9,8 @@ from flask.logging import create_logger
 from utils import exceptions
 from utils.config import Config
 from aaz_dev.app.run import run_command
+from aaz_dev.app.serve import serve_command
+from aaz_dev.app.cache import cache_group
 
 
 def create_app():
@@ -49,10 +53,40 @@ def create_app():
     from docs.api import register_blueprints
     register_blueprints(app)
 
+    from job.api import register_blueprints
+    register_blueprints(app)
+
     return app
 
 
-cli = FlaskGroup(
+class AAZDevGroup(FlaskGroup):
+    """The command groups of blueprints are imported from their modules only when they are invoked, so the commands
+    which don't serve the app skip loading the app with all the blueprints and their dependencies.
+    """
+
+    def __init__(self, blueprint_commands, **kwargs):
+        super().__init__(**kwargs)
+        # command name -> "module:blueprint"
+        self.blueprint_commands = blueprint_commands
+
+    def get_command(self, ctx, name):
+        if name in self.blueprint_commands:
+            module_name, bp_name = self.blueprint_commands[name].split(':')
+            return getattr(importlib.import_module(module_name), bp_name).cli
+        return super().get_command(ctx, name)
+
+    def list_commands(self, ctx):
+        # the commands of app are not listed, so that the app is not loaded for help
+        self._load_plugin_commands()
+        return sorted({*click.Group.list_commands(self, ctx), *self.blueprint_commands})
+
+
+cli = AAZDevGroup(
+    blueprint_commands={
+        "command-model": "command.api._cmds:bp",
+        "cli": "cli.api._cmds:bp",
+        "portal": "cli.api.portal:bp",
+    },
     create_app=create_app,
     add_default_commands=False
 )
@@ -60,3 +94,5 @@ cli = FlaskGroup(
 cli.add_command(shell_command)
 cli.add_command(routes_command)
 cli.add_command(run_command)
+cli.add_command(serve_command)
+cli.add_command(cache_group)
@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import time
+
+import click
+
+from utils.config import Config
+from utils.files import write_file_atomically
+
+logger = logging.getLogger('backend')
+
+# increase it when the format of snapshot is changed
+SNAPSHOT_VERSION = 1
+
+
+def build_cache_snapshot():
+    """Build the snapshot of swagger specs and aaz resources in the configured paths."""
+    from command.controller.specs_manager import AAZSpecsManager
+    from swagger.controller.specs_manager import SwaggerSpecsManager
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "swagger": None,
+        "aaz": None,
+    }
+    if Config.SWAGGER_PATH or Config.SWAGGER_MODULE_PATH:
+        snapshot["swagger"] = {
+            **_get_swagger_config(),
+            "planes": SwaggerSpecsManager().dump_snapshot(),
+        }
+    if Config.AAZ_PATH:
+        snapshot["aaz"] = {
+            "resourceVersions": AAZSpecsManager().build_resource_version_index(),
+        }
+    return snapshot
+
+
+def load_cache_snapshot(path=None):
+    """Load the snapshot if it exists. The snapshot of swagger specs is ignored if it's built from other paths,
+    and the stale parts of it are checked when they are used.
+    """
+    from command.controller.specs_manager import AAZSpecsManager
+    from swagger.controller.specs_manager import SwaggerSpecsManager
+
+    path = path or Config.CACHE_SNAPSHOT_PATH
+    if not path or not os.path.isfile(path):
+        return False
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as err:
+        logger.warning(f"Failed to load cache snapshot: {path}: {err}")
+        return False
+    if snapshot.get('version', None) != SNAPSHOT_VERSION:
+        logger.warning(f"Ignore cache snapshot of other version, please build it again: {path}")
+        return False
+
+    swagger = snapshot['swagger']
+    if swagger and (Config.SWAGGER_PATH or Config.SWAGGER_MODULE_PATH) and \
+            all(swagger[k] == v for k, v in _get_swagger_config().items()):
+        SwaggerSpecsManager.set_snapshot(swagger['planes'])
+    aaz = snapshot['aaz']
+    if aaz:
+        AAZSpecsManager.set_resource_version_index(aaz['resourceVersions'])
+    return True
+
+
+def _get_swagger_config():
+    return {
+        "path": Config.SWAGGER_PATH,
+        "modulePath": Config.SWAGGER_MODULE_PATH,
+        "module": Config.DEFAULT_SWAGGER_MODULE,
+    }
+
+
+@click.group("cache", short_help="Manage the cache snapshot loaded by servers.")
+def cache_group():
+    pass
+
+
+@cache_group.command("build", short_help="Build the snapshot of swagger specs and aaz resources.")
+@click.option(
+    "--aaz-path", '-a',
+    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+    default=Config.AAZ_PATH,
+    callback=Config.validate_and_setup_aaz_path,
+    expose_value=False,
+    help="The local path of aaz repo."
+)
+@click.option(
+    "--swagger-path", '-s',
+    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+    default=Config.SWAGGER_PATH,
+    callback=Config.validate_and_setup_swagger_path,
+    expose_value=False,
+    help="The local path of azure-rest-api-specs repo. Official repo is https://github.com/Azure/azure-rest-api-specs"
+)
+@click.option(
+    "--swagger-module-path", "--sm",
+    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+    default=Config.SWAGGER_MODULE_PATH,
+    callback=Config.validate_and_setup_swagger_module_path,
+    expose_value=False,
+    help="The local path of swagger in module level. It can be substituted for --swagger-path."
+)
+@click.option(
+    "--module", '-m',
+    default=Config.DEFAULT_SWAGGER_MODULE,
+    callback=Config.validate_and_setup_default_swagger_module,
+    expose_value=False,
+    help="The default swagger module. It is required when using --swagger-module-path."
+)
+@click.option(
+    "--output", '-o',
+    type=click.Path(file_okay=True, dir_okay=False, writable=True, resolve_path=True),
+    default=Config.CACHE_SNAPSHOT_PATH,
+    callback=Config.validate_and_setup_cache_snapshot_path,
+    expose_value=False,
+    help="The path of snapshot file."
+)
+def build_cache():
+    """Build the snapshot of swagger modules, resource providers, resource maps, readme tags and the versions of
+    aaz resources. It's loaded by `aaz-dev run` and `aaz-dev serve` at startup, so the swagger files are not
+    parsed again unless they're changed.
+    """
+    start = time.time()
+    snapshot = build_cache_snapshot()
+    path = Config.CACHE_SNAPSHOT_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_file_atomically(path, json.dumps(snapshot))
+    print(f"Built cache snapshot in {time.time() - start:.2f}s: {path}")
@@ -1,8 +1,10 @@
+import logging
 import sys
 from aaz_dev.app.app import cli
 
 
 def main() -> None:
+    logging.basicConfig(level="INFO")
     cli.main(args=sys.argv[1:])
 
 
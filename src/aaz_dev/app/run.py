@@ -13,87 +13,115 @@ def is_port_in_use(host, port):
         return s.connect_ex((host, port)) == 0
 
 
+_SERVER_CONFIG_OPTIONS = [
+    click.option(
+        "--host", "-h",
+        default=Config.HOST,
+        required=not Config.HOST,
+        callback=Config.validate_and_setup_host,
+        help="The interface to bind to."
+    ),
+    click.option(
+        "--port", "-p",
+        default=Config.PORT,
+        required=not Config.PORT,
+        callback=Config.validate_and_setup_port,
+        help="The port to bind to."
+    ),
+    click.option(
+        "--aaz-path", '-a',
+        type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
+        default=Config.AAZ_PATH,
+        required=not Config.AAZ_PATH,
+        callback=Config.validate_and_setup_aaz_path,
+        expose_value=False,
+        help="The local path of aaz repo."
+    ),
+    click.option(
+        "--swagger-path", '-s',
+        type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+        default=Config.SWAGGER_PATH,
+        callback=Config.validate_and_setup_swagger_path,
+        expose_value=False,
+        help="The local path of azure-rest-api-specs repo. Official repo is https://github.com/Azure/azure-rest-api-specs"
+    ),
+    click.option(
+        "--swagger-module-path", "--sm",
+        type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+        default=Config.SWAGGER_MODULE_PATH,
+        callback=Config.validate_and_setup_swagger_module_path,
+        expose_value=False,
+        help="The local path of swagger in module level. It can be substituted for --swagger-path."
+    ),
+    click.option(
+        "--module", '-m',
+        default=Config.DEFAULT_SWAGGER_MODULE,
+        callback=Config.validate_and_setup_default_swagger_module,
+        expose_value=False,
+        help="The default swagger module. It is required when using --swagger-module-path."
+    ),
+    click.option(
+        "--resource-provider", "--rp",
+        default=Config.DEFAULT_RESOURCE_PROVIDER,
+        callback=Config.validate_and_setup_default_resource_provider,
+        expose_value=False,
+        help="The default swagger resource provider."
+    ),
+    click.option(
+        "--cli-path", '-c',
+        type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
+        default=Config.CLI_PATH,
+        required=not Config.CLI_PATH,
+        callback=Config.validate_and_setup_cli_path,
+        expose_value=False,
+        help="The local path of azure-cli repo. Official repo is https://github.com/Azure/azure-cli"
+    ),
+    click.option(
+        "--cli-extension-path", '-e',
+        type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
+        default=Config.CLI_EXTENSION_PATH,
+        required=not Config.CLI_EXTENSION_PATH,
+        callback=Config.validate_and_setup_cli_extension_path,
+        expose_value=False,
+        help="The local path of azure-cli-extension repo. Official repo is https://github.com/Azure/azure-cli-extensions"
+    ),
+    click.option(
+        "--workspaces-path", '-w',
+        type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
+        default=Config.AAZ_DEV_WORKSPACE_FOLDER,
+        required=not Config.AAZ_DEV_WORKSPACE_FOLDER,
+        callback=Config.validate_and_setup_aaz_dev_workspace_folder,
+        expose_value=False,
+        help="The folder to load and save workspaces."
+    ),
+    click.option(
+        "--defer-xml/--sync-xml",
+        default=Config.DEFER_XML_SIDECAR,
+        callback=Config.validate_and_setup_defer_xml_sidecar,
+        expose_value=False,
+        help="Render the xml files of command models in background after the json files saved. "
+             "The xml files can also be rendered by `aaz-dev command-model render-xml`."
+    ),
+    click.option(
+        "--cache-snapshot",
+        type=click.Path(file_okay=True, dir_okay=False, resolve_path=True),
+        default=Config.CACHE_SNAPSHOT_PATH,
+        callback=Config.validate_and_setup_cache_snapshot_path,
+        expose_value=False,
+        help="The cache snapshot built by `aaz-dev cache build`, it's loaded at startup if exists."
+    ),
+]
+
+
+def server_config_options(func):
+    """Apply the options to set up the server configurations, they're shared by the `run` and `serve` commands."""
+    for option in reversed(_SERVER_CONFIG_OPTIONS):
+        func = option(func)
+    return func
+
+
 @click.command("run", short_help="Run a development server.")
-@click.option(
-    "--host", "-h",
-    default=Config.HOST,
-    required=not Config.HOST,
-    callback=Config.validate_and_setup_host,
-    help="The interface to bind to."
-)
-@click.option(
-    "--port", "-p",
-    default=Config.PORT,
-    required=not Config.PORT,
-    callback=Config.validate_and_setup_port,
-    help="The port to bind to."
-)
-@click.option(
-    "--aaz-path", '-a',
-    type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
-    default=Config.AAZ_PATH,
-    required=not Config.AAZ_PATH,
-    callback=Config.validate_and_setup_aaz_path,
-    expose_value=False,
-    help="The local path of aaz repo."
-)
-@click.option(
-    "--swagger-path", '-s',
-    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
-    default=Config.SWAGGER_PATH,
-    callback=Config.validate_and_setup_swagger_path,
-    expose_value=False,
-    help="The local path of azure-rest-api-specs repo. Official repo is https://github.com/Azure/azure-rest-api-specs"
-)
-@click.option(
-    "--swagger-module-path", "--sm",
-    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
-    default=Config.SWAGGER_MODULE_PATH,
-    callback=Config.validate_and_setup_swagger_module_path,
-    expose_value=False,
-    help="The local path of swagger in module level. It can be substituted for --swagger-path."
-)
-@click.option(
-    "--module", '-m',
-    default=Config.DEFAULT_SWAGGER_MODULE,
-    callback=Config.validate_and_setup_default_swagger_module,
-    expose_value=False,
-    help="The default swagger module. It is required when using --swagger-module-path."
-)
-@click.option(
-    "--resource-provider", "--rp",
-    default=Config.DEFAULT_RESOURCE_PROVIDER,
-    callback=Config.validate_and_setup_default_resource_provider,
-    expose_value=False,
-    help="The default swagger resource provider."
-)
-@click.option(
-    "--cli-path", '-c',
-    type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
-    default=Config.CLI_PATH,
-    required=not Config.CLI_PATH,
-    callback=Config.validate_and_setup_cli_path,
-    expose_value=False,
-    help="The local path of azure-cli repo. Official repo is https://github.com/Azure/azure-cli"
-)
-@click.option(
-    "--cli-extension-path", '-e',
-    type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
-    default=Config.CLI_EXTENSION_PATH,
-    required=not Config.CLI_EXTENSION_PATH,
-    callback=Config.validate_and_setup_cli_extension_path,
-    expose_value=False,
-    help="The local path of azure-cli-extension repo. Official repo is https://github.com/Azure/azure-cli-extensions"
-)
-@click.option(
-    "--workspaces-path", '-w',
-    type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
-    default=Config.AAZ_DEV_WORKSPACE_FOLDER,
-    required=not Config.AAZ_DEV_WORKSPACE_FOLDER,
-    callback=Config.validate_and_setup_aaz_dev_workspace_folder,
-    expose_value=False,
-    help="The folder to load and save workspaces."
-)
+@server_config_options
 @click.option(
     "--reload/--no-reload",
     default=None,
@@ -153,6 +181,9 @@ def run_command(
     if debugger is None:
         debugger = debug
 
+    from .cache import load_cache_snapshot
+    load_cache_snapshot()
+
     show_server_banner(get_env(), debug, info.app_import_path, eager_loading)
     app = DispatchingApp(info.load_app, use_eager_loading=eager_loading)
 
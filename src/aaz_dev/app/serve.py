@@ -0,0 +1,193 @@
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+
+import click
+from flask.cli import pass_script_info
+
+from utils.config import Config
+from .cache import load_cache_snapshot
+from .run import is_port_in_use, server_config_options
+
+logger = logging.getLogger('backend')
+
+
+def warm_up_caches(with_resources=True):
+    """Build the swagger specs catalog, the resource indexes and the aaz command tree shared by requests."""
+    from command.controller.specs_manager import AAZSpecsManager
+    from swagger.controller.specs_manager import SwaggerSpecsManager
+
+    start = time.time()
+    if Config.SWAGGER_PATH or Config.SWAGGER_MODULE_PATH:
+        SwaggerSpecsManager.warm_up(with_resources=with_resources)
+    AAZSpecsManager.get_shared()
+    logger.info(f"Warmed up caches in {time.time() - start:.2f}s")
+
+
+class PreforkServer:
+    """Serve the wsgi app by the worker processes forked from the master process.
+
+    The master process binds the socket and warms up the caches before forking, so the workers share the listening
+    socket and the warmed caches copy-on-write. Workers exited unexpectedly are replaced. When the master receives
+    SIGHUP, it warms up the caches again and replaces all the workers gracefully.
+    """
+
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, app, host, port, workers, warm_up):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.warm_up = warm_up
+        self._server = None
+        self._worker_pids = set()
+        self._reloading = False
+        self._stopping = False
+
+    def run(self):
+        from werkzeug.serving import make_server
+
+        self._warm_up()
+        self._server = make_server(self.host, self.port, self.app, threaded=True)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        try:
+            for _ in range(self.workers):
+                self._spawn_worker()
+            while not self._stopping:
+                if self._reloading:
+                    self._reloading = False
+                    self._reload()
+                self._reap_workers()
+                time.sleep(self.POLL_INTERVAL)
+        finally:
+            self._stop_workers(self._worker_pids)
+            self._server.server_close()
+
+    def _warm_up(self):
+        # objects frozen by the previous warm up are unfrozen to be collected after they're replaced
+        gc.unfreeze()
+        self.warm_up()
+        gc.collect()
+        # keep the objects of master out of garbage collection, so their memory pages are not copied by workers
+        gc.freeze()
+
+    def _reload(self):
+        logger.info("Reloading workers")
+        old_worker_pids = self._worker_pids
+        self._worker_pids = set()
+        self._warm_up()
+        for _ in range(self.workers):
+            self._spawn_worker()
+        self._stop_workers(old_worker_pids)
+
+    def _spawn_worker(self):
+        pid = os.fork()
+        if pid:
+            self._worker_pids.add(pid)
+            return
+        # worker process
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, self._handle_worker_stop)
+            # wait the handling requests to finish when stopped
+            self._server.daemon_threads = False
+            self._server.serve_forever()
+            # the running jobs may be saving files, and the atexit callbacks are skipped by os._exit
+            from job.api.jobs import shutdown_jobs
+            shutdown_jobs()
+            from command.controller.specs_manager import AAZSpecsManager
+            AAZSpecsManager.wait_xml_sidecars()
+        except BaseException:
+            logger.exception("Worker exited with an error")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap_workers(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            if pid in self._worker_pids:
+                self._worker_pids.remove(pid)
+                if not self._stopping:
+                    logger.warning(f"Worker {pid} exited with status {status}, spawn a new worker")
+                    self._spawn_worker()
+
+    @staticmethod
+    def _stop_workers(pids):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+    def _handle_reload(self, signum, frame):
+        self._reloading = True
+
+    def _handle_stop(self, signum, frame):
+        self._stopping = True
+
+    def _handle_worker_stop(self, signum, frame):
+        # serve_forever should be shutdown from another thread
+        threading.Thread(target=self._server.shutdown).start()
+
+
+@click.command("serve", short_help="Run a production server with multiple worker processes.")
+@server_config_options
+@click.option(
+    "--workers", "-n",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="The number of worker processes."
+)
+@click.option(
+    "--warm-resources/--lazy-resources",
+    default=True,
+    help="Build the resource indexes of all the swagger resource providers before serving, "
+         "otherwise they are built by workers on demand."
+)
+@pass_script_info
+def serve_command(info, host, port, workers, warm_resources):
+    """Run a multi-process server for production.
+
+    The swagger specs catalog, resource indexes and aaz command tree are built once before the worker processes are
+    forked, and shared by them. Send SIGHUP to the master process to rebuild them after the swagger specs changed.
+    On platforms without fork, the server runs in a single process with threads.
+    """
+    if is_port_in_use(host, port):
+        raise ValueError(f"The port '{port}' already been used in '{host}', please specify a new port in '--port' argument.")
+
+    app = info.load_app()
+    load_cache_snapshot()
+
+    def warm_up():
+        with app.app_context():
+            warm_up_caches(with_resources=warm_resources)
+
+    print(f"Serving on http://{host}:{port}/")
+    if not hasattr(os, "fork"):
+        from werkzeug.serving import run_simple
+        warm_up()
+        run_simple(host, port, app, threaded=True)
+        return
+
+    print(f"Master process {os.getpid()} with {workers} workers, send SIGHUP to reload.")
+    PreforkServer(app, host, port, workers, warm_up).run()
@@ -14,6 +14,7 @@ class ApiTestCase(TestCase):
         Config.AAZ_PATH = self.AAZ_FOLDER
         Config.AAZ_DEV_FOLDER = self.AAZ_DEV_FOLDER
         Config.AAZ_DEV_WORKSPACE_FOLDER = os.path.join(self.AAZ_DEV_FOLDER, 'workspaces')
+        Config.AAZ_DEV_JOB_FOLDER = os.path.join(self.AAZ_DEV_FOLDER, 'jobs')
         super().__init__(*args, **kwargs)
         self.app = create_app()
         self.app.testing = True
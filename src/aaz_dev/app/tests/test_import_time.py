@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+SRC_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class ImportTimeTest(TestCase):
+    # the cumulative import time of an entry point in microseconds
+    IMPORT_TIME_BUDGET = 1000000
+
+    # the dependencies which should be imported only when the commands or blueprints using them are invoked
+    LAZY_MODULES = ("fuzzywuzzy", "inflect", "jsonschema", "lxml", "msrest", "msrestazure", "schematics", "yaml")
+
+    ENTRY_POINTS = (
+        ["--help"],
+        ["cache", "--help"],
+        ["cli", "--help"],
+        ["cli", "regenerate", "--help"],
+        ["cli", "generate-by-swagger-tag", "--help"],
+        ["command-model", "--help"],
+        ["command-model", "generate-from-swagger", "--help"],
+        ["portal", "generate", "--help"],
+    )
+
+    def measure_import_time(self, args):
+        env = {**os.environ, "PYTHONPATH": SRC_FOLDER}
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "aaz_dev.app.main", *args],
+            capture_output=True, text=True, env=env, cwd=SRC_FOLDER
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        total = 0
+        modules = set()
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_time, _, name = line[len("import time:"):].split("|")
+            total += int(self_time)
+            modules.add(name.strip().split('.')[0])
+        return total, modules
+
+    def test_entry_points_import_time(self):
+        for args in self.ENTRY_POINTS:
+            with self.subTest(args=args):
+                total, modules = self.measure_import_time(args)
+                self.assertEqual(modules.intersection(self.LAZY_MODULES), set())
+                self.assertLess(total, self.IMPORT_TIME_BUDGET)
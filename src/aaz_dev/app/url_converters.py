@@ -1,6 +1,7 @@
 from werkzeug.routing import BaseConverter, PathConverter
 
-from utils.base64 import b64decode_str, b64encode_str
+from utils.base64 import b64decode_str
+from utils.url_template import b64encode_url
 
 
 class Base64Converter(BaseConverter):
@@ -9,7 +10,7 @@ class Base64Converter(BaseConverter):
         return b64decode_str(value)
 
     def to_url(self, value: str) -> str:
-        return super(Base64Converter, self).to_url(b64encode_str(value))
+        return b64encode_url(value)
 
 
 class NameConverter(BaseConverter):
@@ -11,7 +11,7 @@ bp = Blueprint('cli-cmds', __name__, url_prefix='/CLI/CMDs', cli_group="cli")
 bp.cli.short_help = "Manage aaz commands in azure-cli and azure-cli-extensions."
 
 
-@bp.cli.command("regenerate", short_help="Regenerate aaz commands from command models in azure-cli/azure-cli-extensions")
+@bp.cli.command("regenerate", short_help="Regenerate aaz commands from command models in azure-cli/azure-cli-extensions", with_appcontext=False)
 @click.option(
     "--aaz-path", '-a',
     type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
@@ -73,7 +73,7 @@ def regenerate_code(extension_or_module_name, cli_path=None, cli_extension_path=
         sys.exit(1)
 
 
-@bp.cli.command("generate-by-swagger-tag", short_help="Generate aaz commands from command models in azure-cli/azure-cli-extensions selected by swagger tags.")
+@bp.cli.command("generate-by-swagger-tag", short_help="Generate aaz commands from command models in azure-cli/azure-cli-extensions selected by swagger tags.", with_appcontext=False)
 @click.option(
     "--aaz-path", '-a',
     type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
@@ -2,10 +2,13 @@ from flask import Blueprint, jsonify, request, url_for
 
 from utils.config import Config
 from utils import exceptions
+from utils.files import get_folder_version
+from utils.response_cache import ResponseCache
 from cli.controller.az_module_manager import AzMainManager, AzExtensionManager
 from cli.controller.portal_cli_generator import PortalCliGenerator
 from cli.model.view import CLIModule
 from command.controller.specs_manager import AAZSpecsManager
+from job.api.jobs import is_job_requested, job_response
 import logging
 
 logging.basicConfig(level="INFO")
@@ -13,6 +16,44 @@ logging.basicConfig(level="INFO")
 
 bp = Blueprint('az', __name__, url_prefix='/CLI/Az')
 
+_response_cache = ResponseCache()
+
+
+def _get_module_response(manager, module_name, endpoint):
+    # the view of module is loaded from the files in aaz folder of module
+    aaz_path = manager.get_aaz_path(module_name)
+    version = get_folder_version(aaz_path)
+
+    def build():
+        module = manager.load_module(module_name)
+        result = module.to_primitive()
+        result['url'] = url_for(endpoint, module_name=module.name)
+        return result
+
+    return _response_cache.get_response((aaz_path, version) if version else None, build)
+
+
+def _update_module_response(manager, module_name, endpoint, by_patch=False):
+    # generating the code of module takes long time, so it's run in a job when it's requested
+    data = request.get_json()
+    if 'profiles' not in data:
+        raise exceptions.InvalidAPIUsage("miss profiles for module")
+    module = CLIModule({
+        "name": module_name,
+        "profiles": data['profiles']
+    })
+    url = url_for(endpoint, module_name=module.name)
+
+    def update():
+        updated_module = manager.update_module(module_name, module.profiles, by_patch=by_patch)
+        result = updated_module.to_primitive()
+        result['url'] = url
+        return result
+
+    if is_job_requested():
+        return job_response(update)
+    return jsonify(update())
+
 
 @bp.route("/Profiles", methods=("GET", ))
 def az_profiles():
@@ -49,34 +90,13 @@ def az_main_modules():
 def az_main_module(module_name):
     manager = AzMainManager()
     if request.method == "PUT":
-        data = request.get_json()
-        if 'profiles' not in data:
-            raise exceptions.InvalidAPIUsage("miss profiles for module")
-        module = CLIModule({
-            "name": module_name,
-            "profiles": data['profiles']
-        })
-        module = manager.update_module(module_name, module.profiles)
-        result = module.to_primitive()
-        result['url'] = url_for('az.az_main_module', module_name=module.name)
+        return _update_module_response(manager, module_name, endpoint='az.az_main_module')
     elif request.method == "PATCH":
-        data = request.get_json()
-        if 'profiles' not in data:
-            raise exceptions.InvalidAPIUsage("miss profiles for module")
-        module = CLIModule({
-            "name": module_name,
-            "profiles": data['profiles']
-        })
-        module = manager.update_module(module_name, module.profiles, by_patch=True)
-        result = module.to_primitive()
-        result['url'] = url_for('az.az_main_module', module_name=module.name)
+        return _update_module_response(manager, module_name, endpoint='az.az_main_module', by_patch=True)
     elif request.method == "GET":
-        module = manager.load_module(module_name)
-        result = module.to_primitive()
-        result['url'] = url_for('az.az_main_module', module_name=module.name)
+        return _get_module_response(manager, module_name, endpoint='az.az_main_module')
     else:
         raise NotImplementedError()
-    return jsonify(result)
 
 
 @bp.route("/Extension/Modules", methods=("GET", "POST"))
@@ -109,34 +129,13 @@ def az_extension_modules():
 def az_extension_module(module_name):
     manager = AzExtensionManager()
     if request.method == "PUT":
-        data = request.get_json()
-        if 'profiles' not in data:
-            raise exceptions.InvalidAPIUsage("miss profiles for module")
-        module = CLIModule({
-            "name": module_name,
-            "profiles": data['profiles']
-        })
-        module = manager.update_module(module_name, module.profiles)
-        result = module.to_primitive()
-        result['url'] = url_for('az.az_extension_module', module_name=module.name)
+        return _update_module_response(manager, module_name, endpoint='az.az_extension_module')
     elif request.method == "PATCH":
-        data = request.get_json()
-        if 'profiles' not in data:
-            raise exceptions.InvalidAPIUsage("miss profiles for module")
-        module = CLIModule({
-            "name": module_name,
-            "profiles": data['profiles']
-        })
-        module = manager.update_module(module_name, module.profiles, by_patch=True)
-        result = module.to_primitive()
-        result['url'] = url_for('az.az_extension_module', module_name=module.name)
+        return _update_module_response(manager, module_name, endpoint='az.az_extension_module', by_patch=True)
     elif request.method == "GET":
-        module = manager.load_module(module_name)
-        result = module.to_primitive()
-        result['url'] = url_for('az.az_extension_module', module_name=module.name)
+        return _get_module_response(manager, module_name, endpoint='az.az_extension_module')
     else:
         raise NotImplementedError()
-    return jsonify(result)
 
 
 @bp.route("/Main/Modules/<Name:module_name>/ExportPortalConfig", methods=("POST",))
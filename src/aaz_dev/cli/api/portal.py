@@ -2,14 +2,11 @@
 from flask import Blueprint
 import click, logging
 from utils.config import Config
-from cli.controller.portal_cli_generator import PortalCliGenerator
-
-logging.basicConfig(level="INFO")
 
 bp = Blueprint('portal', __name__, url_prefix='/CLI/Portal')
 
 # commands
-@bp.cli.command("generate", short_help="Generate command portal json file.")
+@bp.cli.command("generate", short_help="Generate command portal json file.", with_appcontext=False)
 @click.option(
     "--aaz-path", '-a',
     type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
@@ -45,6 +42,7 @@ bp = Blueprint('portal', __name__, url_prefix='/CLI/Portal')
 def generate_module_command_portal(module):
     from cli.controller.az_module_manager import AzMainManager, AzExtensionManager
     from command.controller.specs_manager import AAZSpecsManager
+    from cli.controller.portal_cli_generator import PortalCliGenerator
     az_main_manager = AzMainManager()
     az_ext_manager = AzExtensionManager()
     aaz_spec_manager = AAZSpecsManager()
@@ -21,7 +21,7 @@ logger = logging.getLogger('backend')
 class AzAtomicProfileBuilder:
 
     def __init__(self, by_patch=False):
-        self._aaz_spec_manager = AAZSpecsManager()
+        self._aaz_spec_manager = AAZSpecsManager.get_shared()
         self._by_patch = by_patch
 
     def __call__(self, view_profile):
@@ -10,6 +10,7 @@ from cli.controller.az_profile_generator import AzProfileGenerator
 from cli.controller.az_atomic_profile_builder import AzAtomicProfileBuilder
 from cli.model.view import CLIModule, CLIViewProfile, CLIViewCommandGroup, CLIViewCommand
 from cli.templates import get_templates
+from job.controller.job_manager import report_progress
 from utils import exceptions
 from utils.config import Config
 from collections import deque
@@ -74,10 +75,14 @@ class AzModuleManager:
         generators = {}
         atomic_builder = AzAtomicProfileBuilder(by_patch=kwargs.pop('by_patch', False))
         for profile_name, profile in profiles.items():
+            report_progress(f"Build profile: {profile_name}")
             profile = atomic_builder(profile)
             generators[profile_name] = AzProfileGenerator(aaz_folder, profile)
-        for generator in generators.values():
+        for profile_name, generator in generators.items():
+            report_progress(f"Generate code of profile: {profile_name}")
             generator.generate()
+        # the job can't be cancelled after the files start to be saved
+        report_progress("Save code files")
         for generator in generators.values():
             generator.save()
         for patch_file, file_data in self._patch_module(mod_name):
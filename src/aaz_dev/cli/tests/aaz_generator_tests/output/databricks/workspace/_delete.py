@@ -5,8 +5,8 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
+# pylint: skip-file
+# flake8: noqa
 
 from azure.cli.core.aaz import *
 
@@ -29,8 +29,6 @@ class Delete(AAZCommand):
         ]
     }
 
-    AZ_SUPPORT_NO_WAIT = True
-
     def _handler(self, command_args):
         super()._handler(command_args)
         return self.build_lro_poller(self._execute_operations, None)
@@ -54,11 +52,25 @@ class Delete(AAZCommand):
             help="The name of the workspace.",
             required=True,
             id_part="name",
+            fmt=AAZStrArgFormat(
+                max_length=64,
+                min_length=3,
+            ),
         )
         return cls._args_schema
 
     def _execute_operations(self):
+        self.pre_operations()
         yield self.WorkspacesDelete(ctx=self.ctx)()
+        self.post_operations()
+
+    @register_callback
+    def pre_operations(self):
+        pass
+
+    @register_callback
+    def post_operations(self):
+        pass
 
     class WorkspacesDelete(AAZHttpOperation):
         CLIENT_TYPE = "MgmtClient"
@@ -68,7 +80,7 @@ class Delete(AAZCommand):
             session = self.client.send_request(request=request, stream=False, **kwargs)
             if session.http_response.status_code in [202]:
                 return self.client.build_lro_polling(
-                    self.ctx.args.no_wait,
+                    False,
                     session,
                     self.on_200_202_204,
                     self.on_error,
@@ -77,7 +89,7 @@ class Delete(AAZCommand):
                 )
             if session.http_response.status_code in [200, 202, 204]:
                 return self.client.build_lro_polling(
-                    self.ctx.args.no_wait,
+                    False,
                     session,
                     self.on_200_202_204,
                     self.on_error,
@@ -134,4 +146,8 @@ class Delete(AAZCommand):
             pass
 
 
+class _DeleteHelper:
+    """Helper class for Delete"""
+
+
 __all__ = ["Delete"]
@@ -5,8 +5,8 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
+# pylint: skip-file
+# flake8: noqa
 
 from azure.cli.core.aaz import *
 
@@ -29,8 +29,6 @@ class Create(AAZCommand):
         ]
     }
 
-    AZ_SUPPORT_NO_WAIT = True
-
     def _handler(self, command_args):
         super()._handler(command_args)
         return self.build_lro_poller(self._execute_operations, self._output)
@@ -50,7 +48,6 @@ class Create(AAZCommand):
             options=["--peering-name", "--name", "-n"],
             help="The name of the workspace vNet peering.",
             required=True,
-            id_part="child_name_1",
         )
         _args_schema.resource_group = AAZResourceGroupNameArg(
             required=True,
@@ -59,7 +56,10 @@ class Create(AAZCommand):
             options=["--workspace-name"],
             help="The name of the workspace.",
             required=True,
-            id_part="name",
+            fmt=AAZStrArgFormat(
+                max_length=64,
+                min_length=3,
+            ),
         )
         _args_schema.allow_forwarded_traffic = AAZBoolArg(
             options=["--allow-forwarded-traffic"],
@@ -133,7 +133,17 @@ class Create(AAZCommand):
         _schema.address_prefixes = cls._args_address_space_create.address_prefixes
 
     def _execute_operations(self):
+        self.pre_operations()
         yield self.VNetPeeringCreateOrUpdate(ctx=self.ctx)()
+        self.post_operations()
+
+    @register_callback
+    def pre_operations(self):
+        pass
+
+    @register_callback
+    def post_operations(self):
+        pass
 
     def _output(self, *args, **kwargs):
         result = self.deserialize_output(self.ctx.vars.instance, client_flatten=True)
@@ -147,7 +157,7 @@ class Create(AAZCommand):
             session = self.client.send_request(request=request, stream=False, **kwargs)
             if session.http_response.status_code in [202]:
                 return self.client.build_lro_polling(
-                    self.ctx.args.no_wait,
+                    False,
                     session,
                     self.on_200_201,
                     self.on_error,
@@ -156,7 +166,7 @@ class Create(AAZCommand):
                 )
             if session.http_response.status_code in [200, 201]:
                 return self.client.build_lro_polling(
-                    self.ctx.args.no_wait,
+                    False,
                     session,
                     self.on_200_201,
                     self.on_error,
@@ -230,6 +240,7 @@ class Create(AAZCommand):
             _content_value, _builder = self.new_content_builder(
                 self.ctx.args,
                 typ=AAZObjectType,
+                typ_kwargs={"flags": {"client_flatten": True}}
             )
             _builder.set_prop("properties", AAZObjectType, ".", typ_kwargs={"flags": {"required": True, "client_flatten": True}})
 
@@ -238,9 +249,9 @@ class Create(AAZCommand):
                 properties.set_prop("allowForwardedTraffic", AAZBoolType, ".allow_forwarded_traffic")
                 properties.set_prop("allowGatewayTransit", AAZBoolType, ".allow_gateway_transit")
                 properties.set_prop("allowVirtualNetworkAccess", AAZBoolType, ".allow_virtual_network_access")
-                _build_schema_address_space_create(properties.set_prop("databricksAddressSpace", AAZObjectType, ".databricks_address_space"))
+                _CreateHelper._build_schema_address_space_create(properties.set_prop("databricksAddressSpace", AAZObjectType, ".databricks_address_space"))
                 properties.set_prop("databricksVirtualNetwork", AAZObjectType, ".databricks_virtual_network")
-                _build_schema_address_space_create(properties.set_prop("remoteAddressSpace", AAZObjectType, ".remote_address_space"))
+                _CreateHelper._build_schema_address_space_create(properties.set_prop("remoteAddressSpace", AAZObjectType, ".remote_address_space"))
                 properties.set_prop("remoteVirtualNetwork", AAZObjectType, ".remote_virtual_network", typ_kwargs={"flags": {"required": True}})
                 properties.set_prop("useRemoteGateways", AAZBoolType, ".use_remote_gateways")
 
@@ -298,7 +309,7 @@ class Create(AAZCommand):
             properties.databricks_address_space = AAZObjectType(
                 serialized_name="databricksAddressSpace",
             )
-            _build_schema_address_space_read(properties.databricks_address_space)
+            _CreateHelper._build_schema_address_space_read(properties.databricks_address_space)
             properties.databricks_virtual_network = AAZObjectType(
                 serialized_name="databricksVirtualNetwork",
             )
@@ -313,7 +324,7 @@ class Create(AAZCommand):
             properties.remote_address_space = AAZObjectType(
                 serialized_name="remoteAddressSpace",
             )
-            _build_schema_address_space_read(properties.remote_address_space)
+            _CreateHelper._build_schema_address_space_read(properties.remote_address_space)
             properties.remote_virtual_network = AAZObjectType(
                 serialized_name="remoteVirtualNetwork",
                 flags={"required": True},
@@ -331,36 +342,38 @@ class Create(AAZCommand):
             return cls._schema_on_200_201
 
 
-def _build_schema_address_space_create(_builder):
-    if _builder is None:
-        return
-    _builder.set_prop("addressPrefixes", AAZListType, ".address_prefixes")
-
-    address_prefixes = _builder.get(".addressPrefixes")
-    if address_prefixes is not None:
-        address_prefixes.set_elements(AAZStrType, ".")
+class _CreateHelper:
+    """Helper class for Create"""
 
+    @classmethod
+    def _build_schema_address_space_create(cls, _builder):
+        if _builder is None:
+            return
+        _builder.set_prop("addressPrefixes", AAZListType, ".address_prefixes")
 
-_schema_address_space_read = None
+        address_prefixes = _builder.get(".addressPrefixes")
+        if address_prefixes is not None:
+            address_prefixes.set_elements(AAZStrType, ".")
 
+    _schema_address_space_read = None
 
-def _build_schema_address_space_read(_schema):
-    global _schema_address_space_read
-    if _schema_address_space_read is not None:
-        _schema.address_prefixes = _schema_address_space_read.address_prefixes
-        return
+    @classmethod
+    def _build_schema_address_space_read(cls, _schema):
+        if cls._schema_address_space_read is not None:
+            _schema.address_prefixes = cls._schema_address_space_read.address_prefixes
+            return
 
-    _schema_address_space_read = AAZObjectType()
+        cls._schema_address_space_read = _schema_address_space_read = AAZObjectType()
 
-    address_space_read = _schema_address_space_read
-    address_space_read.address_prefixes = AAZListType(
-        serialized_name="addressPrefixes",
-    )
+        address_space_read = _schema_address_space_read
+        address_space_read.address_prefixes = AAZListType(
+            serialized_name="addressPrefixes",
+        )
 
-    address_prefixes = _schema_address_space_read.address_prefixes
-    address_prefixes.Element = AAZStrType()
+        address_prefixes = _schema_address_space_read.address_prefixes
+        address_prefixes.Element = AAZStrType()
 
-    _schema.address_prefixes = _schema_address_space_read.address_prefixes
+        _schema.address_prefixes = cls._schema_address_space_read.address_prefixes
 
 
 __all__ = ["Create"]
@@ -5,8 +5,8 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
+# pylint: skip-file
+# flake8: noqa
 
 from azure.cli.core.aaz import *
 
@@ -51,11 +51,25 @@ class List(AAZCommand):
             options=["--workspace-name"],
             help="The name of the workspace.",
             required=True,
+            fmt=AAZStrArgFormat(
+                max_length=64,
+                min_length=3,
+            ),
         )
         return cls._args_schema
 
     def _execute_operations(self):
+        self.pre_operations()
         self.VNetPeeringListByWorkspace(ctx=self.ctx)()
+        self.post_operations()
+
+    @register_callback
+    def pre_operations(self):
+        pass
+
+    @register_callback
+    def post_operations(self):
+        pass
 
     def _output(self, *args, **kwargs):
         result = self.deserialize_output(self.ctx.vars.instance.value, client_flatten=True)
@@ -178,7 +192,7 @@ class List(AAZCommand):
             properties.databricks_address_space = AAZObjectType(
                 serialized_name="databricksAddressSpace",
             )
-            _build_schema_address_space_read(properties.databricks_address_space)
+            _ListHelper._build_schema_address_space_read(properties.databricks_address_space)
             properties.databricks_virtual_network = AAZObjectType(
                 serialized_name="databricksVirtualNetwork",
             )
@@ -193,7 +207,7 @@ class List(AAZCommand):
             properties.remote_address_space = AAZObjectType(
                 serialized_name="remoteAddressSpace",
             )
-            _build_schema_address_space_read(properties.remote_address_space)
+            _ListHelper._build_schema_address_space_read(properties.remote_address_space)
             properties.remote_virtual_network = AAZObjectType(
                 serialized_name="remoteVirtualNetwork",
                 flags={"required": True},
@@ -211,26 +225,28 @@ class List(AAZCommand):
             return cls._schema_on_200
 
 
-_schema_address_space_read = None
+class _ListHelper:
+    """Helper class for List"""
 
+    _schema_address_space_read = None
 
-def _build_schema_address_space_read(_schema):
-    global _schema_address_space_read
-    if _schema_address_space_read is not None:
-        _schema.address_prefixes = _schema_address_space_read.address_prefixes
-        return
+    @classmethod
+    def _build_schema_address_space_read(cls, _schema):
+        if cls._schema_address_space_read is not None:
+            _schema.address_prefixes = cls._schema_address_space_read.address_prefixes
+            return
 
-    _schema_address_space_read = AAZObjectType()
+        cls._schema_address_space_read = _schema_address_space_read = AAZObjectType()
 
-    address_space_read = _schema_address_space_read
-    address_space_read.address_prefixes = AAZListType(
-        serialized_name="addressPrefixes",
-    )
+        address_space_read = _schema_address_space_read
+        address_space_read.address_prefixes = AAZListType(
+            serialized_name="addressPrefixes",
+        )
 
-    address_prefixes = _schema_address_space_read.address_prefixes
-    address_prefixes.Element = AAZStrType()
+        address_prefixes = _schema_address_space_read.address_prefixes
+        address_prefixes.Element = AAZStrType()
 
-    _schema.address_prefixes = _schema_address_space_read.address_prefixes
+        _schema.address_prefixes = cls._schema_address_space_read.address_prefixes
 
 
 __all__ = ["List"]
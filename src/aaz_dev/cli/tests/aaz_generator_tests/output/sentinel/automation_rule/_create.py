@@ -5,8 +5,8 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
+# pylint: skip-file
+# flake8: noqa
 
 from azure.cli.core.aaz import *
 
@@ -45,7 +45,6 @@ class Create(AAZCommand):
             options=["--automation-rule-id", "--name", "-n"],
             help="Automation rule ID",
             required=True,
-            id_part="child_name_1",
         )
         _args_schema.resource_group = AAZResourceGroupNameArg(
             required=True,
@@ -54,7 +53,10 @@ class Create(AAZCommand):
             options=["--workspace-name"],
             help="The name of the workspace.",
             required=True,
-            id_part="name",
+            fmt=AAZStrArgFormat(
+                max_length=90,
+                min_length=1,
+            ),
         )
 
         # define Arg Group "AutomationRuleToUpsert"
@@ -77,12 +79,19 @@ class Create(AAZCommand):
             arg_group="AutomationRuleToUpsert",
             help="The display name of the automation rule",
             required=True,
+            fmt=AAZStrArgFormat(
+                max_length=500,
+            ),
         )
         _args_schema.order = AAZIntArg(
             options=["--order"],
             arg_group="AutomationRuleToUpsert",
             help="The order of execution of the automation rule",
             required=True,
+            fmt=AAZIntArgFormat(
+                maximum=1000,
+                minimum=1,
+            ),
         )
         _args_schema.triggering_logic = AAZObjectArg(
             options=["--triggering-logic"],
@@ -165,7 +174,7 @@ class Create(AAZCommand):
             options=["email"],
             help="The email of the user the incident is assigned to.",
         )
-        owner.object_id = AAZStrArg(
+        owner.object_id = AAZUuidArg(
             options=["object-id"],
             help="The object id of the user the incident is assigned to.",
         )
@@ -190,7 +199,7 @@ class Create(AAZCommand):
             help="The resource id of the playbook resource",
             required=True,
         )
-        action_configuration.tenant_id = AAZStrArg(
+        action_configuration.tenant_id = AAZUuidArg(
             options=["tenant-id"],
             help="The tenant id of the playbook resource",
         )
@@ -201,7 +210,7 @@ class Create(AAZCommand):
             singular_options=["condition"],
             help="The conditions to evaluate to determine if the automation rule should be triggered on a given object",
         )
-        triggering_logic.expiration_time_utc = AAZStrArg(
+        triggering_logic.expiration_time_utc = AAZDateTimeArg(
             options=["expiration-time-utc"],
             help="Determines when the automation rule should automatically expire and be disabled.",
         )
@@ -254,7 +263,17 @@ class Create(AAZCommand):
         return cls._args_schema
 
     def _execute_operations(self):
+        self.pre_operations()
         self.AutomationRulesCreateOrUpdate(ctx=self.ctx)()
+        self.post_operations()
+
+    @register_callback
+    def pre_operations(self):
+        pass
+
+    @register_callback
+    def post_operations(self):
+        pass
 
     def _output(self, *args, **kwargs):
         result = self.deserialize_output(self.ctx.vars.instance, client_flatten=True)
@@ -335,6 +354,7 @@ class Create(AAZCommand):
             _content_value, _builder = self.new_content_builder(
                 self.ctx.args,
                 typ=AAZObjectType,
+                typ_kwargs={"flags": {"client_flatten": True}}
             )
             _builder.set_prop("etag", AAZStrType, ".etag")
             _builder.set_prop("properties", AAZObjectType, ".", typ_kwargs={"flags": {"required": True, "client_flatten": True}})
@@ -348,7 +368,7 @@ class Create(AAZCommand):
 
             actions = _builder.get(".properties.actions")
             if actions is not None:
-                actions.set_elements(AAZObjectType)
+                actions.set_elements(AAZObjectType, ".")
 
             _elements = _builder.get(".properties.actions[]")
             if _elements is not None:
@@ -374,7 +394,7 @@ class Create(AAZCommand):
 
             labels = _builder.get(".properties.actions[]{actionType:ModifyProperties}.actionConfiguration.labels")
             if labels is not None:
-                labels.set_elements(AAZObjectType)
+                labels.set_elements(AAZObjectType, ".")
 
             _elements = _builder.get(".properties.actions[]{actionType:ModifyProperties}.actionConfiguration.labels[]")
             if _elements is not None:
@@ -407,7 +427,7 @@ class Create(AAZCommand):
 
             conditions = _builder.get(".properties.triggeringLogic.conditions")
             if conditions is not None:
-                conditions.set_elements(AAZObjectType)
+                conditions.set_elements(AAZObjectType, ".")
 
             _elements = _builder.get(".properties.triggeringLogic.conditions[]")
             if _elements is not None:
@@ -474,7 +494,7 @@ class Create(AAZCommand):
                 serialized_name="createdBy",
                 flags={"read_only": True},
             )
-            _build_schema_client_info_read(properties.created_by)
+            _CreateHelper._build_schema_client_info_read(properties.created_by)
             properties.created_time_utc = AAZStrType(
                 serialized_name="createdTimeUtc",
                 flags={"read_only": True},
@@ -487,7 +507,7 @@ class Create(AAZCommand):
                 serialized_name="lastModifiedBy",
                 flags={"read_only": True},
             )
-            _build_schema_client_info_read(properties.last_modified_by)
+            _CreateHelper._build_schema_client_info_read(properties.last_modified_by)
             properties.last_modified_time_utc = AAZStrType(
                 serialized_name="lastModifiedTimeUtc",
                 flags={"read_only": True},
@@ -645,42 +665,44 @@ class Create(AAZCommand):
             return cls._schema_on_200_201
 
 
-_schema_client_info_read = None
-
-
-def _build_schema_client_info_read(_schema):
-    global _schema_client_info_read
-    if _schema_client_info_read is not None:
-        _schema.email = _schema_client_info_read.email
-        _schema.name = _schema_client_info_read.name
-        _schema.object_id = _schema_client_info_read.object_id
-        _schema.user_principal_name = _schema_client_info_read.user_principal_name
-        return
-
-    _schema_client_info_read = AAZObjectType(
-        flags={"read_only": True}
-    )
-
-    client_info_read = _schema_client_info_read
-    client_info_read.email = AAZStrType(
-        flags={"read_only": True},
-    )
-    client_info_read.name = AAZStrType(
-        flags={"read_only": True},
-    )
-    client_info_read.object_id = AAZStrType(
-        serialized_name="objectId",
-        flags={"read_only": True},
-    )
-    client_info_read.user_principal_name = AAZStrType(
-        serialized_name="userPrincipalName",
-        flags={"read_only": True},
-    )
-
-    _schema.email = _schema_client_info_read.email
-    _schema.name = _schema_client_info_read.name
-    _schema.object_id = _schema_client_info_read.object_id
-    _schema.user_principal_name = _schema_client_info_read.user_principal_name
+class _CreateHelper:
+    """Helper class for Create"""
+
+    _schema_client_info_read = None
+
+    @classmethod
+    def _build_schema_client_info_read(cls, _schema):
+        if cls._schema_client_info_read is not None:
+            _schema.email = cls._schema_client_info_read.email
+            _schema.name = cls._schema_client_info_read.name
+            _schema.object_id = cls._schema_client_info_read.object_id
+            _schema.user_principal_name = cls._schema_client_info_read.user_principal_name
+            return
+
+        cls._schema_client_info_read = _schema_client_info_read = AAZObjectType(
+            flags={"read_only": True}
+        )
+
+        client_info_read = _schema_client_info_read
+        client_info_read.email = AAZStrType(
+            flags={"read_only": True},
+        )
+        client_info_read.name = AAZStrType(
+            flags={"read_only": True},
+        )
+        client_info_read.object_id = AAZStrType(
+            serialized_name="objectId",
+            flags={"read_only": True},
+        )
+        client_info_read.user_principal_name = AAZStrType(
+            serialized_name="userPrincipalName",
+            flags={"read_only": True},
+        )
+
+        _schema.email = cls._schema_client_info_read.email
+        _schema.name = cls._schema_client_info_read.name
+        _schema.object_id = cls._schema_client_info_read.object_id
+        _schema.user_principal_name = cls._schema_client_info_read.user_principal_name
 
 
 __all__ = ["Create"]
@@ -5,8 +5,8 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
+# pylint: skip-file
+# flake8: noqa
 
 from azure.cli.core.aaz import *
 
@@ -55,11 +55,25 @@ class Delete(AAZCommand):
             help="The name of the workspace.",
             required=True,
             id_part="name",
+            fmt=AAZStrArgFormat(
+                max_length=90,
+                min_length=1,
+            ),
         )
         return cls._args_schema
 
     def _execute_operations(self):
+        self.pre_operations()
         self.AutomationRulesDelete(ctx=self.ctx)()
+        self.post_operations()
+
+    @register_callback
+    def pre_operations(self):
+        pass
+
+    @register_callback
+    def post_operations(self):
+        pass
 
     def _output(self, *args, **kwargs):
         result = self.deserialize_output(self.ctx.vars.instance, client_flatten=True)
@@ -127,4 +141,8 @@ class Delete(AAZCommand):
             pass
 
 
+class _DeleteHelper:
+    """Helper class for Delete"""
+
+
 __all__ = ["Delete"]
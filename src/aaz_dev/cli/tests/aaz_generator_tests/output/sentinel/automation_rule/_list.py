@@ -5,8 +5,8 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
+# pylint: skip-file
+# flake8: noqa
 
 from azure.cli.core.aaz import *
 
@@ -47,11 +47,25 @@ class List(AAZCommand):
             options=["--workspace-name"],
             help="The name of the workspace.",
             required=True,
+            fmt=AAZStrArgFormat(
+                max_length=90,
+                min_length=1,
+            ),
         )
         return cls._args_schema
 
     def _execute_operations(self):
+        self.pre_operations()
         self.AutomationRulesList(ctx=self.ctx)()
+        self.post_operations()
+
+    @register_callback
+    def pre_operations(self):
+        pass
+
+    @register_callback
+    def post_operations(self):
+        pass
 
     def _output(self, *args, **kwargs):
         result = self.deserialize_output(self.ctx.vars.instance.value, client_flatten=True)
@@ -174,7 +188,7 @@ class List(AAZCommand):
                 serialized_name="createdBy",
                 flags={"read_only": True},
             )
-            _build_schema_client_info_read(properties.created_by)
+            _ListHelper._build_schema_client_info_read(properties.created_by)
             properties.created_time_utc = AAZStrType(
                 serialized_name="createdTimeUtc",
                 flags={"read_only": True},
@@ -187,7 +201,7 @@ class List(AAZCommand):
                 serialized_name="lastModifiedBy",
                 flags={"read_only": True},
             )
-            _build_schema_client_info_read(properties.last_modified_by)
+            _ListHelper._build_schema_client_info_read(properties.last_modified_by)
             properties.last_modified_time_utc = AAZStrType(
                 serialized_name="lastModifiedTimeUtc",
                 flags={"read_only": True},
@@ -345,42 +359,44 @@ class List(AAZCommand):
             return cls._schema_on_200
 
 
-_schema_client_info_read = None
-
-
-def _build_schema_client_info_read(_schema):
-    global _schema_client_info_read
-    if _schema_client_info_read is not None:
-        _schema.email = _schema_client_info_read.email
-        _schema.name = _schema_client_info_read.name
-        _schema.object_id = _schema_client_info_read.object_id
-        _schema.user_principal_name = _schema_client_info_read.user_principal_name
-        return
-
-    _schema_client_info_read = AAZObjectType(
-        flags={"read_only": True}
-    )
-
-    client_info_read = _schema_client_info_read
-    client_info_read.email = AAZStrType(
-        flags={"read_only": True},
-    )
-    client_info_read.name = AAZStrType(
-        flags={"read_only": True},
-    )
-    client_info_read.object_id = AAZStrType(
-        serialized_name="objectId",
-        flags={"read_only": True},
-    )
-    client_info_read.user_principal_name = AAZStrType(
-        serialized_name="userPrincipalName",
-        flags={"read_only": True},
-    )
-
-    _schema.email = _schema_client_info_read.email
-    _schema.name = _schema_client_info_read.name
-    _schema.object_id = _schema_client_info_read.object_id
-    _schema.user_principal_name = _schema_client_info_read.user_principal_name
+class _ListHelper:
+    """Helper class for List"""
+
+    _schema_client_info_read = None
+
+    @classmethod
+    def _build_schema_client_info_read(cls, _schema):
+        if cls._schema_client_info_read is not None:
+            _schema.email = cls._schema_client_info_read.email
+            _schema.name = cls._schema_client_info_read.name
+            _schema.object_id = cls._schema_client_info_read.object_id
+            _schema.user_principal_name = cls._schema_client_info_read.user_principal_name
+            return
+
+        cls._schema_client_info_read = _schema_client_info_read = AAZObjectType(
+            flags={"read_only": True}
+        )
+
+        client_info_read = _schema_client_info_read
+        client_info_read.email = AAZStrType(
+            flags={"read_only": True},
+        )
+        client_info_read.name = AAZStrType(
+            flags={"read_only": True},
+        )
+        client_info_read.object_id = AAZStrType(
+            serialized_name="objectId",
+            flags={"read_only": True},
+        )
+        client_info_read.user_principal_name = AAZStrType(
+            serialized_name="userPrincipalName",
+            flags={"read_only": True},
+        )
+
+        _schema.email = cls._schema_client_info_read.email
+        _schema.name = cls._schema_client_info_read.name
+        _schema.object_id = cls._schema_client_info_read.object_id
+        _schema.user_principal_name = cls._schema_client_info_read.user_principal_name
 
 
 __all__ = ["List"]
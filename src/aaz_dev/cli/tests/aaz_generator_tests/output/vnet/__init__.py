@@ -5,4 +5,7 @@
 # Code generated by aaz-dev-tools
 # --------------------------------------------------------------------------------------------
 
+# pylint: skip-file
+# flake8: noqa
+
 from .__cmd_group import *
@@ -41,7 +41,7 @@ setup(
     license='MIT',
     author='Microsoft Corporation',
     author_email='azpycli@microsoft.com',
-    url='https://github.com/Azure/azure-cli-extensions/tree/master/src/az-firewall',
+    url='https://github.com/Azure/azure-cli-extensions/tree/main/src/az-firewall',
     classifiers=CLASSIFIERS,
     packages=find_packages(exclude=["tests"]),
     package_data={'azext_az_firewall': ['azext_metadata.json']},
@@ -1,31 +0,0 @@
-# --------------------------------------------------------------------------------------------
-# Copyright (c) Microsoft Corporation. All rights reserved.
-# Licensed under the MIT License. See License.txt in the project root for license information.
-#
-# Code generated by aaz-dev-tools
-# --------------------------------------------------------------------------------------------
-
-from azure.cli.core import AzCommandsLoader
-from azext_new_extension._help import helps  # pylint: disable=unused-import
-
-
-class NewExtensionCommandsLoader(AzCommandsLoader):
-
-    def __init__(self, cli_ctx=None):
-        from azure.cli.core.commands import CliCommandType
-        custom_command_type = CliCommandType(
-            operations_tmpl='azext_new_extension.custom#{}')
-        super().__init__(cli_ctx=cli_ctx,
-                         custom_command_type=custom_command_type)
-
-    def load_command_table(self, args):
-        from azext_new_extension.commands import load_command_table
-        load_command_table(self, args)
-        return self.command_table
-
-    def load_arguments(self, command):
-        from azext_new_extension._params import load_arguments
-        load_arguments(self, command)
-
-
-COMMAND_LOADER_CLS = NewExtensionCommandsLoader
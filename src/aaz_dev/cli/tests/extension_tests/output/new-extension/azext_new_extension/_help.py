@@ -1,11 +0,0 @@
-# --------------------------------------------------------------------------------------------
-# Copyright (c) Microsoft Corporation. All rights reserved.
-# Licensed under the MIT License. See License.txt in the project root for license information.
-#
-# Code generated by aaz-dev-tools
-# --------------------------------------------------------------------------------------------
-
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
-
-from knack.help_files import helps  # pylint: disable=unused-import
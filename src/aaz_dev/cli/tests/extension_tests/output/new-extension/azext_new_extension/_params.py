@@ -1,13 +0,0 @@
-# --------------------------------------------------------------------------------------------
-# Copyright (c) Microsoft Corporation. All rights reserved.
-# Licensed under the MIT License. See License.txt in the project root for license information.
-#
-# Code generated by aaz-dev-tools
-# --------------------------------------------------------------------------------------------
-
-# pylint: disable=too-many-lines
-# pylint: disable=too-many-statements
-
-
-def load_arguments(self, _):  # pylint: disable=unused-argument
-    pass
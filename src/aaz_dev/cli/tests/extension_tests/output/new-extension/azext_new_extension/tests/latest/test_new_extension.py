@@ -1,13 +0,0 @@
-# --------------------------------------------------------------------------------------------
-# Copyright (c) Microsoft Corporation. All rights reserved.
-# Licensed under the MIT License. See License.txt in the project root for license information.
-#
-# Code generated by aaz-dev-tools
-# --------------------------------------------------------------------------------------------
-
-from azure.cli.testsdk import *
-
-
-class NewExtensionScenario(ScenarioTest):
-    # TODO: add tests here
-    pass
@@ -21,7 +21,7 @@ def resource_id_type(value):
     return swagger_resource_path_to_resource_id(value)
 
 
-@bp.cli.command("generate-from-swagger", short_help="Generate command models into aaz from swagger specs")
+@bp.cli.command("generate-from-swagger", short_help="Generate command models into aaz from swagger specs", with_appcontext=False)
 @click.option(
     "--swagger-path", '-s',
     type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
@@ -75,69 +75,98 @@ def resource_id_type(value):
 def generate_command_models_from_swagger(swagger_tag, workspace_path=None):
     from swagger.controller.specs_manager import SwaggerSpecsManager
     from command.controller.specs_manager import AAZSpecsManager
-    from command.controller.workspace_manager import WorkspaceManager
     from utils.config import Config
     from utils.exceptions import InvalidAPIUsage
-    from command.model.configuration import CMDHelp
 
     try:
         swagger_specs = SwaggerSpecsManager()
         aaz_specs = AAZSpecsManager()
 
-        module_manager = swagger_specs.get_module_manager(Config.DEFAULT_PLANE, Config.DEFAULT_SWAGGER_MODULE)
-        rp = module_manager.get_resource_provider(Config.DEFAULT_RESOURCE_PROVIDER)
-
-        resource_map = rp.get_resource_map_by_tag(swagger_tag)
-        if not resource_map:
-            raise InvalidAPIUsage(f"Tag `{swagger_tag}` is not exist")
-
-        version_resource_map = {}
-        for resource_id, version_map in resource_map.items():
-            v_list = [v for v in version_map]
-            if len(v_list) > 1:
-                raise InvalidAPIUsage(f"Tag `{swagger_tag}` contains multiple api versions of one resource", payload={
-                    "Resource": resource_id,
-                    "versions": v_list,
-                })
-            v = v_list[0]
-            if v not in version_resource_map:
-                version_resource_map[v] = []
-            version_resource_map[v].append({
-                "id": resource_id
-            })
-
-        ws = WorkspaceManager.new(
-            name=Config.DEFAULT_SWAGGER_MODULE,
+        ws = _generate_workspace_from_swagger(
+            swagger_specs, aaz_specs,
             plane=Config.DEFAULT_PLANE,
-            folder=workspace_path or WorkspaceManager.IN_MEMORY,  # if workspace path exist, use workspace else use in memory folder
-            swagger_manager=swagger_specs,
-            aaz_manager=aaz_specs,
+            module=Config.DEFAULT_SWAGGER_MODULE,
+            rp_name=Config.DEFAULT_RESOURCE_PROVIDER,
+            swagger_tag=swagger_tag,
+            workspace_path=workspace_path,
         )
-        mod_names = Config.DEFAULT_SWAGGER_MODULE.split('/')
-        for version, resources in version_resource_map.items():
-            ws.add_new_resources_by_swagger(
-                mod_names=mod_names, version=version, resources=resources
-            )
+        ws.generate_to_aaz()
 
-        # provide default short summary
-        for node in ws.iter_command_tree_nodes():
-            if not node.help:
-                node.help = CMDHelp()
-            if not node.help.short:
-                node.help.short = f"Manage {node.names[-1]}"
+    except InvalidAPIUsage as err:
+        logger.error(err)
+        sys.exit(1)
+    except ValueError as err:
+        logger.error(err)
+        sys.exit(1)
 
-        for leaf in ws.iter_command_tree_leaves():
-            if not leaf.help:
-                leaf.help = CMDHelp()
-            if not leaf.help.short:
-                n = leaf.names[-1]
-                n = n[0].upper() + n[1:]
-                leaf.help.short = f"{n} {leaf.names[-2]}"
 
-        if not ws.is_in_memory:
-            ws.save()
+@bp.cli.command(
+    "batch-generate-from-swagger", short_help="Generate command models into aaz from swagger tags in a manifest",
+    with_appcontext=False)
+@click.option(
+    "--swagger-path", '-s',
+    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+    default=Config.SWAGGER_PATH,
+    required=not Config.SWAGGER_PATH,
+    callback=Config.validate_and_setup_swagger_path,
+    expose_value=False,
+    help="The local path of azure-rest-api-specs repo. Official repo is https://github.com/Azure/azure-rest-api-specs"
+)
+@click.option(
+    "--aaz-path", '-a',
+    type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
+    default=Config.AAZ_PATH,
+    required=not Config.AAZ_PATH,
+    callback=Config.validate_and_setup_aaz_path,
+    expose_value=False,
+    help="The local path of aaz repo."
+)
+@click.option(
+    "--manifest",
+    type=click.Path(file_okay=True, dir_okay=False, readable=True, resolve_path=True),
+    required=True,
+    help="The yaml or json file with a list of entries, each entry has 'module', 'resourceProvider', 'swaggerTag' "
+         "and optional 'plane' and 'workspacePath'."
+)
+def batch_generate_command_models_from_swagger(manifest):
+    import yaml
+    from swagger.controller.command_generator import CommandGenerator
+    from swagger.controller.specs_manager import SwaggerSpecsManager
+    from command.controller.specs_manager import AAZSpecsManager
+    from utils.config import Config
+    from utils.exceptions import InvalidAPIUsage
 
-        ws.generate_to_aaz()
+    try:
+        with open(manifest, 'r') as f:
+            entries = yaml.safe_load(f)
+        if not isinstance(entries, list):
+            raise ValueError(f"Invalid manifest, expect a list of entries: {manifest}")
+        for entry in entries:
+            if not isinstance(entry, dict) or \
+                    any(not entry.get(key) for key in ("module", "resourceProvider", "swaggerTag")):
+                raise ValueError(f"Invalid manifest entry, 'module', 'resourceProvider' and 'swaggerTag' are required: "
+                                 f"{entry}")
+
+        # the swagger specs, swagger loader and aaz specs are shared by entries, and aaz is saved once at the end
+        swagger_specs = SwaggerSpecsManager()
+        aaz_specs = AAZSpecsManager()
+        command_generator = CommandGenerator()
+
+        for entry in entries:
+            logger.info(f"Generate '{entry['module']}' '{entry['resourceProvider']}' '{entry['swaggerTag']}'")
+            ws = _generate_workspace_from_swagger(
+                swagger_specs, aaz_specs,
+                plane=entry.get("plane", Config.DEFAULT_PLANE),
+                module=entry["module"],
+                rp_name=entry["resourceProvider"],
+                swagger_tag=entry["swaggerTag"],
+                workspace_path=entry.get("workspacePath", None),
+                command_generator=command_generator,
+            )
+            ws.generate_to_aaz(save=False)
+
+        aaz_specs.save()
+        logger.info(f"Generated {len(entries)} entries")
 
     except InvalidAPIUsage as err:
         logger.error(err)
@@ -145,3 +174,152 @@ def generate_command_models_from_swagger(swagger_tag, workspace_path=None):
     except ValueError as err:
         logger.error(err)
         sys.exit(1)
+
+
+def _generate_workspace_from_swagger(swagger_specs, aaz_specs, plane, module, rp_name, swagger_tag,
+                                     workspace_path=None, command_generator=None):
+    from command.controller.workspace_manager import WorkspaceManager
+    from utils.exceptions import InvalidAPIUsage
+    from command.model.configuration import CMDHelp
+
+    module_manager = swagger_specs.get_module_manager(plane, module.split('/'))
+    rp = module_manager.get_resource_provider(rp_name)
+
+    resource_map = rp.get_resource_map_by_tag(swagger_tag)
+    if not resource_map:
+        raise InvalidAPIUsage(f"Tag `{swagger_tag}` is not exist")
+
+    version_resource_map = {}
+    for resource_id, version_map in resource_map.items():
+        v_list = [v for v in version_map]
+        if len(v_list) > 1:
+            raise InvalidAPIUsage(f"Tag `{swagger_tag}` contains multiple api versions of one resource", payload={
+                "Resource": resource_id,
+                "versions": v_list,
+            })
+        v = v_list[0]
+        if v not in version_resource_map:
+            version_resource_map[v] = []
+        version_resource_map[v].append({
+            "id": resource_id
+        })
+
+    ws = WorkspaceManager.new(
+        name=module,
+        plane=plane,
+        folder=workspace_path or WorkspaceManager.IN_MEMORY,  # if workspace path exist, use workspace else use in memory folder
+        swagger_manager=swagger_specs,
+        aaz_manager=aaz_specs,
+        command_generator=command_generator,
+    )
+    mod_names = module.split('/')
+    for version, resources in version_resource_map.items():
+        ws.add_new_resources_by_swagger(
+            mod_names=mod_names, version=version, resources=resources
+        )
+
+    # provide default short summary
+    for node in ws.iter_command_tree_nodes():
+        if not node.help:
+            node.help = CMDHelp()
+        if not node.help.short:
+            node.help.short = f"Manage {node.names[-1]}"
+
+    for leaf in ws.iter_command_tree_leaves():
+        if not leaf.help:
+            leaf.help = CMDHelp()
+        if not leaf.help.short:
+            n = leaf.names[-1]
+            n = n[0].upper() + n[1:]
+            leaf.help.short = f"{n} {leaf.names[-2]}"
+
+    if not ws.is_in_memory:
+        ws.save()
+    return ws
+
+
+@bp.cli.command("render-xml", short_help="Render the xml files of command models in aaz.", with_appcontext=False)
+@click.option(
+    "--aaz-path", '-a',
+    type=click.Path(file_okay=False, dir_okay=True, writable=True, readable=True, resolve_path=True),
+    default=Config.AAZ_PATH,
+    required=not Config.AAZ_PATH,
+    callback=Config.validate_and_setup_aaz_path,
+    expose_value=False,
+    help="The local path of aaz repo."
+)
+@click.option(
+    "--force", '-f',
+    is_flag=True,
+    default=False,
+    help="Render all xml files, including the ones which are newer than their json files."
+)
+def render_command_models_to_xml(force):
+    from command.controller.specs_manager import AAZSpecsManager
+
+    try:
+        aaz_specs = AAZSpecsManager()
+        count = 0
+        for json_path in aaz_specs.iter_resource_cfg_json_paths():
+            if not force and not aaz_specs.is_xml_sidecar_stale(json_path):
+                continue
+            aaz_specs.sync_xml_sidecar(json_path)
+            count += 1
+        logger.info(f"Rendered {count} xml files")
+    except ValueError as err:
+        logger.error(err)
+        sys.exit(1)
+
+
+@bp.cli.command("verify", short_help="Verify the command models in aaz.", with_appcontext=False)
+@click.option(
+    "--aaz-path", '-a',
+    type=click.Path(file_okay=False, dir_okay=True, readable=True, resolve_path=True),
+    default=Config.AAZ_PATH,
+    required=not Config.AAZ_PATH,
+    callback=Config.validate_and_setup_aaz_path,
+    expose_value=False,
+    help="The local path of aaz repo."
+)
+@click.option(
+    "--changed-since",
+    help="Only verify the resource files changed since the git ref, such as 'origin/main'."
+)
+@click.option(
+    "--workers", '-w',
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of worker processes. Default is the number of processors."
+)
+def verify_command_models(changed_since=None, workers=None):
+    from command.controller.specs_manager import AAZSpecsManager
+
+    try:
+        aaz_specs = AAZSpecsManager()
+        failed = 0
+
+        for cmd_name, errors in aaz_specs.verify_command_tree_resources().items():
+            failed += 1
+            logger.error(f"Command '{cmd_name}': {'; '.join(errors)}")
+
+        if changed_since:
+            file_paths = aaz_specs.get_changed_resource_cfg_paths(changed_since)
+        else:
+            file_paths = [*aaz_specs.iter_resource_cfg_json_paths(), *aaz_specs.iter_resource_cfg_ref_paths()]
+
+        count = 0
+        for file_path, errors in aaz_specs.iter_verify_resource_cfg_files(file_paths, max_workers=workers):
+            count += 1
+            if errors:
+                failed += 1
+                logger.error(f"{file_path}: {'; '.join(errors)}")
+            if count % 500 == 0:
+                logger.info(f"Verified {count}/{len(file_paths)} files")
+        logger.info(f"Verified {count} files")
+    except ValueError as err:
+        logger.error(err)
+        sys.exit(1)
+
+    if failed:
+        logger.error(f"Found {failed} invalid command models")
+        sys.exit(1)
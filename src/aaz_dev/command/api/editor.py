@@ -1,13 +1,68 @@
 import os
 
-from flask import Blueprint, jsonify, request, url_for
+from flask import Blueprint, g, jsonify, request, url_for
 
 from command.controller.workspace_manager import WorkspaceManager
+from command.controller.workspace_session import WorkspaceSessionCache
+from job.api.jobs import is_job_requested, job_response
 from utils import exceptions
 from utils.config import Config
+from utils.files import get_file_digest, get_file_version
+from utils.response_cache import ResponseCache
 
 bp = Blueprint('editor', __name__, url_prefix='/AAZ/Editor')
 
+_workspace_sessions = WorkspaceSessionCache()
+_response_cache = ResponseCache()
+
+
+def _load_workspace(name):
+    session = _workspace_sessions.acquire(name)
+    g.setdefault('workspace_sessions', []).append(session)
+    return session.manager
+
+
+def _run_workspace_operation(name, operation, discard=False):
+    """Run the operation of workspace, the session of workspace is held until the operation finished.
+
+    The session is discarded after the operation when `discard` is set, for the operations which modify the workspace
+    in memory without saving it.
+    """
+    session = _workspace_sessions.acquire(name)
+    try:
+        result = operation(session.manager)
+    except BaseException:
+        # the workspace may be modified partially by the failed or cancelled operation
+        _workspace_sessions.release(session, discard=True)
+        raise
+    _workspace_sessions.release(session, discard=discard)
+    return result
+
+
+def _workspace_operation_response(name, operation, discard=False):
+    """Run the long-running operation of workspace in the request, or in a job when it's requested."""
+    if is_job_requested():
+        # load the workspace in the request, so that a missing workspace is responded by 404 instead of a failed job,
+        # and the loaded session is reused by the job
+        _workspace_sessions.release(_workspace_sessions.acquire(name))
+        return job_response(_run_workspace_operation, name, operation, discard=discard)
+    _run_workspace_operation(name, operation, discard=discard)
+    return "", 200
+
+
+@bp.after_request
+def _release_workspace_sessions(response):
+    for session in g.pop('workspace_sessions', []):
+        # the workspace may be modified partially by the failed request
+        _workspace_sessions.release(session, discard=response.status_code >= 400)
+    return response
+
+
+@bp.teardown_request
+def _discard_workspace_sessions(exc):
+    for session in g.pop('workspace_sessions', []):
+        _workspace_sessions.release(session, discard=True)
+
 
 @bp.route("/Workspaces", methods=("GET", "POST"))
 def editor_workspaces():
@@ -42,10 +97,26 @@ def editor_workspaces():
 
 @bp.route("/Workspaces/<name>", methods=("GET", "DELETE"))
 def editor_workspace(name):
-    manager = WorkspaceManager(name)
     if request.method == "GET":
-        manager.load()
+        def build():
+            manager = _load_workspace(name)
+            result = manager.ws.to_primitive()
+            result.update({
+                'url': url_for('editor.editor_workspace', name=manager.name),
+                'folder': manager.folder,
+                'updated': os.path.getmtime(manager.path)
+            })
+            return result
+
+        # the workspace is only modified by saving ws.json, the digest of its content tells the changes in the same
+        # stat, and the stat is used for the updated time in response
+        ws_path = os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, name, 'ws.json')
+        version = get_file_version(ws_path)
+        digest = get_file_digest(ws_path)
+        return _response_cache.get_response((ws_path, version, digest) if version and digest else None, build)
     elif request.method == "DELETE":
+        manager = WorkspaceManager(name)
+        _workspace_sessions.discard(name)
         if manager.delete():
             return '', 200
         else:
@@ -53,19 +124,10 @@ def editor_workspace(name):
     else:
         raise NotImplementedError()
 
-    result = manager.ws.to_primitive()
-    result.update({
-        'url': url_for('editor.editor_workspace', name=manager.name),
-        'folder': manager.folder,
-        'updated': os.path.getmtime(manager.path)
-    })
-    return jsonify(result)
-
 
 @bp.route("/Workspaces/<name>/SwaggerDefault", methods=("GET",))
 def get_workspace_swagger_default_options(name):
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     result = {
         "plane": manager.ws.plane,
         "modNames": Config.DEFAULT_SWAGGER_MODULE.split('/') if Config.DEFAULT_SWAGGER_MODULE else None,
@@ -87,6 +149,7 @@ def rename_workspace(name):
         if 'name' not in data or not data['name']:
             raise exceptions.InvalidAPIUsage("Invalid request")
         new_name = data['name'].strip()
+        _workspace_sessions.discard(name)
         manager.rename(new_name)
         result = manager.ws.to_primitive()
         result.update({
@@ -101,10 +164,11 @@ def rename_workspace(name):
 
 @bp.route("/Workspaces/<name>/Generate", methods=("POST",))
 def editor_workspace_generate(name):
-    manager = WorkspaceManager(name)
-    manager.load()
-    manager.generate_to_aaz()
-    return "", 200
+    def generate(manager):
+        manager.generate_to_aaz()
+
+    # the commands of sub resources in aaz are merged into the workspace in memory by generating, which is not saved
+    return _workspace_operation_response(name, generate, discard=True)
 
 
 # command tree operations
@@ -114,8 +178,7 @@ def editor_workspace_command_tree_node(name, node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     node = manager.find_command_tree_node(*node_names)
     if not node and request.method != "DELETE":
         raise exceptions.ResourceNotFind("Command group not exist")
@@ -162,8 +225,7 @@ def editor_workspace_command_tree_node_rename(name, node_names):
     if not node_names:
         raise exceptions.InvalidAPIUsage("Cannot Rename root node")
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.find_command_tree_node(*node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
 
@@ -186,8 +248,7 @@ def editor_workspace_command(name, node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     leaf = manager.find_command_tree_leaf(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -234,8 +295,7 @@ def editor_workspace_command_rename(name, node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.find_command_tree_leaf(*node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
 
@@ -270,8 +330,7 @@ def editor_workspace_command_argument(name, node_names, leaf_name, arg_var):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     leaf = manager.find_command_tree_leaf(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -307,8 +366,7 @@ def editor_workspace_command_argument_flatten(name, node_names, leaf_name, arg_v
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     leaf = manager.find_command_tree_leaf(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -333,8 +391,7 @@ def editor_workspace_command_argument_unflatten(name, node_names, leaf_name, arg
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     leaf = manager.find_command_tree_leaf(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -364,8 +421,7 @@ def editor_workspace_command_argument_unwrap_class(name, node_names, leaf_name,
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     leaf = manager.find_command_tree_leaf(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -387,8 +443,7 @@ def editor_workspace_command_argument_find_similar(name, node_names, leaf_name,
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     leaf = manager.find_command_tree_leaf(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -446,11 +501,6 @@ def editor_workspace_tree_node_resources(name, node_names):
     if len(node_names) > 0:
         raise exceptions.InvalidAPIUsage("Not support to add resources under a specific node.")
 
-    manager = WorkspaceManager(name)
-    manager.load()
-    if not manager.find_command_tree_node(*node_names):
-        raise exceptions.ResourceNotFind("Command group not exist")
-
     # add new resource
     data = request.get_json()
     if not isinstance(data, dict):
@@ -463,13 +513,17 @@ def editor_workspace_tree_node_resources(name, node_names):
     except KeyError:
         raise exceptions.InvalidAPIUsage("Invalid request")
 
-    manager.add_new_resources_by_swagger(
-        mod_names=mod_names,
-        version=version,
-        resources=resources,
-    )
-    manager.save()
-    return "", 200
+    def add_swagger(manager):
+        if not manager.find_command_tree_node(*node_names):
+            raise exceptions.ResourceNotFind("Command group not exist")
+        manager.add_new_resources_by_swagger(
+            mod_names=mod_names,
+            version=version,
+            resources=resources,
+        )
+        manager.save()
+
+    return _workspace_operation_response(name, add_swagger)
 
 
 @bp.route("/Workspaces/<name>/CommandTree/Nodes/<names_path:node_names>/Resources", methods=("GET",))
@@ -478,8 +532,7 @@ def editor_workspace_resources(name, node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.find_command_tree_node(*node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
 
@@ -491,8 +544,7 @@ def editor_workspace_resources(name, node_names):
 
 @bp.route("/Workspaces/<name>/Resources/Merge", methods=("POST",))
 def editor_workspace_resources_merge(name):
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     data = request.get_json()
     if "mainResource" not in data or "plusResource" not in data:
         raise exceptions.InvalidAPIUsage("Invalid request")
@@ -509,23 +561,23 @@ def editor_workspace_resources_merge(name):
 @bp.route("/Workspaces/<name>/Resources/ReloadSwagger", methods=("POST",))
 def editor_workspace_resource_reload_swagger(name):
     # update resource by reloading swagger
-    manager = WorkspaceManager(name)
-    manager.load()
     data = request.get_json()
     try:
         resources = data['resources']
     except KeyError:
         raise exceptions.InvalidAPIUsage("Invalid request")
-    manager.reload_swagger_resources(resources=resources)
-    manager.save()
-    return "", 200
+
+    def reload_swagger(manager):
+        manager.reload_swagger_resources(resources=resources)
+        manager.save()
+
+    return _workspace_operation_response(name, reload_swagger)
 
 
 @bp.route("/Workspaces/<name>/Resources/<base64:resource_id>/V/<base64:version>", methods=("DELETE",))
 def editor_workspace_resource(name, resource_id, version):
     # remove commands of the resource, including commands of subresources
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.remove_resource(resource_id, version):
         return "", 204
     manager.save()
@@ -535,8 +587,7 @@ def editor_workspace_resource(name, resource_id, version):
 @bp.route("/Workspaces/<name>/Resources/<base64:resource_id>/V/<base64:version>/Commands", methods=("GET",))
 def list_workspace_resource_related_commands(name, resource_id, version):
     # list commands of the resource, including commands of sub resources
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     commands = manager.list_commands_by_resource(resource_id, version)
     result = [command.to_primitive() for command in commands]
     return jsonify(result)
@@ -545,8 +596,7 @@ def list_workspace_resource_related_commands(name, resource_id, version):
 @bp.route("/Workspaces/<name>/Resources/<base64:resource_id>/V/<base64:version>/Subresources", methods=("POST",))
 def editor_workspace_subresources(name, resource_id, version):
     # add subresource command
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     data = request.get_json()
     try:
         arg_var = data['arg']
@@ -562,8 +612,7 @@ def editor_workspace_subresources(name, resource_id, version):
 @bp.route("/Workspaces/<name>/Resources/<base64:resource_id>/V/<base64:version>/Subresources/<base64:subresource>", methods=("DELETE",))
 def editor_workspace_subresource(name, resource_id, version, subresource):
     # Remove commands of subresource
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.remove_subresource(resource_id, version, subresource):
         return "", 204
     manager.save()
@@ -573,8 +622,7 @@ def editor_workspace_subresource(name, resource_id, version, subresource):
 @bp.route("/Workspaces/<name>/Resources/<base64:resource_id>/V/<base64:version>/Subresources/<base64:subresource>/Commands", methods=("GET",))
 def list_workspace_subresource_related_commands(name, resource_id, version, subresource):
     # list commands of subresource
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     commands = manager.list_commands_by_subresource(resource_id, version, subresource)
     result = [command.to_primitive() for command in commands]
     return jsonify(result)
@@ -586,8 +634,7 @@ def editor_workspace_try_command_group(name, node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.find_command_tree_node(*node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
 
@@ -601,8 +648,7 @@ def editor_workspace_try_command(name, node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = WorkspaceManager(name)
-    manager.load()
+    manager = _load_workspace(name)
     if not manager.find_command_tree_leaf(*node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
 
@@ -1,10 +1,14 @@
 from flask import Blueprint, jsonify, request, url_for
 from utils import exceptions
+from utils.listing import is_listing_requested, list_response
+from utils.response_cache import ResponseCache
 from command.controller.specs_manager import AAZSpecsManager
 
 
 bp = Blueprint('specs', __name__, url_prefix='/AAZ/Specs')
 
+_response_cache = ResponseCache()
+
 
 # modules
 @bp.route("/CommandTree/Nodes/<names_path:node_names>", methods=("GET",))
@@ -13,13 +17,39 @@ def command_tree_node(node_names):
         raise exceptions.ResourceNotFind("Command group not exist")
     node_names = node_names[1:]
 
-    manager = AAZSpecsManager()
-    node = manager.find_command_group(*node_names)
-    if not node:
-        raise exceptions.ResourceNotFind("Command group not exist")
-
-    result = node.to_primitive()
-    return jsonify(result)
+    if is_listing_requested():
+        manager = AAZSpecsManager.get_shared()
+        node = manager.find_command_group(*node_names)
+        if not node:
+            raise exceptions.ResourceNotFind("Command group not exist")
+        return list_response(_iter_command_tree_entries(node))
+
+    def build():
+        manager = AAZSpecsManager.get_shared()
+        node = manager.find_command_group(*node_names)
+        if not node:
+            raise exceptions.ResourceNotFind("Command group not exist")
+        return node.to_primitive()
+
+    return _response_cache.get_response(AAZSpecsManager.get_command_tree_version(), build)
+
+
+def _iter_command_tree_entries(node):
+    """Iterate the command groups and commands of the sub tree in depth first order, the command groups are listed
+    without their children.
+    """
+    def build_group(group=node):
+        result = {"names": group.names}
+        if group.help:
+            result["help"] = group.help.to_primitive()
+        return result
+
+    yield "group:" + " ".join(node.names), build_group
+    for name in sorted(node.commands or {}):
+        leaf = node.commands[name]
+        yield "command:" + " ".join(leaf.names), leaf.to_primitive
+    for name in sorted(node.command_groups or {}):
+        yield from _iter_command_tree_entries(node.command_groups[name])
 
 
 @bp.route("/CommandTree/Nodes/<names_path:node_names>/Leaves/<name:leaf_name>", methods=("GET",))
@@ -28,13 +58,14 @@ def command_tree_leaf(node_names, leaf_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = AAZSpecsManager()
-    leaf = manager.find_command(*node_names, leaf_name)
-    if not leaf:
-        raise exceptions.ResourceNotFind("Command not exist")
+    def build():
+        manager = AAZSpecsManager.get_shared()
+        leaf = manager.find_command(*node_names, leaf_name)
+        if not leaf:
+            raise exceptions.ResourceNotFind("Command not exist")
+        return leaf.to_primitive()
 
-    result = leaf.to_primitive()
-    return jsonify(result)
+    return _response_cache.get_response(AAZSpecsManager.get_command_tree_version(), build)
 
 
 @bp.route("/CommandTree/Nodes/<names_path:node_names>/Leaves/<name:leaf_name>/Versions/<base64:version_name>", methods=("GET",))
@@ -43,7 +74,7 @@ def aaz_command_in_version(node_names, leaf_name, version_name):
         raise exceptions.ResourceNotFind("Command not exist")
     node_names = node_names[1:]
 
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager.get_shared()
     leaf = manager.find_command(*node_names, leaf_name)
     if not leaf:
         raise exceptions.ResourceNotFind("Command not exist")
@@ -75,7 +106,7 @@ def aaz_command_in_version(node_names, leaf_name, version_name):
 
 @bp.route("/Resources/<plane>/<base64:resource_id>", methods=("GET", ))
 def get_resource(plane, resource_id):
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager.get_shared()
     versions = manager.get_resource_versions(plane, resource_id)
     if versions is None:
         raise exceptions.ResourceNotFind("Resource not exist")
@@ -91,7 +122,7 @@ def filter_resources(plane):
     data = request.get_json()
     if 'resources' not in data:
         raise exceptions.InvalidAPIUsage("Invalid request body")
-    manager = AAZSpecsManager()
+    manager = AAZSpecsManager.get_shared()
 
     result = {
         'resources': []
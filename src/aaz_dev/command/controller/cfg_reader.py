@@ -4,8 +4,10 @@ from command.model.configuration import CMDConfiguration, CMDHttpOperation, CMDI
     CMDCommandGroup, CMDArgGroup, CMDObjectArgBase, CMDArrayArgBase, CMDRequestJson, \
     CMDResponseJson, CMDObjectSchemaBase, CMDArraySchemaBase, CMDSchema, CMDHttpRequestJsonBody, \
     CMDJsonInstanceUpdateAction, CMDHttpResponseJsonBody, CMDObjectSchemaDiscriminator, CMDInstanceCreateOperation, \
-    CMDJsonInstanceCreateAction, CMDSchemaBase, CMDArraySchema, CMDObjectSchema, CMDInstanceDeleteOperation
+    CMDJsonInstanceCreateAction, CMDSchemaBase, CMDArraySchema, CMDObjectSchema, CMDInstanceDeleteOperation, \
+    TrustedModelLoader
 from swagger.utils.tools import swagger_resource_path_to_resource_id
+from utils.config import Config
 
 
 class _SchemaIdxEnum:
@@ -31,6 +33,33 @@ class CfgReader:
 
     def link(self):
         self.cfg.link()
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Build the lookup index of commands. The lookup indexes of arguments and schemas in a command are built at
+        the first lookup of that command.
+        """
+        self._command_index = {tuple(cmd_names): command for cmd_names, command in self.iter_commands()}
+        self._arg_var_indexes = {}
+        self._schema_indexes = {}
+
+    def _index_command(self, cmd_names, command):
+        self._command_index[tuple(cmd_names)] = command
+
+    def _unindex_command(self, cmd_names):
+        command = self._command_index.pop(tuple(cmd_names), None)
+        if command is not None:
+            self._arg_var_indexes.pop(id(command), None)
+            self._schema_indexes.pop(id(command), None)
+
+    @staticmethod
+    def load_cfg(data):
+        """Load the configuration from the json data written by aaz-dev. The schematics conversion is skipped unless
+        `Config.TRUSTED_CFG_LOAD` is disabled.
+        """
+        if Config.TRUSTED_CFG_LOAD:
+            return TrustedModelLoader.load(CMDConfiguration, data)
+        return CMDConfiguration(data)
 
     @property
     def resources(self):
@@ -166,14 +195,19 @@ class CfgReader:
             return None
         cmd_names = [*cmd_names]
 
+        name = cmd_names[-1]
+        command = self._command_index.get(tuple(cmd_names), None)
+        if command is not None and command.name == name:
+            return command
+
         command_group, tail_names, _, _ = self.find_command_group(*cmd_names[:-1])
         if command_group is None or tail_names:
             # group is not match cmd_names[:-1]
             return None
-        name = cmd_names[-1]
         if command_group.commands:
             for command in command_group.commands:
                 if command.name == name:
+                    self._index_command(cmd_names, command)
                     return command
         return None
 
@@ -276,7 +310,8 @@ class CfgReader:
         command = self.find_command(*cmd_names)
         if not command:
             return None, None
-        return self.find_arg_in_command_by_var(command, arg_var=arg_var)
+        _, arg, arg_idx = self._find_indexed_arg_in_command_with_parent_by_var(command, arg_var=arg_var)
+        return arg, arg_idx
 
     def find_arg_with_parent_by_var(self, *cmd_names, arg_var):
         """
@@ -293,7 +328,38 @@ class CfgReader:
         command = self.find_command(*cmd_names)
         if not command:
             return None, None, None
-        return self.find_arg_in_command_with_parent_by_var(command, arg_var=arg_var)
+        return self._find_indexed_arg_in_command_with_parent_by_var(command, arg_var=arg_var)
+
+    def _find_indexed_arg_in_command_with_parent_by_var(self, command, arg_var):
+        """The same as `find_arg_in_command_with_parent_by_var`, but look up in the arg_var index of the command."""
+        assert isinstance(arg_var, str), f"invalid arg_var type: {type(arg_var)}"
+        indexed_command, arg_index, flatten_index = self._arg_var_indexes.get(id(command), (None, None, None))
+        if indexed_command is not command:
+            arg_index, flatten_index = self._build_arg_var_index(command)
+            self._arg_var_indexes[id(command)] = (command, arg_index, flatten_index)
+
+        # the argument or the flattened sub argument which comes first in traversal order is matched
+        match = arg_index.get(arg_var, None)
+        flatten_match = flatten_index.get(arg_var, None)
+        if flatten_match is not None and (match is None or flatten_match[0] < match[0]):
+            return flatten_match[1], None, None
+        if match is not None:
+            _, parent, arg, arg_idx = match
+            return parent, arg, arg_idx
+        return None, None, None
+
+    @classmethod
+    def _build_arg_var_index(cls, command):
+        arg_index = {}
+        flatten_index = {}
+        for order, (parent, arg, arg_idx, arg_var) in enumerate(cls.iter_args_in_command(command)):
+            if arg_var not in arg_index:
+                arg_index[arg_var] = (order, parent, arg, arg_idx)
+            # arg_var of flattened argument is the prefix of its sub arguments' arg_var
+            for idx, c in enumerate(arg_var):
+                if c == '.' and arg_var[:idx] not in flatten_index:
+                    flatten_index[arg_var[:idx]] = (order, parent)
+        return arg_index, flatten_index
 
     @classmethod
     def find_arg_in_command_by_var(cls, command, arg_var):
@@ -384,27 +450,10 @@ class CfgReader:
 
     @classmethod
     def _find_arg_cls_definition(cls, command, cls_name):
-
         assert isinstance(cls_name, str) and not cls_name.startswith('@')
-
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            if getattr(_arg, 'cls', None) == cls_name:
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), True
-            return None, False
-
-        for arg_group in command.arg_groups:
-            matches = [match for match in cls._iter_args_in_group(
-                arg_group, arg_filter=arg_filter
-            )]
-            if not matches:
-                continue
-            assert len(matches) == 1
-
-            parent, arg, arg_idx, arg_var = matches[0]
-            if arg:
-                arg_idx = cls.arg_idx_to_str(arg_idx)
-            return parent, arg, arg_idx, arg_var
+        _, cls_register_map = cls._get_arg_cls_reference_index(command)
+        if cls_name in cls_register_map and cls_register_map[cls_name]['implement'] is not None:
+            return cls_register_map[cls_name]['implement']
         return None, None, None, None
 
     def iter_arg_cls_definition(self, *cmd_names, cls_name_prefix=None):
@@ -424,17 +473,9 @@ class CfgReader:
                 # `<cls>_create`, `<cls>_update` kind cls_name only
                 cls_name_prefix += '_'
 
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            _cls = getattr(_arg, 'cls', None)
-            if _cls is not None and (cls_name_prefix is None or _cls.startswith(cls_name_prefix)):
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), False
-            return None, False
-
-        for arg_group in command.arg_groups:
-            for parent, arg, arg_idx, arg_var in cls._iter_args_in_group(arg_group, arg_filter=arg_filter):
-                if arg:
-                    arg_idx = cls.arg_idx_to_str(arg_idx)
+        definitions, _ = cls._get_arg_cls_reference_index(command)
+        for parent, arg, arg_idx, arg_var in definitions:
+            if cls_name_prefix is None or arg.cls.startswith(cls_name_prefix):
                 yield parent, arg, arg_idx, arg_var
 
     def iter_arg_cls_reference(self, *cmd_names, cls_name):
@@ -448,30 +489,45 @@ class CfgReader:
     @classmethod
     def _iter_arg_cls_reference(cls, command, cls_name):
         assert isinstance(cls_name, str) and not cls_name.startswith('@')
+        _, cls_register_map = cls._get_arg_cls_reference_index(command)
+        if cls_name in cls_register_map:
+            for match in cls_register_map[cls_name]['refers']:
+                yield match
 
-        cls_type_name = f"@{cls_name}"
-
-        def arg_filter(_parent, _arg, _arg_idx, _arg_var):
-            if _arg.type == cls_type_name:
-                # find match
-                return (_parent, _arg, _arg_idx, _arg_var), False
-            return None, False
-
-        for arg_group in command.arg_groups:
-            for parent, arg, arg_idx, arg_var in cls._iter_args_in_group(
-                    arg_group, arg_filter=arg_filter):
-                if arg:
-                    arg_idx = cls.arg_idx_to_str(arg_idx)
-                yield parent, arg, arg_idx, arg_var
+    @classmethod
+    def _get_arg_cls_reference_index(cls, command):
+        """Return the class definitions in traversal order and the map from class name to its definition and
+        references. The index is cached in command until it's linked or reformatted again.
+        """
+        if command.arg_cls_reference_index is None:
+            definitions = []
+            cls_register_map = {}
+            if command.arg_groups:
+                for match in cls.iter_args_in_command(command):
+                    _, arg, _, _ = match
+                    if getattr(arg, 'cls', None):
+                        definitions.append(match)
+                        if arg.cls not in cls_register_map:
+                            cls_register_map[arg.cls] = {"implement": None, "refers": []}
+                        if cls_register_map[arg.cls]['implement'] is None:
+                            cls_register_map[arg.cls]['implement'] = match
+                    if arg.type.startswith('@'):
+                        cls_name = arg.type[1:]
+                        if cls_name not in cls_register_map:
+                            cls_register_map[cls_name] = {"implement": None, "refers": []}
+                        cls_register_map[cls_name]['refers'].append(match)
+            command.arg_cls_reference_index = (definitions, cls_register_map)
+        return command.arg_cls_reference_index
 
-    def iter_args_in_command(self, command):
+    @classmethod
+    def iter_args_in_command(cls, command):
         def arg_filter(_parent, _arg, _arg_idx, _arg_var):
             return (_parent, _arg, _arg_idx, _arg_var), False
 
         for arg_group in command.arg_groups:
-            for parent, arg, arg_idx, arg_var in self._iter_args_in_group(arg_group, arg_filter=arg_filter):
+            for parent, arg, arg_idx, arg_var in cls._iter_args_in_group(arg_group, arg_filter=arg_filter):
                 if arg:
-                    arg_idx = self.arg_idx_to_str(arg_idx)
+                    arg_idx = cls.arg_idx_to_str(arg_idx)
                 yield parent, arg, arg_idx, arg_var
 
     # TODO: build arg_idx in command link call
@@ -560,7 +616,18 @@ class CfgReader:
         command = self.find_command(*cmd_names)
         if not command:
             return None
-        return self.find_schema_in_command(command, idx)
+        assert isinstance(idx, list), f"invalid schema_idx type: {type(idx)}"
+        indexed_command, schema_index = self._schema_indexes.get(id(command), (None, None))
+        if indexed_command is not command:
+            schema_index = {}
+            self._schema_indexes[id(command)] = (command, schema_index)
+        key = tuple(idx)
+        schema = schema_index.get(key, None)
+        if schema is None:
+            schema = self.find_schema_in_command(command, idx)
+            if schema is not None:
+                schema_index[key] = schema
+        return schema
 
     @classmethod
     def find_schema_in_command(cls, command, idx):
@@ -771,8 +838,22 @@ class CfgReader:
 
     @classmethod
     def iter_schema_cls_reference(cls, command, cls_name):
-        for match in cls.iter_schema_cls_reference_in_operations(command.operations, cls_name):
-            yield match
+        assert isinstance(cls_name, str) and not cls_name.startswith('@')
+        if command.schema_cls_reference_index is None:
+            def schema_filter(_parent, _schema, _schema_idx):
+                if _schema.type.startswith('@'):
+                    # find match
+                    return (_parent, _schema, _schema_idx), False
+                return None, False
+
+            schema_cls_reference_index = {}
+            if command.operations:
+                for parent, schema, schema_idx in cls._iter_schema_in_operations(command.operations, schema_filter):
+                    schema_cls_reference_index.setdefault(schema.type[1:], []).append((parent, schema, schema_idx))
+            command.schema_cls_reference_index = schema_cls_reference_index
+
+        for parent, schema, schema_idx in command.schema_cls_reference_index.get(cls_name, []):
+            yield parent, schema, [*schema_idx]
 
     @classmethod
     def iter_schema_cls_reference_in_operations(cls, operations, cls_name):
@@ -786,6 +867,11 @@ class CfgReader:
                 return (_parent, _schema, _schema_idx), False
             return None, False
 
+        for match in cls._iter_schema_in_operations(operations, schema_filter):
+            yield match
+
+    @classmethod
+    def _iter_schema_in_operations(cls, operations, schema_filter):
         for op in operations:
             if isinstance(op, CMDHttpOperation):
                 if op.http.request:
@@ -1,24 +1,85 @@
+import logging
+
+from command.model.configuration import CMDHttpOperation, CMDHttpResponseJsonBody, CMDArrayOutput, \
+    CMDInstanceCreateOperation, CMDInstanceUpdateOperation, CMDInstanceDeleteOperation
+from utils import exceptions
 from .cfg_reader import CfgReader
 
+logger = logging.getLogger('backend')
+
 
 class CfgValidator:
 
+    # the variant of the instance of command, it's always defined in the generated code
+    INSTANCE_VARIANT = "$Instance"
+
     def __init__(self, cfg_reader):
         assert isinstance(cfg_reader, CfgReader)
         self.cfg_reader = cfg_reader
 
-    def verify(self):
-        # TODO:
-        return True
-
-    def _verify_command(self):
-        pass
+    def verify(self, strict=False):
+        """Verify the integrity of the commands in configuration, beyond the class links checked by `CfgReader.link`.
+        Raise VerificationError with the details of every invalid command when `strict`, otherwise the errors are
+        logged as warnings, so that the configurations exported before are not rejected.
+        """
+        details = {}
+        command_names = set()
+        for cmd_names, command in self.cfg_reader.iter_commands():
+            key = ' '.join(cmd_names)
+            errors = []
+            if key in command_names:
+                errors.append("Command duplicated in configuration.")
+            command_names.add(key)
+            errors.extend(self._verify_command(command))
+            errors.extend(self._verify_command_outputs(command))
+            if errors:
+                details[key] = errors
+        if details:
+            if strict:
+                raise exceptions.VerificationError(message="Invalid command model configuration", details=details)
+            for key, errors in details.items():
+                logger.warning(f"Invalid command model configuration: '{key}': {errors}")
+        return not details
 
-    def _verify_command_arguments(self):
-        pass
+    def _verify_command(self, command):
+        errors = []
+        if not command.version:
+            errors.append("Miss version.")
+        if not command.resources:
+            errors.append("Miss resources.")
+        cfg_resources = {(resource.id, resource.version) for resource in self.cfg_reader.resources}
+        for resource in command.resources or []:
+            if (resource.id, resource.version) not in cfg_resources:
+                errors.append(f"Resource '{resource.id}' '{resource.version}' not in configuration resources.")
+        return errors
 
-    def _verify_command_operations(self):
-        pass
+    def _verify_command_outputs(self, command):
+        # the variants defined by the responses of operations, the instance of command and the subresource selector
+        variants = {self.INSTANCE_VARIANT}
+        for operation in command.operations or []:
+            if isinstance(operation, CMDInstanceCreateOperation):
+                variants.add(operation.instance_create.ref)
+            elif isinstance(operation, CMDInstanceUpdateOperation):
+                variants.add(operation.instance_update.ref)
+            elif isinstance(operation, CMDInstanceDeleteOperation):
+                variants.add(operation.instance_delete.ref)
+            if not isinstance(operation, CMDHttpOperation):
+                continue
+            for response in operation.http.responses or []:
+                if isinstance(response.body, CMDHttpResponseJsonBody) and response.body.json.var:
+                    variants.add(response.body.json.var)
+                if response.header and response.header.items:
+                    variants.update(item.var for item in response.header.items if item.var)
+        if command.subresource_selector:
+            variants.add(command.subresource_selector.var)
+            variants.add(command.subresource_selector.ref)
 
-    def _verify_command_outputs(self):
-        pass
+        errors = []
+        for output in command.outputs or []:
+            refs = [output.ref]
+            if isinstance(output, CMDArrayOutput):
+                refs.append(output.next_link)
+            for ref in refs:
+                if ref and ref.split('.')[0].split('[')[0] not in variants:
+                    errors.append(f"Output refers to undefined variant '{ref}'.")
+        return errors
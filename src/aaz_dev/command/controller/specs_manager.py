@@ -1,11 +1,18 @@
+import atexit
 import json
+import logging
 import os
 import re
 import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from command.model.configuration import CMDConfiguration, CMDHelp, CMDCommandExample, XMLSerializer
-from utils.base64 import b64encode_str
+from command.model.configuration import CMDConfiguration, CMDHelp, CMDCommandExample, XMLSerializer, \
+    TrustedModelLoader
+from utils.base64 import b64encode_str, b64decode_str
 from utils.config import Config
+from utils.files import get_file_version
 from command.model.specs import CMDSpecsCommandTree, CMDSpecsCommandGroup, CMDSpecsCommand, CMDSpecsCommandVersion, CMDSpecsResource
 from command.templates import get_templates
 from utils import exceptions
@@ -13,12 +20,41 @@ from .cfg_reader import CfgReader
 from .cfg_validator import CfgValidator
 from collections import deque
 
+logger = logging.getLogger('backend')
+
 
 class AAZSpecsManager:
     COMMAND_TREE_ROOT_NAME = "aaz"
 
     REFERENCE_LINE = re.compile(r"^Reference\s*\[(.*) (.*)]\((.*)\)\s*$")
 
+    # xml files are only used for review, when Config.DEFER_XML_SIDECAR is enabled they are rendered by a background
+    # worker from the saved json files.
+    _xml_sidecar_executor = None
+    _xml_sidecar_pending = set()
+    _xml_sidecar_lock = threading.Lock()
+    _xml_sidecar_atexit_registered = False
+
+    # the index of resource versions, it's set by `set_resource_version_index`
+    _resource_version_index = None
+
+    # the (command tree version, manager) shared by read only requests
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Return the manager shared by read only requests, so the command tree is loaded once for every change of
+        the tree file. The shared manager should never be modified.
+        """
+        version = cls.get_command_tree_version()
+        if version is None:
+            return cls()
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared[0] != version:
+                cls._shared = (version, cls())
+            return cls._shared[1]
+
     def __init__(self):
         if not Config.AAZ_PATH or not os.path.exists(Config.AAZ_PATH) or not os.path.isdir(Config.AAZ_PATH):
             raise ValueError(f"aaz repo path is invalid: '{Config.AAZ_PATH}'")
@@ -30,6 +66,8 @@ class AAZSpecsManager:
         self._modified_command_groups = set()
         self._modified_commands = set()
         self._modified_resource_cfgs = {}
+        # the readers of resource cfgs loaded in advance by `prefetch_resource_cfg_readers`
+        self._prefetched_resource_cfg_readers = {}
 
         tree_path = self.get_tree_file_path()
         if not os.path.exists(tree_path):
@@ -44,9 +82,20 @@ class AAZSpecsManager:
 
         with open(tree_path, 'r') as f:
             data = json.load(f)
-            self.tree = CMDSpecsCommandTree(data)
+            if Config.TRUSTED_CFG_LOAD:
+                self.tree = TrustedModelLoader.load(CMDSpecsCommandTree, data)
+            else:
+                self.tree = CMDSpecsCommandTree(data)
 
     # Commands folder
+    @staticmethod
+    def get_command_tree_version():
+        """The version of the command tree file in aaz, it's got without loading the command tree."""
+        if not Config.AAZ_PATH:
+            return None
+        version = get_file_version(os.path.join(Config.AAZ_PATH, "Commands", "tree.json"))
+        return (Config.AAZ_PATH, version) if version else None
+
     def get_tree_file_path(self):
         return os.path.join(self.commands_folder, "tree.json")
 
@@ -91,6 +140,15 @@ class AAZSpecsManager:
         path = self.get_resource_cfg_folder(plane, resource_id)
         if not os.path.exists(path) or not os.path.isdir(path):
             return None
+        index = self._resource_version_index
+        if index is not None and index['folder'] == self.folder:
+            entry = index['resources'].get(plane, {}).get(resource_id, None)
+            if entry is not None and entry['mtime'] == os.stat(path).st_mtime_ns:
+                return list(entry['versions'])
+        return self._list_resource_versions(path)
+
+    @staticmethod
+    def _list_resource_versions(path):
         versions = set()
         for file_name in os.listdir(path):
             if file_name.endswith('.xml'):
@@ -101,6 +159,28 @@ class AAZSpecsManager:
                 versions.add(file_name[:-3])
         return sorted(versions, reverse=True)
 
+    @classmethod
+    def set_resource_version_index(cls, index):
+        """Set the index built by `build_resource_version_index` to get the versions of resources. The index entry of
+        a resource is used only when the modification time of its folder is not changed.
+        """
+        cls._resource_version_index = index
+
+    def build_resource_version_index(self):
+        resources = {}
+        for root, _, file_names in os.walk(self.resources_folder):
+            if not file_names:
+                continue
+            try:
+                plane, resource_id, _ = self.parse_resource_cfg_file_path(os.path.join(root, file_names[0]))
+            except ValueError:
+                continue
+            resources.setdefault(plane, {})[resource_id] = {
+                "mtime": os.stat(root).st_mtime_ns,
+                "versions": self._list_resource_versions(root),
+            }
+        return {"folder": self.folder, "resources": resources}
+
     # Command Tree
     def find_command_group(self, *cg_names):
         node = self.tree.root
@@ -148,6 +228,8 @@ class AAZSpecsManager:
             # cfg already modified
             cfg = self._modified_resource_cfgs[key]
             return CfgReader(cfg) if cfg else None
+        if key in self._prefetched_resource_cfg_readers:
+            return self._prefetched_resource_cfg_readers[key]
 
         json_path, xml_path = self.get_resource_cfg_file_paths(plane, resource_id, version)
         if not os.path.exists(json_path) and not os.path.exists(xml_path):
@@ -177,9 +259,12 @@ class AAZSpecsManager:
             data = self.render_resource_cfg_to_json(cfg)
             with open(json_path, 'w') as f:
                 f.write(data)
-            data = self.render_resource_cfg_to_xml(cfg)
-            with open(xml_path, 'w') as f:
-                f.write(data)
+            if Config.DEFER_XML_SIDECAR:
+                self.defer_sync_xml_sidecar(json_path)
+            else:
+                data = self.render_resource_cfg_to_xml(cfg)
+                with open(xml_path, 'w') as f:
+                    f.write(data)
 
         if not os.path.isfile(json_path):
             raise ValueError(f"Invalid file path: {json_path}")
@@ -187,10 +272,36 @@ class AAZSpecsManager:
         with open(json_path, 'r') as f:
             #print(json_path)
             data = json.load(f)
-        cfg = CMDConfiguration(data)
+        cfg = CfgReader.load_cfg(data)
 
         return CfgReader(cfg)
 
+    def prefetch_resource_cfg_readers(self, keys, max_workers=None):
+        """Load the resource cfgs of (plane, resource_id, version) keys in parallel. The readers are returned by
+        `load_resource_cfg_reader` until `clear_prefetched_resource_cfg_readers` is called, so they should not be
+        modified.
+        """
+        keys = [key for key in dict.fromkeys(keys)
+                if key not in self._modified_resource_cfgs and key not in self._prefetched_resource_cfg_readers]
+        if not keys:
+            return
+
+        def _load(key):
+            try:
+                return key, self.load_resource_cfg_reader(*key)
+            except Exception as err:
+                # raise the error when it's loaded by `load_resource_cfg_reader` again
+                logger.debug(f"Failed to prefetch resource cfg: {key}: {err}")
+                return key, err
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(keys))) as executor:
+            for key, reader in executor.map(_load, keys):
+                if not isinstance(reader, Exception):
+                    self._prefetched_resource_cfg_readers[key] = reader
+
+    def clear_prefetched_resource_cfg_readers(self):
+        self._prefetched_resource_cfg_readers = {}
+
     def load_resource_cfg_reader_by_command_with_version(self, cmd, version):
         if not isinstance(version, CMDSpecsCommandVersion):
             assert isinstance(version, str)
@@ -362,11 +473,15 @@ class AAZSpecsManager:
         for cmd_names, cmd in cfg_reader.iter_commands():
             self.delete_command_version(*cmd_names, version=cmd.version)
 
-    def update_resource_cfg(self, cfg):
-        cfg_reader = CfgReader(cfg=cfg)
+    def update_resource_cfg(self, cfg, cfg_reader=None):
+        """Update the resource cfg. `cfg_reader` is the reader of cfg which is linked already, so that the cfg will
+        not be linked again.
+        """
+        if cfg_reader is None:
+            cfg_reader = CfgReader(cfg=cfg)
+        assert cfg_reader.cfg is cfg
 
         cfg_verifier = CfgValidator(cfg_reader)
-        # TODO: implement verify configuration
         cfg_verifier.verify()
 
         # remove previous cfg
@@ -444,6 +559,161 @@ class AAZSpecsManager:
         if details:
             raise exceptions.VerificationError(message="Invalid Command Tree", details=details)
 
+    # verify resource cfg files
+    def iter_resource_cfg_ref_paths(self, plane=None):
+        folder = self.get_resource_plane_folder(plane) if plane else self.resources_folder
+        for root, _, file_names in os.walk(folder):
+            for file_name in file_names:
+                if file_name.endswith('.md'):
+                    yield os.path.join(root, file_name)
+
+    def parse_resource_cfg_file_path(self, file_path):
+        """Return the plane, resource id and version of a json, xml or reference file in Resources folder."""
+        parts = os.path.relpath(file_path, self.resources_folder).split(os.sep)
+        if len(parts) < 3 or parts[0] == os.pardir:
+            raise ValueError(f"Invalid resource cfg file path: {file_path}")
+        plane = parts[0]
+        version, _ = os.path.splitext(parts[-1])
+        # long names are split into folders ended with '+', which is not used in urlsafe base64
+        name = ''.join(part[:-1] if part.endswith('+') else part for part in parts[1:-1])
+        try:
+            resource_id = b64decode_str(name)
+        except ValueError:
+            raise ValueError(f"Invalid resource cfg file path: {file_path}")
+        return plane, resource_id, version
+
+    def get_changed_resource_cfg_paths(self, git_ref):
+        """Return the json and reference files in Resources folder which are changed since the git ref, including
+        the uncommitted and untracked ones. The removed files are not returned.
+        """
+        commands = [
+            ["git", "diff", "--name-only", "--relative", git_ref, "--", "Resources"],
+            ["git", "ls-files", "--others", "--exclude-standard", "--", "Resources"],
+        ]
+        file_paths = set()
+        for command in commands:
+            try:
+                output = subprocess.run(
+                    command, cwd=self.folder, capture_output=True, text=True, check=True).stdout
+            except (OSError, subprocess.CalledProcessError) as err:
+                stderr = getattr(err, 'stderr', None)
+                raise ValueError(f"Failed to list changed files since '{git_ref}': {(stderr or str(err)).strip()}")
+            for line in output.splitlines():
+                file_path = os.path.join(self.folder, *line.strip().split('/'))
+                if file_path.endswith(('.json', '.md')) and os.path.isfile(file_path):
+                    file_paths.add(file_path)
+        return sorted(file_paths)
+
+    def verify_resource_cfg_file(self, file_path):
+        """Verify the link integrity of a json or reference file in Resources folder. Return the error messages."""
+        try:
+            plane, resource_id, version = self.parse_resource_cfg_file_path(file_path)
+            if file_path.endswith('.md'):
+                return self._verify_resource_cfg_ref_file(file_path, plane, resource_id, version)
+            return self._verify_resource_cfg_json_file(file_path, plane, resource_id, version)
+        except exceptions.VerificationError as err:
+            return [f"{err.message}: {json.dumps(err.payload['details'])}"]
+        except Exception as err:
+            return [f"{err.__class__.__name__}: {err}"]
+
+    def _verify_resource_cfg_json_file(self, file_path, plane, resource_id, version):
+        with open(file_path, 'r') as f:
+            cfg = CfgReader.load_cfg(json.load(f))
+        cfg_reader = CfgReader(cfg)
+        CfgValidator(cfg_reader).verify(strict=True)
+
+        errors = []
+        if cfg.plane != plane:
+            errors.append(f"Plane '{cfg.plane}' doesn't match the folder '{plane}'.")
+        main_resource = cfg.resources[0]
+        if (main_resource.id, main_resource.version) != (resource_id, version):
+            errors.append(f"The first resource '{main_resource.id}' '{main_resource.version}' doesn't match the "
+                          f"file path.")
+
+        # the other resources should refer to the main resource
+        for resource in cfg.resources[1:]:
+            ref_path = self.get_resource_cfg_ref_file_path(plane, resource.id, resource.version)
+            if self._read_resource_cfg_ref(ref_path) != (main_resource.id, main_resource.version):
+                errors.append(f"Miss reference file of resource '{resource.id}' '{resource.version}': {ref_path}")
+
+        # the commands in command tree should use this cfg
+        for cmd_names, cfg_cmd in cfg_reader.iter_commands():
+            key = ' '.join(cmd_names)
+            command = self.find_command(*cmd_names)
+            if not command:
+                errors.append(f"Command '{key}' not in command tree.")
+                continue
+            cmd_version = None
+            for v in (command.versions or []):
+                if v.name == cfg_cmd.version:
+                    cmd_version = v
+                    break
+            if not cmd_version:
+                errors.append(f"Command '{key}' in version '{cfg_cmd.version}' not in command tree.")
+                continue
+            cmd_resources = [(plane, r.id, r.version, r.subresource) for r in cfg_cmd.resources]
+            tree_resources = [(r.plane, r.id, r.version, r.subresource) for r in cmd_version.resources or []]
+            if cmd_resources != tree_resources:
+                errors.append(f"Resources of command '{key}' in version '{cfg_cmd.version}' don't match the "
+                              f"command tree.")
+        return errors
+
+    def _verify_resource_cfg_ref_file(self, file_path, plane, resource_id, version):
+        ref = self._read_resource_cfg_ref(file_path)
+        if not ref:
+            return [f"Invalid reference file: {file_path}"]
+        json_path, _ = self.get_resource_cfg_file_paths(plane, *ref)
+        if not os.path.isfile(json_path):
+            return [f"Referenced resource '{ref[0]}' '{ref[1]}' not exist: {json_path}"]
+        with open(json_path, 'r') as f:
+            cfg = CfgReader.load_cfg(json.load(f))
+        if (resource_id, version) not in {(r.id, r.version) for r in cfg.resources}:
+            return [f"Resource not in the referenced resource '{ref[0]}' '{ref[1]}'."]
+        return []
+
+    def _read_resource_cfg_ref(self, ref_path):
+        if not os.path.isfile(ref_path):
+            return None
+        with open(ref_path, 'r') as f:
+            for line in f.readlines():
+                match = self.REFERENCE_LINE.fullmatch(line.strip())
+                if match:
+                    return match[1], match[2]
+        return None
+
+    def verify_command_tree_resources(self):
+        """Verify every command version in command tree has its resource cfg file. Return the error messages of
+        every invalid command.
+        """
+        details = {}
+        for cmd in self.iter_commands():
+            for version in cmd.versions or []:
+                if not version.resources:
+                    details.setdefault(' '.join(cmd.names), []).append(f"Version '{version.name}' miss resources.")
+                    continue
+                resource = version.resources[0]
+                json_path, xml_path = self.get_resource_cfg_file_paths(resource.plane, resource.id, resource.version)
+                ref_path = self.get_resource_cfg_ref_file_path(resource.plane, resource.id, resource.version)
+                if not any(os.path.isfile(path) for path in (json_path, xml_path, ref_path)):
+                    details.setdefault(' '.join(cmd.names), []).append(
+                        f"Resource cfg of version '{version.name}' not exist: {json_path}")
+        return details
+
+    def iter_verify_resource_cfg_files(self, file_paths, max_workers=None):
+        """Verify the files in worker processes, yield the file path and error messages in order as soon as they are
+        verified.
+        """
+        if max_workers == 1:
+            for file_path in file_paths:
+                yield file_path, self.verify_resource_cfg_file(file_path)
+            return
+
+        with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_resource_cfg_verifier, initargs=(self.folder,)) as executor:
+            for file_path, errors in zip(file_paths, executor.map(
+                    _verify_resource_cfg_file, file_paths, chunksize=16)):
+                yield file_path, errors
+
     def save(self):
         self.verify_command_tree()
 
@@ -486,13 +756,18 @@ class AAZSpecsManager:
                     update_files[file_path] = self.render_command_group_readme(cg)
 
         # cfg files
+        defer_xml_sidecar = Config.DEFER_XML_SIDECAR
+        xml_sidecar_json_files = []
         for (plane, resource_id, version), cfg in self._modified_resource_cfgs.items():
             json_file_path, xml_file_path = self.get_resource_cfg_file_paths(plane, resource_id, version)
             ref_file_path = self.get_resource_cfg_ref_file_path(plane, resource_id, version)
             if not cfg:
                 remove_files.append(json_file_path)
-                remove_files.append(xml_file_path)
                 remove_files.append(ref_file_path)
+                if defer_xml_sidecar:
+                    xml_sidecar_json_files.append(json_file_path)
+                else:
+                    remove_files.append(xml_file_path)
             else:
                 main_resource = cfg.resources[0]
                 if main_resource.id != resource_id or main_resource.version != version:
@@ -500,7 +775,10 @@ class AAZSpecsManager:
                         plane=cfg.plane, ref_resource_id=main_resource.id, ref_resource_version=main_resource.version)
                 else:
                     update_files[json_file_path] = self.render_resource_cfg_to_json(cfg)
-                    update_files[xml_file_path] = self.render_resource_cfg_to_xml(cfg)
+                    if defer_xml_sidecar:
+                        xml_sidecar_json_files.append(json_file_path)
+                    else:
+                        update_files[xml_file_path] = self.render_resource_cfg_to_xml(cfg)
 
         for remove_file in remove_files:
             if os.path.exists(remove_file):
@@ -514,9 +792,14 @@ class AAZSpecsManager:
             with open(file_path, 'w') as f:
                 f.write(data)
 
+        # xml files should be rendered after json files persisted
+        for json_file_path in xml_sidecar_json_files:
+            self.defer_sync_xml_sidecar(json_file_path)
+
         self._modified_command_groups = set()
         self._modified_commands = set()
         self._modified_resource_cfgs = {}
+        self._prefetched_resource_cfg_readers = {}
 
     @staticmethod
     def render_command_readme(command):
@@ -554,3 +837,92 @@ class AAZSpecsManager:
     @staticmethod
     def render_resource_cfg_to_xml(cfg):
         return XMLSerializer.to_xml(cfg)
+
+    # xml sidecar files
+    def iter_resource_cfg_json_paths(self, plane=None):
+        folder = self.get_resource_plane_folder(plane) if plane else self.resources_folder
+        for root, _, file_names in os.walk(folder):
+            for file_name in file_names:
+                if file_name.endswith('.json'):
+                    yield os.path.join(root, file_name)
+
+    @staticmethod
+    def get_xml_sidecar_path(json_path):
+        assert json_path.endswith('.json')
+        return f"{json_path[:-5]}.xml"
+
+    @classmethod
+    def is_xml_sidecar_stale(cls, json_path):
+        xml_path = cls.get_xml_sidecar_path(json_path)
+        if not os.path.exists(json_path):
+            return os.path.exists(xml_path)
+        if not os.path.exists(xml_path):
+            return True
+        return os.path.getmtime(xml_path) < os.path.getmtime(json_path)
+
+    @classmethod
+    def sync_xml_sidecar(cls, json_path):
+        """Render the xml file from the json file of a resource cfg, or remove the xml file when the json file is
+        removed.
+        """
+        xml_path = cls.get_xml_sidecar_path(json_path)
+        if not os.path.exists(json_path):
+            if os.path.exists(xml_path):
+                os.remove(xml_path)
+            return
+        with open(json_path, 'r') as f:
+            cfg = CfgReader.load_cfg(json.load(f))
+        data = cls.render_resource_cfg_to_xml(cfg)
+        with open(xml_path, 'w') as f:
+            f.write(data)
+
+    @classmethod
+    def defer_sync_xml_sidecar(cls, json_path):
+        """Sync the xml file in the background worker. The json file is read when the task runs, so the xml file
+        always follows the latest saved json file.
+        """
+        with cls._xml_sidecar_lock:
+            if json_path in cls._xml_sidecar_pending:
+                return
+            cls._xml_sidecar_pending.add(json_path)
+            if cls._xml_sidecar_executor is None:
+                cls._xml_sidecar_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aaz-xml-sidecar")
+                if not cls._xml_sidecar_atexit_registered:
+                    # the deferred xml files should be synced before the process exits
+                    atexit.register(cls.wait_xml_sidecars)
+                    cls._xml_sidecar_atexit_registered = True
+            cls._xml_sidecar_executor.submit(cls._run_deferred_xml_sidecar, json_path)
+
+    @classmethod
+    def _run_deferred_xml_sidecar(cls, json_path):
+        with cls._xml_sidecar_lock:
+            cls._xml_sidecar_pending.discard(json_path)
+        try:
+            cls.sync_xml_sidecar(json_path)
+        except Exception as err:
+            logger.error(f"Failed to render xml file for '{json_path}': {err}")
+
+    @classmethod
+    def wait_xml_sidecars(cls):
+        """Block until all the deferred xml files are synced. It's called when the process exits, the processes exited
+        by `os._exit` should call it before.
+        """
+        with cls._xml_sidecar_lock:
+            executor = cls._xml_sidecar_executor
+            cls._xml_sidecar_executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# the specs manager of the verifier process
+_resource_cfg_verifier = None
+
+
+def _init_resource_cfg_verifier(aaz_path):
+    global _resource_cfg_verifier
+    Config.AAZ_PATH = aaz_path
+    _resource_cfg_verifier = AAZSpecsManager()
+
+
+def _verify_resource_cfg_file(file_path):
+    return _resource_cfg_verifier.verify_resource_cfg_file(file_path)
@@ -0,0 +1,82 @@
+from command.model.configuration import ModelCloner
+
+from .workspace_cfg_editor import WorkspaceCfgEditor
+
+
+class WorkspaceArgIndex:
+    """The index of arguments in workspace commands, used to find similar arguments without loading cfg files.
+
+    Arguments are indexed by arg_var, and class argument definitions are indexed by the prefix of class name before
+    the first '_', such as `<cls>` for `<cls>_create` and `<cls>_update`. The entries are grouped by cfg, so that the
+    entries of a cfg can be replaced when the cfg is modified. The arguments are cloned from the cfg, so the index is
+    not changed by the later modifications of cfg until it's updated again.
+    """
+
+    def __init__(self):
+        self._groups = {}  # the first resource id of cfg -> (args_by_var, cls_definitions_by_prefix)
+        self._resource_groups = {}  # resource id -> the first resource id of cfg
+
+    def copy(self):
+        index = self.__class__()
+        index._groups = {**self._groups}
+        index._resource_groups = {**self._resource_groups}
+        return index
+
+    def update_cfg(self, cfg_editor):
+        assert isinstance(cfg_editor, WorkspaceCfgEditor)
+        self.remove_resources(*[resource.id for resource in cfg_editor.resources])
+        if cfg_editor.deleted:
+            return
+
+        args_by_var = {}
+        cls_definitions_by_prefix = {}
+        for cmd_names, command in cfg_editor.iter_commands():
+            cmd_names = tuple(cmd_names)
+            arg_vars = set()
+            for _, _, _, arg_var in cfg_editor.iter_args_in_command(command):
+                if arg_var in arg_vars:
+                    continue
+                arg_vars.add(arg_var)
+                arg, arg_idx = cfg_editor.find_arg_by_var(*cmd_names, arg_var=arg_var)
+                if arg is None:
+                    # arg_var of flattened argument
+                    continue
+                args_by_var.setdefault(arg_var, []).append((cmd_names, ModelCloner.clone(arg), arg_idx))
+
+            for _, cls_arg, cls_arg_idx, _ in cfg_editor.iter_arg_cls_definition(*cmd_names):
+                if '_' not in cls_arg.cls:
+                    continue
+                ref_arg_idxes = [
+                    ref_arg_idx for _, _, ref_arg_idx, _ in cfg_editor.iter_arg_cls_reference(
+                        *cmd_names, cls_name=cls_arg.cls)
+                ]
+                cls_name_prefix = cls_arg.cls.split('_')[0]
+                cls_definitions_by_prefix.setdefault(cls_name_prefix, []).append(
+                    (cmd_names, ModelCloner.clone(cls_arg), cls_arg_idx, ref_arg_idxes))
+
+        key = cfg_editor.resources[0].id
+        self._groups[key] = (args_by_var, cls_definitions_by_prefix)
+        for resource in cfg_editor.resources:
+            self._resource_groups[resource.id] = key
+
+    def remove_resources(self, *resource_ids):
+        for resource_id in resource_ids:
+            key = self._resource_groups.pop(resource_id, None)
+            if key is None:
+                continue
+            self._groups.pop(key, None)
+            for r_id in [r_id for r_id, k in self._resource_groups.items() if k == key]:
+                del self._resource_groups[r_id]
+
+    def has_resource(self, resource_id):
+        return resource_id in self._resource_groups
+
+    def iter_args_by_var(self, arg_var):
+        for args_by_var, _ in self._groups.values():
+            for cmd_names, arg, arg_idx in args_by_var.get(arg_var, []):
+                yield cmd_names, arg, arg_idx
+
+    def iter_arg_cls_definitions(self, cls_name_prefix):
+        for _, cls_definitions_by_prefix in self._groups.values():
+            for cmd_names, cls_arg, cls_arg_idx, ref_arg_idxes in cls_definitions_by_prefix.get(cls_name_prefix, []):
+                yield cmd_names, cls_arg, cls_arg_idx, ref_arg_idxes
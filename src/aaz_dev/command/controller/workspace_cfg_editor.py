@@ -41,7 +41,7 @@ class WorkspaceCfgEditor(CfgReader):
             path = cls.get_cfg_path(ws_folder, ref_resource_id)
             with open(path, 'r') as f:
                 data = json.load(f)
-        cfg = CMDConfiguration(data)
+        cfg = cls.load_cfg(data)
         for resource in cfg.resources:
             if resource.version != version:
                 raise ValueError(f"Resource version not match: {version} != {resource.version}")
@@ -133,6 +133,7 @@ class WorkspaceCfgEditor(CfgReader):
 
         idx = command_group.commands.index(command)
         command_group.commands.pop(idx)
+        self._unindex_command(cmd_names)
 
         return command
 
@@ -183,6 +184,7 @@ class WorkspaceCfgEditor(CfgReader):
             command_group.commands = []
 
         command_group.commands.append(command)
+        self._index_command(cmd_names, command)
 
     def merge(self, plus_cfg_editor):
         if not self._can_merge(plus_cfg_editor):
@@ -191,8 +193,9 @@ class WorkspaceCfgEditor(CfgReader):
         _, plus_command = [*plus_cfg_editor.iter_commands_by_operations('get')][0]
         plus_op_required_args, plus_op_optional_args = plus_cfg_editor._parse_command_http_op_url_args(plus_command)
 
-        main_editor = WorkspaceCfgEditor(self.cfg.__class__(self.cfg.to_primitive()))  # generate a copy of main cfg
-        main_commands = [command for _, command in main_editor.iter_commands_by_operations('get')]
+        # generate a copy of main cfg, only the commands to be merged are materialized
+        main_editor, main_commands = self._copy_on_write(
+            *[command for _, command in self.iter_commands_by_operations('get')])
         for main_command in main_commands:
             # merge args
             new_args = set()
@@ -214,7 +217,7 @@ class WorkspaceCfgEditor(CfgReader):
             main_op_required_args, _ = main_editor._parse_command_http_op_url_args(main_command)
             plus_operations = []
             for operation in plus_command.operations:
-                plus_operations.append(operation.__class__(operation.to_primitive()))
+                plus_operations.append(ModelCloner.clone(operation))
             op_required_args = {**plus_op_required_args, **main_op_required_args}
             common_required_args, main_command.conditions, main_command.operations = main_editor._merge_command_operations(
                 op_required_args,
@@ -228,7 +231,7 @@ class WorkspaceCfgEditor(CfgReader):
 
             for resource in plus_command.resources:
                 main_command.resources.append(
-                    resource.__class__(resource.to_primitive())
+                    ModelCloner.clone(resource)
                 )
 
             # relink main_command
@@ -236,12 +239,50 @@ class WorkspaceCfgEditor(CfgReader):
 
         for resource in plus_cfg_editor.resources:
             main_editor.cfg.resources.append(
-                resource.__class__(resource.to_primitive())
+                ModelCloner.clone(resource)
             )
 
-        main_editor.reformat()
+        # only reformat the materialized cfg and commands, the command groups and commands shared with current editor
+        # are not changed by merge and should not be updated in place.
+        main_editor.cfg.resources = sorted(main_editor.cfg.resources, key=lambda r: r.id)
+        for main_command in main_commands:
+            main_command.reformat()
+        main_editor._build_indexes()
         return main_editor
 
+    def _copy_on_write(self, *commands):
+        """Return a copy of the editor which shares the unchanged command groups, commands and resources with current
+        one. Only the cfg, the command groups on the paths to `commands` and the `commands` themselves are
+        materialized, so the returned editor should only update the materialized commands in place.
+        """
+        targets = {id(command): None for command in commands}
+        cfg = ModelCloner.shallow_clone(self.cfg)
+        for idx, group in enumerate(cfg.command_groups):
+            new_group = self._copy_on_write_command_group(group, targets)
+            if new_group is not None:
+                cfg.command_groups[idx] = new_group
+        return WorkspaceCfgEditor(cfg), [targets[id(command)] for command in commands]
+
+    @classmethod
+    def _copy_on_write_command_group(cls, group, targets):
+        new_group = None
+        if group.commands:
+            for idx, command in enumerate(group.commands):
+                if id(command) not in targets:
+                    continue
+                if new_group is None:
+                    new_group = ModelCloner.shallow_clone(group)
+                new_group.commands[idx] = targets[id(command)] = ModelCloner.clone(command)
+        if group.command_groups:
+            for idx, sub_group in enumerate(group.command_groups):
+                new_sub_group = cls._copy_on_write_command_group(sub_group, targets)
+                if new_sub_group is None:
+                    continue
+                if new_group is None:
+                    new_group = ModelCloner.shallow_clone(group)
+                new_group.command_groups[idx] = new_sub_group
+        return new_group
+
     def update_command_confirmation(self, *cmd_names, confirmation):
         if len(cmd_names) < 2:
             raise exceptions.InvalidAPIUsage(f"Invalid command name, it's empty")
@@ -491,6 +532,7 @@ class WorkspaceCfgEditor(CfgReader):
 
     def reformat(self):
         self.cfg.reformat()
+        self._build_indexes()
 
     def _parse_command_http_op_url_args(self, command):
         operation_required_args = {}
@@ -590,7 +632,7 @@ class WorkspaceCfgEditor(CfgReader):
     def _filter_args_in_arg_group(self, arg_group, arg_vars, copy=True):
         assert isinstance(arg_group, CMDArgGroup)
         if copy:
-            arg_group = arg_group.__class__(arg_group.to_primitive())
+            arg_group = ModelCloner.clone(arg_group)
         args = []
         for arg in arg_group.args:
             if arg.var in arg_vars:
@@ -611,7 +653,7 @@ class WorkspaceCfgEditor(CfgReader):
     def _filter_args_in_array_arg(self, array_arg, arg_vars, copy=True):
         assert isinstance(array_arg, CMDArrayArgBase)
         if copy:
-            array_arg = array_arg.__class__(array_arg.to_primitive())
+            array_arg = ModelCloner.clone(array_arg)
         item = self._filter_args_in_item(array_arg.item, arg_vars, copy=False)
         if item:
             array_arg.item = item
@@ -628,7 +670,7 @@ class WorkspaceCfgEditor(CfgReader):
     def _filter_args_in_object_arg(self, object_arg, arg_vars, copy=True):
         assert isinstance(object_arg, CMDObjectArgBase)
         if copy:
-            object_arg = object_arg.__class__(object_arg.to_primitive())
+            object_arg = ModelCloner.clone(object_arg)
         contains = False
         if object_arg.args:
             args = []
@@ -1032,7 +1074,7 @@ class WorkspaceCfgEditor(CfgReader):
                         continue
                     if 'name' in a.options and isinstance(a, CMDStringArgBase):
                         # remove auto add 'name', 'n' options
-                        a = a.__class__(raw_data=a.to_native())
+                        a = ModelCloner.clone(a)
                         a.options = sorted(a.options, key=lambda o: (len(o), o))[-1:]  # use the longest argument
                     ref_args.append(a)
 
@@ -1226,7 +1268,7 @@ class WorkspaceCfgEditor(CfgReader):
         _sub_command = CMDCommand()
         _sub_command.version = update_cmd.version
         assert len(update_cmd.resources) == 1
-        _resource = CMDResource(raw_data=update_cmd.resources[0].to_native())
+        _resource = ModelCloner.clone(update_cmd.resources[0])
         _resource.subresource = cls.idx_to_str(subresource_idx)
         _sub_command.resources = [_resource]
         _sub_command.subresource_selector = cls._build_subresource_selector(
@@ -1237,7 +1279,7 @@ class WorkspaceCfgEditor(CfgReader):
     def _build_subresource_list_or_show_command(cls, update_cmd, subresource_idx, ref_args, ref_options):
         _sub_command, get_op, _, update_json = cls._build_sub_command_base(update_cmd, subresource_idx)
 
-        _sub_command.operations = [get_op.__class__(raw_data=get_op.to_native())]
+        _sub_command.operations = [ModelCloner.clone(get_op)]
         _sub_command.generate_args(ref_args=ref_args, ref_options=ref_options)
         _sub_command.generate_outputs(ref_outputs=update_cmd.outputs)
         _sub_command.link()
@@ -1271,9 +1313,9 @@ class WorkspaceCfgEditor(CfgReader):
         _instance_op.instance_create.json.schema = _instance_op_schema
 
         _sub_command.operations = [
-            get_op.__class__(raw_data=get_op.to_native()),
+            ModelCloner.clone(get_op),
             _instance_op,
-            put_op.__class__(raw_data=put_op.to_native()),
+            ModelCloner.clone(put_op),
         ]
         _sub_command.generate_args(ref_args=ref_args, ref_options=ref_options)
         _sub_command.generate_outputs(ref_outputs=update_cmd.outputs)
@@ -1307,9 +1349,9 @@ class WorkspaceCfgEditor(CfgReader):
         _instance_op.instance_update.json.schema = _instance_op_schema
 
         _sub_command.operations = [
-            get_op.__class__(raw_data=get_op.to_native()),
+            ModelCloner.clone(get_op),
             _instance_op,
-            put_op.__class__(raw_data=put_op.to_native()),
+            ModelCloner.clone(put_op),
         ]
         _sub_command.generate_args(ref_args=ref_args, ref_options=ref_options)
         _sub_command.generate_outputs(ref_outputs=update_cmd.outputs)
@@ -1325,9 +1367,9 @@ class WorkspaceCfgEditor(CfgReader):
         _instance_op.instance_delete.ref = _sub_command.subresource_selector.var
         _instance_op.instance_delete.json = CMDRequestJson()
         _sub_command.operations = [
-            get_op.__class__(raw_data=get_op.to_native()),
+            ModelCloner.clone(get_op),
             _instance_op,
-            put_op.__class__(raw_data=put_op.to_native()),
+            ModelCloner.clone(put_op),
         ]
         _sub_command.confirmation = DEFAULT_CONFIRMATION_PROMPT
         _sub_command.generate_args(ref_args=ref_args, ref_options=ref_options)
@@ -1442,7 +1484,7 @@ class WorkspaceCfgEditor(CfgReader):
             assert isinstance(item, CMDObjectSchemaBase)
             for prop in item.props:
                 if prop.name in identifier_names:
-                    identifier = prop.__class__(raw_data=prop.to_native())
+                    identifier = ModelCloner.clone(prop)
                     identifier.name = '[].' + prop.name
                     identifier.required = True
                     identifier.read_only = False
@@ -1549,7 +1591,7 @@ class WorkspaceCfgEditor(CfgReader):
             assert schema.implement is not None
             schema = schema.get_unwrapped()
         else:
-            schema = schema.__class__(raw_data=schema.to_native())
+            schema = ModelCloner.clone(schema)
         assert not isinstance(schema, CMDClsSchemaBase)
 
         # make sure cls implement contained in schema
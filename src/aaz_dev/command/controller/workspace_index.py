@@ -0,0 +1,98 @@
+import json
+import logging
+import os
+import threading
+
+from utils.files import write_file_atomically
+
+logger = logging.getLogger('backend')
+
+
+class WorkspaceIndex:
+    """The metadata index of the workspaces in a folder, used to list workspaces without loading them.
+
+    The index is maintained when a workspace is saved, renamed or deleted. The entries are verified by the
+    modification time of ws.json when listing, so the workspaces changed by others are indexed again from ws.json.
+    """
+
+    FILE_NAME = ".index.json"
+
+    _lock = threading.Lock()
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.path = os.path.join(folder, self.FILE_NAME)
+
+    def list(self):
+        if not os.path.isdir(self.folder):
+            return []
+        with self._lock:
+            entries = self._load()
+            results = {}
+            for name in os.listdir(self.folder):
+                ws_path = os.path.join(self.folder, name, 'ws.json')
+                if not os.path.isfile(ws_path):
+                    continue
+                updated = os.path.getmtime(ws_path)
+                entry = entries.get(name, None)
+                if entry is None or entry['updated'] != updated:
+                    try:
+                        with open(ws_path, 'r') as f:
+                            data = json.load(f)
+                        entry = self.build_entry(name, data, updated)
+                    except (OSError, ValueError, KeyError, TypeError) as err:
+                        logger.warning(f"Failed to index workspace: {ws_path}: {err}")
+                        entry = {"name": name, "updated": updated}
+                results[name] = entry
+            if results != entries:
+                self._dump(results)
+        return [{"folder": os.path.join(self.folder, name), **entry} for name, entry in results.items()]
+
+    def update(self, name, data, updated):
+        """Update the entry of workspace by the primitive data of ws.json"""
+        with self._lock:
+            entries = self._load()
+            entries[name] = self.build_entry(name, data, updated)
+            self._dump(entries)
+
+    def remove(self, name):
+        with self._lock:
+            entries = self._load()
+            if entries.pop(name, None) is not None:
+                self._dump(entries)
+
+    @staticmethod
+    def build_entry(name, data, updated):
+        command_count = 0
+        resources = set()
+        nodes = [data['commandTree']]
+        while nodes:
+            node = nodes.pop()
+            for leaf in (node.get('commands', None) or {}).values():
+                command_count += 1
+                for resource in leaf.get('resources', None) or []:
+                    resources.add((resource['id'], resource['version']))
+            nodes.extend((node.get('commandGroups', None) or {}).values())
+        return {
+            "name": name,
+            "plane": data['plane'],
+            "version": data['version'],
+            "updated": updated,
+            "commandCount": command_count,
+            "resources": [{"id": r_id, "version": version} for r_id, version in sorted(resources)],
+        }
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as err:
+            logger.warning(f"Failed to load workspace index: {self.path}: {err}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _dump(self, entries):
+        os.makedirs(self.folder, exist_ok=True)
+        write_file_atomically(self.path, json.dumps(entries, ensure_ascii=False))
@@ -2,16 +2,21 @@ import json
 import logging
 import os
 import shutil
+import threading
 from datetime import datetime
 
 from command.model.editor import CMDEditorWorkspace, CMDCommandTreeNode, CMDCommandTreeLeaf
+from job.controller.job_manager import report_progress
 from swagger.controller.command_generator import CommandGenerator
 from swagger.controller.specs_manager import SwaggerSpecsManager
 from swagger.utils.exceptions import InvalidSwaggerValueError
 from utils import exceptions
 from utils.config import Config
+from utils.files import write_file_atomically
 from .specs_manager import AAZSpecsManager
+from .workspace_arg_index import WorkspaceArgIndex
 from .workspace_cfg_editor import WorkspaceCfgEditor
+from .workspace_index import WorkspaceIndex
 from command.model.configuration import CMDHelp, CMDResource, CMDCommandExample, CMDArg, CMDCommand
 
 logger = logging.getLogger('backend')
@@ -22,23 +27,15 @@ class WorkspaceManager:
 
     IN_MEMORY = "__IN_MEMORY_WORKSPACE__"
 
+    # the arg indexes of saved workspaces in process: {folder: (ws version, WorkspaceArgIndex)}
+    _arg_indexes = {}
+    _arg_indexes_lock = threading.Lock()
+
     @classmethod
     def list_workspaces(cls):
-        workspaces = []
-        if not os.path.exists(Config.AAZ_DEV_WORKSPACE_FOLDER):
-            return workspaces
-
-        for name in os.listdir(Config.AAZ_DEV_WORKSPACE_FOLDER):
-            if not os.path.isdir(os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, name)):
-                continue
-            manager = cls(name)
-            if os.path.exists(manager.path) and os.path.isfile(manager.path):
-                workspaces.append({
-                    "name": name,
-                    "folder": manager.folder,
-                    "updated": os.path.getmtime(manager.path)
-                })
-        return workspaces
+        if not Config.AAZ_DEV_WORKSPACE_FOLDER:
+            return []
+        return WorkspaceIndex(Config.AAZ_DEV_WORKSPACE_FOLDER).list()
 
     @classmethod
     def new(cls, name, plane, **kwargs):
@@ -55,7 +52,7 @@ class WorkspaceManager:
         })
         return manager
 
-    def __init__(self, name, folder=None, aaz_manager=None, swagger_manager=None):
+    def __init__(self, name, folder=None, aaz_manager=None, swagger_manager=None, command_generator=None):
         self.name = name
         if not folder:
             if not Config.AAZ_DEV_WORKSPACE_FOLDER or os.path.exists(Config.AAZ_DEV_WORKSPACE_FOLDER) and not os.path.isdir(Config.AAZ_DEV_WORKSPACE_FOLDER):
@@ -71,15 +68,50 @@ class WorkspaceManager:
         self.ws = None
         self._cfg_editors = {}
         self._reusable_leaves = {}
+        # the cfg files data written by save, used to skip the files not changed: {path: data}
+        self._saved_cfg_files = {}
+        # the stat of ws.json when it's loaded or saved, used to verify the version without parsing ws.json
+        self._ws_file_stat = None
+
+        # the managers are created when used, so that it's cheap to create workspace manager for file operations
+        self._aaz_specs = aaz_manager
+        self._swagger_specs = swagger_manager
+        # the command generator can be shared by the caller to reuse the loaded swagger files, such as batch generating
+        self._swagger_command_generator = command_generator
 
-        self.aaz_specs = aaz_manager or AAZSpecsManager()
-        self.swagger_specs = swagger_manager or SwaggerSpecsManager()
-        self.swagger_command_generator = CommandGenerator()
+    @property
+    def aaz_specs(self):
+        if self._aaz_specs is None:
+            self._aaz_specs = AAZSpecsManager()
+        return self._aaz_specs
+
+    @property
+    def swagger_specs(self):
+        if self._swagger_specs is None:
+            self._swagger_specs = SwaggerSpecsManager.get_shared()
+        return self._swagger_specs
+
+    def _new_swagger_command_generator(self):
+        """Get the command generator for a swagger operation. A new one is used for each operation unless it's shared by
+        the caller, because the loaded swagger files are never reloaded by the generator, while the workspace can be kept
+        in memory across the operations.
+        """
+        if self._swagger_command_generator is not None:
+            return self._swagger_command_generator
+        return CommandGenerator()
 
     @property
     def is_in_memory(self):
         return self.folder == self.IN_MEMORY
 
+    @property
+    def _index(self):
+        """The metadata index of workspaces, only for the workspaces in AAZ_DEV_WORKSPACE_FOLDER."""
+        if self.is_in_memory or not Config.AAZ_DEV_WORKSPACE_FOLDER or \
+                self.folder != os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, self.name):
+            return None
+        return WorkspaceIndex(Config.AAZ_DEV_WORKSPACE_FOLDER)
+
     def load(self):
         assert not self.is_in_memory
         # TODO: handle exception
@@ -88,14 +120,18 @@ class WorkspaceManager:
         with open(self.path, 'r') as f:
             data = json.load(f)
             self.ws = CMDEditorWorkspace(raw_data=data)
+        self._ws_file_stat = self._get_file_stat(self.path)
 
         self._cfg_editors = {}
+        self._saved_cfg_files = {}
 
     def rename(self, new_name):
         assert not self.is_in_memory
         new_folder = os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, new_name)
         if os.path.exists(new_folder):
             raise ValueError(f"Invalid new workspace folder: folder path exists: {new_folder}")
+        if (index := self._index) is not None:
+            index.remove(self.name)
         os.rename(self.folder, new_folder)
         self.name = new_name
         self.folder = new_folder
@@ -110,6 +146,10 @@ class WorkspaceManager:
             if not os.path.isfile(self.path):
                 raise exceptions.ResourceConflict(f"Workspace conflict: Is not file path: {self.path}")
             shutil.rmtree(self.folder)  # remove the whole folder
+            with self._arg_indexes_lock:
+                self._arg_indexes.pop(self.folder, None)
+            if (index := self._index) is not None:
+                index.remove(self.name)
             return True
         return False
 
@@ -121,42 +161,65 @@ class WorkspaceManager:
 
         remove_folders = []
         update_files = []
+        changed_cfg_editors = []
         used_resources = set()
         for resource_id, cfg_editor in self._cfg_editors.items():
             if resource_id in used_resources:
                 continue
+            changed = False
             for r_id, data in cfg_editor.iter_cfg_files_data():
                 assert r_id not in used_resources
                 if data is None:
                     remove_folders.append(WorkspaceCfgEditor.get_cfg_folder(self.folder, r_id))
+                    changed = True
                 else:
-                    update_files.append((WorkspaceCfgEditor.get_cfg_path(self.folder, r_id), data))
+                    path = WorkspaceCfgEditor.get_cfg_path(self.folder, r_id)
+                    if self._saved_cfg_files.get(path, None) != data:
+                        update_files.append((path, data))
+                        changed = True
                 used_resources.add(r_id)
+            if changed:
+                changed_cfg_editors.append(cfg_editor)
         assert set(self._cfg_editors.keys()) == used_resources
 
         # verify ws timestamps
         # TODO: add write lock for path file
-        if os.path.exists(self.path):
+        if os.path.exists(self.path) and (
+                self._ws_file_stat is None or self._get_file_stat(self.path) != self._ws_file_stat):
             with open(self.path, 'r') as f:
                 data = json.load(f)
-                pre_ws = CMDEditorWorkspace(data)
-            if pre_ws.version != self.ws.version:
+            if CMDEditorWorkspace.version.to_native(data['version']) != self.ws.version:
                 raise exceptions.InvalidAPIUsage(f"Workspace Changed after: {self.ws.version}")
 
+        pre_version = self.ws.version
         self.ws.version = datetime.utcnow()
-        with open(self.path, 'w') as f:
-            data = json.dumps(self.ws.to_primitive(), ensure_ascii=False)
-            f.write(data)
+        ws_data = self.ws.to_primitive()
+        write_file_atomically(self.path, json.dumps(ws_data, ensure_ascii=False))
+        self._ws_file_stat = self._get_file_stat(self.path)
+        if (index := self._index) is not None:
+            index.update(self.name, ws_data, os.path.getmtime(self.path))
 
         for folder in remove_folders:
-            shutil.rmtree(folder)
+            if os.path.exists(folder):
+                shutil.rmtree(folder)
+            self._saved_cfg_files.pop(os.path.join(folder, "cfg.json"), None)
 
         for file_name, data in update_files:
             os.makedirs(os.path.dirname(file_name), exist_ok=True)
-            with open(file_name, 'w') as f:
-                f.write(data)
+            write_file_atomically(file_name, data)
+            self._saved_cfg_files[file_name] = data
+
+        self._update_arg_index(pre_version, changed_cfg_editors)
+        # keep the saved cfg editors, so that they can be reused when the workspace is kept in memory
+        self._cfg_editors = {
+            resource_id: cfg_editor for resource_id, cfg_editor in self._cfg_editors.items() if not cfg_editor.deleted
+        }
+        self._reusable_leaves = {}
 
-        self._cfg_editors = {}
+    @staticmethod
+    def _get_file_stat(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
 
     def find_command_tree_node(self, *node_names):
         node = self.ws.command_tree
@@ -471,14 +534,16 @@ class WorkspaceManager:
             used_resource_ids.update(r['id'])
 
         # load swagger resources
-        self.swagger_command_generator.load_resources(swagger_resources)
+        command_generator = self._new_swagger_command_generator()
+        command_generator.load_resources(swagger_resources)
 
         # generate cfg editors by resource
         cfg_editors = []
         aaz_ref = {}
-        for resource, options in zip(swagger_resources, resource_options):
+        for idx, (resource, options) in enumerate(zip(swagger_resources, resource_options)):
+            report_progress(f"Generate commands for resource: {resource.id}", current=idx, total=len(swagger_resources))
             try:
-                command_group = self.swagger_command_generator.create_draft_command_group(resource, **options)
+                command_group = command_generator.create_draft_command_group(resource, **options)
             except InvalidSwaggerValueError as err:
                 raise exceptions.InvalidAPIUsage(
                     message=str(err)
@@ -562,10 +627,12 @@ class WorkspaceManager:
                 raise exceptions.ResourceNotFind(f"Command not exist for '{resource_id}'")
             swagger_resources.append(swagger_resource)
 
-        self.swagger_command_generator.load_resources(swagger_resources)
+        command_generator = self._new_swagger_command_generator()
+        command_generator.load_resources(swagger_resources)
 
         new_cfg_editors = []
-        for resource_id, reload_resource in reload_resource_map.items():
+        for idx, (resource_id, reload_resource) in enumerate(reload_resource_map.items()):
+            report_progress(f"Reload commands for resource: {resource_id}", current=idx, total=len(reload_resource_map))
             options = {}
             cfg_editor = reload_resource['cfg_editor']
             swagger_resource = reload_resource['swagger_resource']
@@ -577,7 +644,7 @@ class WorkspaceManager:
                 _, _, update_by = update_cmd_info
                 options['update_by'] = update_by
             try:
-                command_group = self.swagger_command_generator.create_draft_command_group(
+                command_group = command_generator.create_draft_command_group(
                     swagger_resource, **options)
             except InvalidSwaggerValueError as err:
                 raise exceptions.InvalidAPIUsage(
@@ -618,7 +685,7 @@ class WorkspaceManager:
             for leaf in (root_node.commands or {}).values():
                 for leaf_resource in leaf.resources:
                     # cannot find match resource of resource_id with current mod_names and version
-                    cg_names = self.swagger_command_generator.generate_command_group_name_by_resource(
+                    cg_names = CommandGenerator.generate_command_group_name_by_resource(
                         resource_path=leaf_resource.swagger_path, rp_name=leaf_resource.rp_name)
                     cg_names = cg_names.split(" ")
                     groups_names.append(cg_names)
@@ -784,16 +851,34 @@ class WorkspaceManager:
         cfg_editor.rename_command(*old_names, new_cmd_names=new_cmd_names)
         return leaf
 
-    def generate_to_aaz(self):
-        # Merge the commands of subresources which exported in aaz but not exist in current workspace
-        self._merge_sub_resources_in_aaz()
+    def generate_to_aaz(self, save=True):
+        """Export the workspace into aaz. When save is False, the changes are kept in aaz_specs until its save() is
+        called, so that multiple workspaces can be exported in one save.
+        """
+        # load each cfg once, and the previous cfgs in aaz in parallel
+        report_progress("Load command models")
+        cfg_editors = self._load_cfg_editors_of_leaves()
+        self.aaz_specs.prefetch_resource_cfg_readers(
+            (cfg_editor.cfg.plane, resource.id, resource.version)
+            for cfg_editor in cfg_editors for resource in cfg_editor.resources
+        )
+        try:
+            # Merge the commands of subresources which exported in aaz but not exist in current workspace
+            self._merge_sub_resources_in_aaz(cfg_editors)
+
+            # update configurations
+            for idx, cfg_editor in enumerate(cfg_editors):
+                report_progress(
+                    "Update command model of resources: " + ", ".join(r.id for r in cfg_editor.resources),
+                    current=idx, total=len(cfg_editors)
+                )
+                cfg_editor.link()
+                self.aaz_specs.update_resource_cfg(cfg_editor.cfg, cfg_reader=cfg_editor)
+        finally:
+            self.aaz_specs.clear_prefetched_resource_cfg_readers()
 
-        # update configurations
-        for ws_leaf in self.iter_command_tree_leaves():
-            editor = self.load_cfg_editor_by_command(ws_leaf)
-            cfg = editor.cfg
-            self.aaz_specs.update_resource_cfg(cfg)
         # update commands
+        report_progress("Update command tree")
         for ws_leaf in self.iter_command_tree_leaves():
             self.aaz_specs.update_command_by_ws(ws_leaf)
         # update command groups
@@ -802,14 +887,24 @@ class WorkspaceManager:
                 # ignore root node
                 continue
             self.aaz_specs.update_command_group_by_ws(ws_node)
-        self.aaz_specs.save()
+        if save:
+            # the job can't be cancelled after the files start to be saved
+            report_progress("Save command models")
+            self.aaz_specs.save()
+
+    def _load_cfg_editors_of_leaves(self):
+        """Load the cfg editors of command tree leaves, each cfg editor is returned once."""
+        cfg_editors = {}
+        for ws_leaf in self.iter_command_tree_leaves():
+            cfg_editor = self.load_cfg_editor_by_command(ws_leaf)
+            cfg_editors.setdefault(id(cfg_editor), cfg_editor)
+        return [*cfg_editors.values()]
 
-    def _merge_sub_resources_in_aaz(self):
+    def _merge_sub_resources_in_aaz(self, cfg_editors):
         """Merge the commands of subresources which exported in aaz but not exist in current workspace"""
         updated_cfgs = []
         inserted_commands = set()
-        for ws_leaf in self.iter_command_tree_leaves():
-            editor = self.load_cfg_editor_by_command(ws_leaf)
+        for editor in cfg_editors:
             existing_sub_resources = {}
             for cmd_names, command in editor.iter_commands():
                 for r in command.resources:
@@ -859,7 +954,7 @@ class WorkspaceManager:
                     aaz_ref[cmd_names_str] = r_version
             if aaz_ref:
                 editor.reformat()
-                updated_cfgs = [(editor, aaz_ref)]
+                updated_cfgs.append((editor, aaz_ref))
 
         for editor, aaz_ref in updated_cfgs:
             self.remove_cfg(editor)
@@ -868,6 +963,7 @@ class WorkspaceManager:
     def find_similar_args(self, *cmd_names, arg):
         assert isinstance(arg, CMDArg)
         results = {}
+        arg_index = self._get_arg_index()
         if arg.var.startswith("@"):
             # specify idx_suffix
             cls_name = arg.var[1:].replace('[', '.[').replace('{', '.{').split('.')[0]
@@ -881,36 +977,90 @@ class WorkspaceManager:
             assert len(idx_suffix) > 0
 
             cls_name_prefix = cls_name.split('_')[0]  # remove the subfix such as `_create` `_update`
-            for leaf in self.iter_command_tree_leaves():
-                cfg_editor = self.load_cfg_editor_by_command(leaf)
-                for _, similar_cls_arg, similar_cls_arg_idx, _ in cfg_editor.iter_arg_cls_definition(
-                        *leaf.names, cls_name_prefix=cls_name_prefix):
-                    # search cls definition in command
-                    # find sub arg by idx_suffix
-                    similar_arg = cfg_editor.find_sub_arg(similar_cls_arg, idx=idx_suffix)
-                    if similar_arg is None or not cfg_editor.is_similar_args(arg, similar_arg):
-                        continue
-                    similar_arg_idx = similar_cls_arg_idx + idx_suffix
+            for leaf_names, similar_cls_arg, similar_cls_arg_idx, ref_arg_idxes in arg_index.iter_arg_cls_definitions(
+                    cls_name_prefix):
+                # search cls definition in command
+                # find sub arg by idx_suffix
+                similar_arg = WorkspaceCfgEditor.find_sub_arg(similar_cls_arg, idx=idx_suffix)
+                if similar_arg is None or not WorkspaceCfgEditor.is_similar_args(arg, similar_arg):
+                    continue
+                similar_arg_idx = similar_cls_arg_idx + idx_suffix
 
-                    key = tuple(leaf.names)
-                    assert key not in results
-                    results[key] = {
-                        similar_arg.var: [similar_arg_idx]
-                    }
+                key = leaf_names
+                assert key not in results
+                results[key] = {
+                    similar_arg.var: [similar_arg_idx]
+                }
 
-                    # search cls reference in command
-                    for _, _, ref_arg_idx, _ in cfg_editor.iter_arg_cls_reference(*leaf.names, cls_name=similar_cls_arg.cls):
-                        results[key][similar_arg.var].append(ref_arg_idx + idx_suffix)
+                # search cls reference in command
+                for ref_arg_idx in ref_arg_idxes:
+                    results[key][similar_arg.var].append(ref_arg_idx + idx_suffix)
 
         else:
-            for leaf in self.iter_command_tree_leaves():
-                cfg_editor = self.load_cfg_editor_by_command(leaf)
-                similar_arg, similar_arg_idx = cfg_editor.find_arg_by_var(*leaf.names, arg_var=arg.var)
-                if similar_arg is None or not cfg_editor.is_similar_args(arg, similar_arg):
+            for leaf_names, similar_arg, similar_arg_idx in arg_index.iter_args_by_var(arg.var):
+                if not WorkspaceCfgEditor.is_similar_args(arg, similar_arg):
                     continue
-                key = tuple(leaf.names)
+                key = leaf_names
                 assert key not in results
                 results[key] = {
                     similar_arg.var: [similar_arg_idx]
                 }
         return results
+
+    def _get_arg_index(self):
+        """Return the arg index of workspace, which includes the modifications not saved yet."""
+        if self.is_in_memory:
+            index = WorkspaceArgIndex()
+        else:
+            with self._arg_indexes_lock:
+                cached = self._arg_indexes.get(self.folder, None)
+            if cached is not None and cached[0] == self.ws.version:
+                index = cached[1]
+            else:
+                index = self._build_arg_index()
+                with self._arg_indexes_lock:
+                    self._arg_indexes[self.folder] = (self.ws.version, index)
+            if not self._cfg_editors:
+                return index
+            index = index.copy()
+
+        for cfg_editor in self._iter_cfg_editors():
+            index.update_cfg(cfg_editor)
+        return index
+
+    def _build_arg_index(self):
+        # build from the saved cfg files only
+        index = WorkspaceArgIndex()
+        for leaf in self.iter_command_tree_leaves():
+            resource = leaf.resources[0]
+            if index.has_resource(resource.id):
+                continue
+            if not os.path.exists(WorkspaceCfgEditor.get_cfg_path(self.folder, resource.id)):
+                continue
+            try:
+                cfg_editor = WorkspaceCfgEditor.load_resource(self.folder, resource.id, resource.version)
+            except Exception as e:
+                logger.error(f"load workspace resource cfg failed: {e}: {self.name} {resource.id} {resource.version}")
+                continue
+            index.update_cfg(cfg_editor)
+        return index
+
+    def _update_arg_index(self, pre_version, cfg_editors):
+        with self._arg_indexes_lock:
+            cached = self._arg_indexes.pop(self.folder, None)
+        if cached is None or cached[0] != pre_version:
+            return
+        # the cached index may be in use, update a copy of it
+        index = cached[1].copy()
+        for cfg_editor in cfg_editors:
+            index.update_cfg(cfg_editor)
+        with self._arg_indexes_lock:
+            self._arg_indexes[self.folder] = (self.ws.version, index)
+
+    def _iter_cfg_editors(self):
+        visited = set()
+        for cfg_editor in self._cfg_editors.values():
+            if id(cfg_editor) in visited:
+                continue
+            visited.add(id(cfg_editor))
+            yield cfg_editor
@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from command.model.editor import CMDEditorWorkspace
+from utils.config import Config
+from utils.files import get_file_digest
+from .workspace_manager import WorkspaceManager
+
+logger = logging.getLogger('backend')
+
+
+class WorkspaceSession:
+    """A loaded workspace shared by requests. It should only be used when its lock is held."""
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.manager = None
+        self.signature = None
+        self.accessed = time.monotonic()
+
+
+class WorkspaceSessionCache:
+    """Keep the loaded workspaces, including the cfg editors loaded, in memory across requests.
+
+    The version of workspace is used as the token of optimistic concurrency: when ws.json is changed by others, the
+    cached workspace is reloaded. The modifications are written back by `WorkspaceManager.save`, so the session of a
+    failed request should be released with `discard=True`. The sessions idle for longer than
+    `Config.WORKSPACE_SESSION_IDLE_TIMEOUT` seconds are evicted.
+    """
+
+    def __init__(self):
+        self._sessions = {}  # workspace folder -> WorkspaceSession
+        self._lock = threading.Lock()
+
+    def acquire(self, name):
+        """Lock the session of workspace and load it if required. The session should be released by `release`."""
+        if Config.WORKSPACE_SESSION_IDLE_TIMEOUT <= 0:
+            session = WorkspaceSession(name)
+            session.lock.acquire()
+        else:
+            folder = os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, name)
+            with self._lock:
+                self._evict_idle_sessions()
+                session = self._sessions.get(folder, None)
+                if session is None:
+                    session = self._sessions[folder] = WorkspaceSession(name)
+            session.lock.acquire()
+
+        try:
+            if session.manager is None or not self._verify(session):
+                manager = WorkspaceManager(name)
+                manager.load()
+                session.manager = manager
+                session.signature = self._get_signature(manager)
+        except Exception:
+            self.release(session, discard=True)
+            raise
+        return session
+
+    def release(self, session, discard=False):
+        if discard:
+            session.manager = None
+            session.signature = None
+            with self._lock:
+                for folder, s in self._sessions.items():
+                    if s is session:
+                        del self._sessions[folder]
+                        break
+        session.accessed = time.monotonic()
+        session.lock.release()
+
+    def discard(self, name):
+        """Discard the session of workspace, used when the workspace is deleted or renamed."""
+        folder = os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, name)
+        with self._lock:
+            session = self._sessions.pop(folder, None)
+        if session is not None:
+            with session.lock:
+                session.manager = None
+                session.signature = None
+
+    def _evict_idle_sessions(self):
+        expired = time.monotonic() - Config.WORKSPACE_SESSION_IDLE_TIMEOUT
+        for folder, session in [*self._sessions.items()]:
+            if session.accessed > expired or not session.lock.acquire(blocking=False):
+                continue
+            del self._sessions[folder]
+            session.manager = None
+            session.signature = None
+            session.lock.release()
+
+    def _verify(self, session):
+        """Verify the loaded workspace is the latest one."""
+        manager = session.manager
+        try:
+            signature = self._get_signature(manager)
+        except OSError:
+            return False
+        if signature == session.signature:
+            return True
+        if signature[1:] != session.signature[1:]:
+            # the aaz specs or the swagger specs are changed
+            return False
+
+        # ws.json is modified, compare the version of workspace
+        try:
+            with open(manager.path, 'r') as f:
+                data = json.load(f)
+            version = CMDEditorWorkspace.version.to_native(data['version'])
+        except Exception as err:
+            logger.warning(f"Failed to read workspace version: {manager.path}: {err}")
+            return False
+        if version != manager.ws.version:
+            return False
+        session.signature = signature
+        return True
+
+    @staticmethod
+    def _get_signature(manager):
+        stat = os.stat(manager.path)
+        tree_path = manager.aaz_specs.get_tree_file_path()
+        tree_stat = os.stat(tree_path) if os.path.exists(tree_path) else None
+        return (
+            # the digest of ws.json tells the changes in the same stat, it's much cheaper than loading the workspace
+            (stat.st_mtime_ns, stat.st_size, get_file_digest(manager.path)),
+            (Config.AAZ_PATH, tree_stat and (tree_stat.st_mtime_ns, tree_stat.st_size)),
+            (Config.SWAGGER_PATH, Config.SWAGGER_MODULE_PATH, Config.DEFAULT_SWAGGER_MODULE),
+        )
@@ -78,3 +78,6 @@ from ._selector_index import CMDSelectorIndexBase, CMDSelectorIndex, CMDObjectIn
 from ._subresource_selector import CMDSubresourceSelector, CMDJsonSubresourceSelector
 from ._utils import CMDDiffLevelEnum, DEFAULT_CONFIRMATION_PROMPT
 from ._xml import XMLSerializer
+from ._clone import ModelCloner
+from ._compare import ModelComparer
+from ._loader import TrustedModelLoader
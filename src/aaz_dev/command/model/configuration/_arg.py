@@ -1,8 +1,8 @@
 from schematics.models import Model
-from schematics.types import StringType, ListType, ModelType, PolyModelType
+from schematics.types import StringType, ListType, ModelType
 from schematics.types.serializable import serializable
 
-from ._fields import CMDStageField, CMDVariantField, CMDPrimitiveField, CMDBooleanField, CMDClassField
+from ._fields import CMDStageField, CMDVariantField, CMDPrimitiveField, CMDBooleanField, CMDClassField, CMDPolyModelType
 from ._format import CMDStringFormat, CMDIntegerFormat, CMDFloatFormat, CMDObjectFormat, CMDArrayFormat, \
     CMDResourceIdFormat
 from ._help import CMDArgumentHelp
@@ -142,7 +142,7 @@ class CMDArgBase(Model):
         self._reformat_base(**kwargs)
 
 
-class CMDArgBaseField(PolyModelType):
+class CMDArgBaseField(CMDPolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDArgBaseField, self).__init__(
@@ -152,34 +152,8 @@ class CMDArgBaseField(PolyModelType):
             **kwargs
         )
 
-    def find_model(self, data):
-        if self.claim_function:
-            kls = self.claim_function(self, data)
-            if not kls:
-                raise Exception("Input for polymorphic field did not match any model")
-            return kls
-
-        fallback = None
-        matching_classes = set()
-        for kls in self._get_candidates():
-            if issubclass(kls, CMDArg):
-                continue
-
-            try:
-                kls_claim = kls._claim_polymorphic
-            except AttributeError:
-                if not fallback:
-                    fallback = kls
-            else:
-                if kls_claim(data):
-                    matching_classes.add(kls)
-
-        if not matching_classes and fallback:
-            return fallback
-        elif len(matching_classes) != 1:
-            raise Exception("Got ambiguous input for polymorphic field")
-
-        return matching_classes.pop()
+    def _filter_candidate(self, kls):
+        return not issubclass(kls, CMDArg)
 
 
 class CMDArg(CMDArgBase):
@@ -667,7 +641,7 @@ class CMDObjectArgBase(CMDArgBase):
         serialized_name='format',
         deserialize_from='format',
     )
-    args = ListType(PolyModelType(CMDArg, allow_subclasses=True))
+    args = ListType(CMDPolyModelType(CMDArg, allow_subclasses=True))
     additional_props = ModelType(
         CMDObjectArgAdditionalProperties,
         serialized_name="additionalProps",
@@ -0,0 +1,163 @@
+import copy
+import datetime
+import enum
+
+from schematics.undefined import Undefined
+from schematics.models import Model, ModelDict
+from schematics.types import ModelType, ListType, DictType, PolyModelType
+from schematics.types.serializable import Serializable
+
+from ._schema import CMDSchemaBaseField, CMDSchemaField, CMDObjectSchemaDiscriminatorField, \
+    CMDObjectSchemaAdditionalPropertiesField
+
+# The fields which ignore frozen values when export
+_FROZEN_IGNORED_FIELDS = (
+    CMDSchemaBaseField, CMDSchemaField, CMDObjectSchemaDiscriminatorField, CMDObjectSchemaAdditionalPropertiesField
+)
+
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None), datetime.datetime, datetime.date, enum.Enum)
+
+_DROPPED = object()
+
+
+class ModelCloner:
+    """Clone model instances field by field, without serializing and re-deserializing the whole tree.
+
+    The values of fields are copied as they are in the source instance, so the fields dropped by `to_primitive`, such
+    as `CMDDescriptionField`, are kept. The serializable properties are not copied, the frozen schemas are ignored the
+    same as export, and the attributes which are not fields (such as `implement` of cls schemas) are reset to the
+    values assigned by `__init__` of model class. Immutable leaf values are shared with the source instance.
+    """
+
+    _plans = {}
+
+    @classmethod
+    def clone(cls, value):
+        if value is None:
+            return None
+        if isinstance(value, Model):
+            return cls._clone_model(value)
+        if isinstance(value, list):
+            return [cls.clone(v) for v in value]
+        return _clone_leaf(value)
+
+    @classmethod
+    def shallow_clone(cls, model):
+        """Copy the model instance without copying its children models.
+
+        The list and dict values are copied, so that their items can be replaced without affecting the source instance.
+        """
+        model_cls = type(model)
+        field_cloners, transient_attrs = cls._get_plan(model_cls)
+
+        data = model._data
+        converted = {}
+        for name, _ in field_cloners:
+            value = data.get(name, Undefined)
+            if value is Undefined:
+                continue
+            if isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            converted[name] = value
+        return cls._new_instance(model_cls, converted, transient_attrs)
+
+    @classmethod
+    def _clone_model(cls, model):
+        model_cls = type(model)
+        field_cloners, transient_attrs = cls._get_plan(model_cls)
+
+        data = model._data
+        converted = {}
+        for name, field_cloner in field_cloners:
+            value = data.get(name, Undefined)
+            if value is Undefined:
+                continue
+            if value is not None:
+                value = field_cloner(value)
+                if value is _DROPPED:
+                    value = None
+            converted[name] = value
+        return cls._new_instance(model_cls, converted, transient_attrs)
+
+    @staticmethod
+    def _new_instance(model_cls, converted, transient_attrs):
+        instance = model_cls.__new__(model_cls)
+        instance._data = ModelDict(converted=converted)
+        # the attributes are copied for each instance, in case they're mutable
+        for name, value in transient_attrs.items():
+            instance.__dict__[name] = _clone_leaf(value)
+        return instance
+
+    @classmethod
+    def _get_plan(cls, model_cls):
+        try:
+            return cls._plans[model_cls]
+        except KeyError:
+            plan = cls._plans[model_cls] = cls._build_plan(model_cls)
+            return plan
+
+    @classmethod
+    def _build_plan(cls, model_cls):
+        field_cloners = []
+        for name, field in model_cls._field_list:
+            if isinstance(field, Serializable):
+                continue
+            field_cloners.append((name, cls._build_field_cloner(field)))
+
+        # the attributes assigned in __init__ of model class, they should be reset in the cloned instance
+        transient_attrs = {k: v for k, v in model_cls().__dict__.items() if k != '_data'}
+        return field_cloners, transient_attrs
+
+    @classmethod
+    def _build_field_cloner(cls, field):
+        if isinstance(field, (ModelType, PolyModelType)):
+            if isinstance(field, _FROZEN_IGNORED_FIELDS):
+                return cls._clone_unfrozen_model
+            return cls._clone_model
+
+        if isinstance(field, ListType):
+            item_cloner = cls._build_field_cloner(field.field)
+
+            def _clone_list(values):
+                result = []
+                for v in values:
+                    if v is not None:
+                        v = item_cloner(v)
+                        if v is _DROPPED:
+                            continue
+                    result.append(v)
+                return result
+
+            return _clone_list
+
+        if isinstance(field, DictType):
+            item_cloner = cls._build_field_cloner(field.field)
+
+            def _clone_dict(values):
+                result = {}
+                for k, v in values.items():
+                    if v is not None:
+                        v = item_cloner(v)
+                        if v is _DROPPED:
+                            continue
+                    result[k] = v
+                return result
+
+            return _clone_dict
+
+        return _clone_leaf
+
+    @classmethod
+    def _clone_unfrozen_model(cls, model):
+        if getattr(model, 'frozen', None):
+            return _DROPPED
+        return cls._clone_model(model)
+
+
+def _clone_leaf(value):
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    # such as the list or dict values of CMDPrimitiveField
+    return copy.deepcopy(value)
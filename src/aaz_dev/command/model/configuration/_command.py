@@ -53,6 +53,9 @@ class CMDCommand(Model):
         super().__init__(*args, **kwargs)
         self.arg_cls_register_map = None
         self.schema_cls_register_map = None
+        # reverse indexes of class definitions and references with their idx, built by CfgReader after link
+        self.arg_cls_reference_index = None
+        self.schema_cls_reference_index = None
 
     def generate_args(self, ref_args=None, ref_options=None):
         if not ref_args:
@@ -148,6 +151,8 @@ class CMDCommand(Model):
         return output
 
     def reformat(self, **kwargs):
+        self.arg_cls_reference_index = None
+        self.schema_cls_reference_index = None
         self.resources = sorted(self.resources, key=lambda r: r.id)
         try:
             self._reformat_arg_groups(**kwargs)
@@ -210,6 +215,8 @@ class CMDCommand(Model):
     def link(self):
         self.arg_cls_register_map = {}
         self.schema_cls_register_map = {}
+        self.arg_cls_reference_index = None
+        self.schema_cls_reference_index = None
 
         if self.arg_groups:
             arg_cls_register_map = {}
@@ -0,0 +1,120 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+from schematics.models import Model
+from schematics.types.serializable import Serializable
+from schematics.undefined import Undefined
+
+
+class ModelComparer:
+    """Compare model instances field by field.
+
+    Two instances are equal when they are the same model class and all their field values are equal, the sub models
+    are compared recursively. The attributes which are not fields (such as `implement` of cls schemas) are ignored.
+
+    The comparison stops at the first different field. In a session, the results of every compared pair of instances,
+    including the sub models compared on the way, are cached, so that each pair of sub trees is compared once at most.
+    The models are mutable, so a session should not cover any modification of the instances.
+    """
+
+    _plans = {}
+    _local = threading.local()
+
+    @classmethod
+    @contextmanager
+    def session(cls):
+        """Cache the comparison results in the session. Nested sessions share the cache of the outermost one."""
+        if getattr(cls._local, 'memo', None) is not None:
+            yield
+            return
+        cls._local.memo = {}
+        try:
+            yield
+        finally:
+            cls._local.memo = None
+
+    @classmethod
+    def equal(cls, model, other):
+        if model is other:
+            return True
+        if type(model) is not type(other):
+            return False
+        memo = getattr(cls._local, 'memo', None)
+        if memo is None:
+            memo = {}
+        return cls._equal_model(model, other, memo)
+
+    @classmethod
+    def _equal_model(cls, model, other, memo):
+        key = (id(model), id(other))
+        cached = memo.get(key, None)
+        if cached is not None and cached[0] is model and cached[1] is other:
+            return cached[2]
+
+        try:
+            field_names = cls._plans[type(model)]
+        except KeyError:
+            field_names = cls._plans[type(model)] = cls._build_plan(type(model))
+
+        values = _get_values(model)
+        other_values = _get_values(other)
+        result = True
+        for name in field_names:
+            if not cls._equal_value(values.get(name, None), other_values.get(name, None), memo):
+                result = False
+                break
+
+        # keep the instances in memo, so that their ids will not be reused in the session
+        memo[key] = (model, other, result)
+        return result
+
+    @classmethod
+    def _equal_value(cls, value, other, memo):
+        if value is other:
+            return True
+        if value is Undefined:
+            value = None
+        if other is Undefined:
+            other = None
+
+        if isinstance(value, Model) or isinstance(other, Model):
+            return type(value) is type(other) and cls._equal_model(value, other, memo)
+        if isinstance(value, list):
+            if not isinstance(other, list) or len(value) != len(other):
+                return False
+            for v, o in zip(value, other):
+                if not cls._equal_value(v, o, memo):
+                    return False
+            return True
+        if isinstance(value, dict):
+            if not isinstance(other, dict) or value.keys() != other.keys():
+                return False
+            for k, v in value.items():
+                if not cls._equal_value(v, other[k], memo):
+                    return False
+            return True
+        return value == other
+
+    @staticmethod
+    def _build_plan(model_cls):
+        return tuple(name for name, field in model_cls._field_list if not isinstance(field, Serializable))
+
+
+def _get_values(model):
+    data = model._data
+    if data.unsafe or data.valid:
+        return {**data.valid, **data.converted, **data.unsafe}
+    # avoid the slow lookups of ChainMap
+    return data.converted
+
+
+def diff_in_compare_session(diff):
+    """Decorator of `diff(self, old, level)` methods, so that the sub trees compared are cached in the whole diff."""
+
+    @functools.wraps(diff)
+    def wrapper(self, old, level):
+        with ModelComparer.session():
+            return diff(self, old, level)
+
+    return wrapper
@@ -1,8 +1,7 @@
 from schematics.models import Model
-from schematics.types import PolyModelType
 
 from ._arg_builder import CMDArgBuilder
-from ._fields import CMDVariantField
+from ._fields import CMDVariantField, CMDPolyModelType
 from ._schema import CMDSchemaBaseField, CMDSchema, CMDClsSchema, CMDClsSchemaBase, \
     CMDObjectSchemaBase, CMDArraySchemaBase, CMDObjectSchemaDiscriminator
 from ._utils import CMDDiffLevelEnum
@@ -15,7 +14,7 @@ class CMDRequestJson(Model):
     ref = CMDVariantField()
 
     # properties as nodes
-    schema = PolyModelType(CMDSchema, allow_subclasses=True)
+    schema = CMDPolyModelType(CMDSchema, allow_subclasses=True)
 
     class Options:
         serialize_when_none = False
@@ -1,4 +1,4 @@
-from schematics.types import StringType, BaseType, BooleanType
+from schematics.types import StringType, BaseType, BooleanType, PolyModelType
 from utils.stage import AAZStageEnum, AAZStageField
 import json
 import logging
@@ -150,3 +150,79 @@ class CMDDescriptionField(StringType):
     def to_primitive(self, value, context=None):
         """the description will not exist when call to primitive"""
         return None  # return None when value is false to hide field with `serialize_when_none=False`
+
+
+class CMDPolyModelType(PolyModelType):
+    """
+    PolyModelType which dispatches the input data to model class by its `type` value.
+
+    The candidate classes which may claim a `type` value are precomputed once, so only they are consulted for the
+    following inputs with the same `type` value. The input without `type` value falls back to consult all candidates.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CMDPolyModelType, self).__init__(*args, **kwargs)
+        self._candidates = None
+        self._type_candidates = {}
+
+    def find_model(self, data):
+        if self.claim_function:
+            return super(CMDPolyModelType, self).find_model(data)
+
+        candidates = None
+        if isinstance(data, dict):
+            type_value = data.get('type', None)
+            if isinstance(type_value, str):
+                candidates = self._get_type_candidates(type_value)
+        if candidates is None:
+            candidates = self._get_cached_candidates()
+
+        fallback = None
+        matching_classes = []
+        for kls in candidates:
+            try:
+                kls_claim = kls._claim_polymorphic
+            except AttributeError:
+                if not fallback:
+                    fallback = kls
+            else:
+                if kls_claim(data):
+                    matching_classes.append(kls)
+
+        if not matching_classes and fallback:
+            return fallback
+        elif len(matching_classes) != 1:
+            raise Exception("Got ambiguous input for polymorphic field")
+
+        return matching_classes[0]
+
+    def _filter_candidate(self, kls):
+        """Return False if the class should not be used for this field"""
+        return True
+
+    def _get_cached_candidates(self):
+        if self._candidates is None:
+            self._candidates = tuple(kls for kls in self._get_candidates() if self._filter_candidate(kls))
+        return self._candidates
+
+    def _get_type_candidates(self, type_value):
+        try:
+            return self._type_candidates[type_value]
+        except KeyError:
+            pass
+        # claim with a probe which contains every key, so that all the candidates which may claim this type value are
+        # kept, no matter which other keys they require.
+        probe = _ClaimProbe(type=type_value)
+        candidates = []
+        for kls in self._get_cached_candidates():
+            kls_claim = getattr(kls, '_claim_polymorphic', None)
+            if kls_claim is None or kls_claim(probe):
+                candidates.append(kls)
+        candidates = self._type_candidates[type_value] = tuple(candidates)
+        return candidates
+
+
+class _ClaimProbe(dict):
+
+    def __contains__(self, key):
+        return True
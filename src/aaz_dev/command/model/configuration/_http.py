@@ -12,7 +12,6 @@ from ._schema import CMDSchemaField
 from ._arg_builder import CMDArgBuilder
 from ._arg import CMDResourceGroupNameArg, CMDSubscriptionIdArg, CMDResourceLocationArg
 from ._utils import CMDDiffLevelEnum
-from msrestazure.tools import parse_resource_id, resource_id
 from ._utils import CMDArgBuildPrefix
 
 
@@ -38,6 +37,7 @@ class CMDHttpRequestArgs(Model):
 class CMDHttpRequestPath(CMDHttpRequestArgs):
 
     def generate_args(self, path, ref_args, has_subresource):
+        from msrestazure.tools import parse_resource_id, resource_id
         try:
             id_parts = parse_resource_id(path)
             resource_id(**id_parts)
@@ -0,0 +1,108 @@
+from schematics.models import Model, ModelDict
+from schematics.types import StringType, ModelType, ListType, DictType, PolyModelType
+from schematics.types.serializable import Serializable
+from schematics.undefined import Undefined
+
+
+class TrustedModelLoader:
+    """Build model instances from the primitive data exported by aaz-dev itself.
+
+    The result is the same as `model_cls(data)`, but the schematics import loop is skipped: the conversion of each
+    model class is compiled once into a list of field loaders. Rogue keys and invalid values are not checked, so it
+    should only be used for the files written by aaz-dev. Call `validate()` of the loaded instance to check it on
+    demand.
+    """
+
+    _plans = {}
+
+    @classmethod
+    def load(cls, model_cls, data):
+        return cls._load_model(model_cls, data)
+
+    @classmethod
+    def _load_model(cls, model_cls, data):
+        try:
+            field_loaders, transient_attrs = cls._plans[model_cls]
+        except KeyError:
+            field_loaders, transient_attrs = cls._plans[model_cls] = cls._build_plan(model_cls)
+
+        converted = {}
+        for name, field, input_keys, field_loader in field_loaders:
+            value = Undefined
+            for key in input_keys:
+                value = data.get(key, Undefined)
+                if value is not Undefined:
+                    break
+            else:
+                value = field.default
+            if value is not Undefined and value is not None:
+                value = field_loader(value)
+            else:
+                value = None
+            converted[name] = value
+
+        instance = model_cls.__new__(model_cls)
+        instance._data = ModelDict(converted=converted)
+        if transient_attrs:
+            instance.__dict__.update(transient_attrs)
+        return instance
+
+    @classmethod
+    def _build_plan(cls, model_cls):
+        field_loaders = []
+        for name, field in model_cls._schema.fields.items():
+            input_keys = [name, *(key for key in field.get_input_keys() if key and key != name)]
+            field_loaders.append((name, field, tuple(input_keys), cls._build_field_loader(field)))
+
+        # the attributes assigned in __init__ of model class
+        transient_attrs = {k: v for k, v in model_cls().__dict__.items() if k != '_data'}
+        return field_loaders, transient_attrs
+
+    @classmethod
+    def _build_field_loader(cls, field):
+        if isinstance(field, Serializable):
+            field = field.type
+
+        if isinstance(field, PolyModelType):
+            def _load_poly_model(value):
+                if isinstance(value, Model):
+                    return value
+                return cls._load_model(field.find_model(value), value)
+
+            return _load_poly_model
+
+        if isinstance(field, ModelType):
+            model_cls = field.model_class
+
+            def _load_model(value):
+                if isinstance(value, Model):
+                    return value
+                return cls._load_model(model_cls, value)
+
+            return _load_model
+
+        if isinstance(field, ListType):
+            item_loader = cls._build_field_loader(field.field)
+
+            def _load_list(values):
+                return [item_loader(v) if v is not None else None for v in values]
+
+            return _load_list
+
+        if isinstance(field, DictType):
+            item_loader = cls._build_field_loader(field.field)
+
+            def _load_dict(values):
+                return {k: item_loader(v) if v is not None else None for k, v in values.items()}
+
+            return _load_dict
+
+        if type(field).to_native is StringType.to_native:
+            def _load_string(value):
+                if type(value) is str:
+                    return value
+                return field.convert(value)
+
+            return _load_string
+
+        return field.convert
@@ -3,7 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 from schematics.models import Model
-from schematics.types import ModelType, ListType, PolyModelType
+from schematics.types import ModelType, ListType
 from schematics.types.serializable import serializable
 
 from ._arg import CMDStringArg, CMDStringArgBase, \
@@ -26,7 +26,9 @@ from ._arg import CMDStringArg, CMDStringArgBase, \
     CMDArrayArg, CMDArrayArgBase, \
     CMDObjectArg, CMDObjectArgBase, CMDObjectArgAdditionalProperties, \
     CMDClsArg, CMDClsArgBase
-from ._fields import CMDVariantField, StringType, CMDClassField, CMDBooleanField, CMDPrimitiveField, CMDDescriptionField
+from ._fields import CMDVariantField, StringType, CMDClassField, CMDBooleanField, CMDPrimitiveField, CMDDescriptionField, \
+    CMDPolyModelType
+from ._compare import ModelComparer, diff_in_compare_session
 from ._format import CMDStringFormat, CMDIntegerFormat, CMDFloatFormat, CMDObjectFormat, CMDArrayFormat, \
     CMDResourceIdFormat
 from ._utils import CMDDiffLevelEnum
@@ -191,11 +193,14 @@ class CMDSchemaBase(Model):
                     diff["default"] = default_diff
         return diff
 
+    @diff_in_compare_session
     def diff(self, old, level):
         if type(self) is not type(old):
             return f"Type: {type(old)} != {type(self)}"
         if self.frozen and old.frozen:
             return None
+        if ModelComparer.equal(self, old):
+            return {}
         diff = {}
         diff = self._diff_base(old, level, diff)
         return diff
@@ -209,7 +214,7 @@ class CMDSchemaBase(Model):
         self._reformat_base(**kwargs)
 
 
-class CMDSchemaBaseField(PolyModelType):
+class CMDSchemaBaseField(CMDPolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSchemaBaseField, self).__init__(
@@ -225,34 +230,8 @@ class CMDSchemaBaseField(PolyModelType):
             return None
         return super(CMDSchemaBaseField, self).export(value, format, context)
 
-    def find_model(self, data):
-        if self.claim_function:
-            kls = self.claim_function(self, data)
-            if not kls:
-                raise Exception("Input for polymorphic field did not match any model")
-            return kls
-
-        fallback = None
-        matching_classes = set()
-        for kls in self._get_candidates():
-            if issubclass(kls, CMDSchema):
-                continue
-
-            try:
-                kls_claim = kls._claim_polymorphic
-            except AttributeError:
-                if not fallback:
-                    fallback = kls
-            else:
-                if kls_claim(data):
-                    matching_classes.add(kls)
-
-        if not matching_classes and fallback:
-            return fallback
-        elif len(matching_classes) != 1:
-            raise Exception("Got ambiguous input for polymorphic field")
-
-        return matching_classes.pop()
+    def _filter_candidate(self, kls):
+        return not issubclass(kls, CMDSchema)
 
 
 class CMDSchema(CMDSchemaBase):
@@ -300,11 +279,14 @@ class CMDSchema(CMDSchemaBase):
                 diff["description"] = f"'{old.description}' != '{self.description}'"
         return diff
 
+    @diff_in_compare_session
     def diff(self, old, level):
         if type(self) is not type(old):
             return f"Type: {type(old)} != {type(self)}"
         if self.frozen and old.frozen:
             return None
+        if ModelComparer.equal(self, old):
+            return {}
         diff = {}
         diff = self._diff_base(old, level, diff)
         diff = self._diff(old, level, diff)
@@ -320,7 +302,7 @@ class CMDSchema(CMDSchemaBase):
         self._reformat(**kwargs)
 
 
-class CMDSchemaField(PolyModelType):
+class CMDSchemaField(CMDPolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSchemaField, self).__init__(
@@ -724,9 +706,12 @@ class CMDObjectSchemaDiscriminator(Model):
     class Options:
         serialize_when_none = False
 
+    @diff_in_compare_session
     def diff(self, old, level):
         if self.frozen and old.frozen:
             return None
+        if ModelComparer.equal(self, old):
+            return {}
         diff = {}
 
         if level >= CMDDiffLevelEnum.BreakingChange:
@@ -784,9 +769,12 @@ class CMDObjectSchemaAdditionalProperties(Model):
         deserialize_from="anyType"
     )
 
+    @diff_in_compare_session
     def diff(self, old, level):
         if self.frozen and old.frozen:
             return None
+        if ModelComparer.equal(self, old):
+            return {}
         diff = {}
 
         if level >= CMDDiffLevelEnum.BreakingChange:
@@ -1130,7 +1118,7 @@ def _diff_item(self_item, old_item, level):
     if level >= CMDDiffLevelEnum.BreakingChange:
         if type(self_item) is not type(old_item):
             item_diff = f"Type: {type(old_item)} != {type(self_item)}"
-        elif not (self_item.frozen and old_item.frozen):
+        elif not (self_item.frozen and old_item.frozen) and not ModelComparer.equal(self_item, old_item):
             item_diff = {}
             item_diff = self_item._diff_base(old_item, level, item_diff)
 
@@ -4,9 +4,10 @@
 # --------------------------------------------------------------------------------------------
 
 from schematics.models import Model
-from schematics.types import StringType, ListType, ModelType, PolyModelType
+from schematics.types import StringType, ListType, ModelType
 from schematics.types.serializable import serializable
 
+from ._fields import CMDPolyModelType
 from ._schema import CMDSchemaField
 from ._arg_builder import CMDArgBuilder
 
@@ -46,7 +47,7 @@ class CMDSelectorIndexBase(Model):
         return False
 
 
-class CMDSelectorIndexBaseField(PolyModelType):
+class CMDSelectorIndexBaseField(CMDPolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSelectorIndexBaseField, self).__init__(
@@ -56,34 +57,8 @@ class CMDSelectorIndexBaseField(PolyModelType):
             **kwargs
         )
 
-    def find_model(self, data):
-        if self.claim_function:
-            kls = self.claim_function(self, data)
-            if not kls:
-                raise Exception("Input for polymorphic field did not match any model")
-            return kls
-
-        fallback = None
-        matching_classes = set()
-        for kls in self._get_candidates():
-            if issubclass(kls, CMDSelectorIndex):
-                continue
-
-            try:
-                kls_claim = kls._claim_polymorphic
-            except AttributeError:
-                if not fallback:
-                    fallback = kls
-            else:
-                if kls_claim(data):
-                    matching_classes.add(kls)
-
-        if not matching_classes and fallback:
-            return fallback
-        elif len(matching_classes) != 1:
-            raise Exception("Got ambiguous input for polymorphic field")
-
-        return matching_classes.pop()
+    def _filter_candidate(self, kls):
+        return not issubclass(kls, CMDSelectorIndex)
 
 
 class CMDSelectorIndex(CMDSelectorIndexBase):
@@ -101,7 +76,7 @@ class CMDSelectorIndex(CMDSelectorIndexBase):
         return False
 
 
-class CMDSelectorIndexField(PolyModelType):
+class CMDSelectorIndexField(CMDPolyModelType):
 
     def __init__(self, **kwargs):
         super(CMDSelectorIndexField, self).__init__(
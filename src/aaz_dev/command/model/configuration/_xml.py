@@ -1,8 +1,7 @@
 import inflect
 import re
 
-from lxml.builder import ElementMaker
-from lxml.etree import Element, tostring
+from lxml.etree import Element, SubElement, tostring
 from xml.sax.saxutils import unescape
 from xmltodict import parse
 
@@ -29,28 +28,23 @@ class XMLSerializer:
         primitive = parse(cls._escape(xml), attr_prefix="")
         return build_model(model, primitive[XML_ROOT])
 
-    @staticmethod
-    def _escape(data):
-        ret = ""
-        lines = re.findall(r"<(.+)>", data)
-        for line in lines:
+    _ELEMENT_RE = re.compile(r"<(.+)>")
+    _ESCAPE_TABLE = str.maketrans({"&": "&amp;", ">": "&gt;", "<": "&lt;"})
+
+    @classmethod
+    def _escape(cls, data):
+        lines = []
+        for line in cls._ELEMENT_RE.findall(data):
             # handle long-summary
-            if line.startswith("line>"):
-                ret += "<" + line + ">" + "\n"
-                continue
-            line = line.replace("&", "&amp;")
-            line = line.replace(">", "&gt;")
-            line = line.replace("<", "&lt;")
-            ret += "<" + line + ">" + "\n"
-        return ret
+            if not line.startswith("line>"):
+                line = line.translate(cls._ESCAPE_TABLE)
+            lines.append("<" + line + ">\n")
+        return "".join(lines)
 
 
 def build_xml(primitive, parent=None):
     if parent is None:
-        parent = getattr(ElementMaker(), XML_ROOT)()
-    # normalize element name
-    if elem_name := _inflect_engine.singular_noun(parent.tag):
-        parent.tag = elem_name
+        parent = Element(_singular_tag(XML_ROOT))
     for field_name, data in primitive.items():
         primitive_to_xml(field_name, data, parent)
     return parent
@@ -58,17 +52,16 @@ def build_xml(primitive, parent=None):
 
 def primitive_to_xml(field_name, data, parent):
     if isinstance(data, dict):
-        _parent = getattr(ElementMaker(), field_name)()
-        parent.append(build_xml(data, _parent))
+        # normalize element name
+        build_xml(data, SubElement(parent, _singular_tag(field_name)))
     elif isinstance(data, list):
         for d in data:
             primitive_to_xml(field_name, d, parent)
     else:
         # handle long-summary
         if field_name == "line":
-            child = Element("line")
+            child = SubElement(parent, "line")
             child.text = str(data)
-            parent.append(child)
         # store metadata as attributes
         elif prev := parent.get(field_name):
             curr = " ".join(sorted(f"{prev} {data}".split(), key=len, reverse=True))
@@ -80,19 +73,15 @@ def primitive_to_xml(field_name, data, parent):
 def build_model(model, primitive):
     if hasattr(model, "_field_list"):
         instance = model()
-        for field_name, field in model._field_list:
-            if isinstance(field, Serializable):
-                continue
-            serialized_name = field.serialized_name or field_name
+        for field_name, field, serialized_name, elem_name, curr_field in _model_xml_fields(model):
             # obtain suitable element name
             if serialized_name in primitive:
                 curr_name = serialized_name
-            elif (elem_name := _inflect_engine.singular_noun(serialized_name)) in primitive:
+            elif elem_name in primitive:
                 curr_name = elem_name
             else:
                 continue
             data = primitive[curr_name]
-            curr_field = _unwrap(field)
             field_value = obtain_field_value(field, curr_field, data)
             setattr(instance, field_name, field_value)
         return instance
@@ -137,4 +126,39 @@ def _unwrap(field):
         return field
 
 
+def _singular_tag(name):
+    """Return the element tag used for a field name, the singular form is preferred."""
+    try:
+        return _singular_tags[name]
+    except KeyError:
+        tag = _singular_tags[name] = _inflect_engine.singular_noun(name) or name
+        return tag
+
+
+def _model_xml_fields(model):
+    """Return the precomputed (field_name, field, serialized_name, element_name, unwrapped_field) table of a model
+    class, which is used to build model instance from xml.
+    """
+    try:
+        return _model_xml_fields_tables[model]
+    except KeyError:
+        pass
+    table = []
+    for field_name, field in model._field_list:
+        if isinstance(field, Serializable):
+            continue
+        serialized_name = field.serialized_name or field_name
+        table.append((
+            field_name,
+            field,
+            serialized_name,
+            _inflect_engine.singular_noun(serialized_name) or None,
+            _unwrap(field),
+        ))
+    _model_xml_fields_tables[model] = table
+    return table
+
+
 _inflect_engine = inflect.engine()
+_singular_tags = {}
+_model_xml_fields_tables = {}
@@ -0,0 +1,81 @@
+import json
+import os
+from unittest import mock
+
+from click.testing import CliRunner
+
+from command.api._cmds import bp
+from command.controller.specs_manager import AAZSpecsManager
+from command.tests.common import CommandTestCase
+from swagger.controller.command_generator import CommandGenerator
+from swagger.tests.common import TEST_SWAGGER_FOLDER
+from swagger.utils.tools import swagger_resource_path_to_resource_id
+from utils.config import Config
+from utils.plane import PlaneEnum
+
+
+class CommandModelCommandsTest(CommandTestCase):
+
+    WIDGET_RESOURCE_ID = swagger_resource_path_to_resource_id(
+        "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Test/widgets/{widgetName}")
+    GADGET_RESOURCE_ID = swagger_resource_path_to_resource_id(
+        "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Test/gadgets/{gadgetName}")
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(setattr, Config, "SWAGGER_PATH", Config.SWAGGER_PATH)
+        os.makedirs(self.AAZ_DEV_FOLDER, exist_ok=True)
+        self.manifest_path = os.path.join(self.AAZ_DEV_FOLDER, "manifest.yaml")
+
+    def batch_generate(self, entries):
+        # json is a subset of yaml
+        with open(self.manifest_path, 'w') as f:
+            json.dump(entries, f)
+        return CliRunner().invoke(bp.cli, [
+            "batch-generate-from-swagger", "-s", TEST_SWAGGER_FOLDER, "-a", self.AAZ_FOLDER,
+            "--manifest", self.manifest_path
+        ])
+
+    def test_batch_generate_from_swagger(self):
+        init_command_generator = CommandGenerator.__init__
+        save_aaz_specs = AAZSpecsManager.save
+        with mock.patch.object(CommandGenerator, "__init__", autospec=True, side_effect=init_command_generator) as \
+                init_mock, mock.patch.object(AAZSpecsManager, "save", autospec=True, side_effect=save_aaz_specs) as \
+                save_mock:
+            result = self.batch_generate([
+                {"module": "test", "resourceProvider": "Microsoft.Test", "swaggerTag": "package-2022-01"},
+                {"module": "test", "resourceProvider": "Microsoft.Test", "swaggerTag": "package-gadgets-2022-01",
+                 "plane": PlaneEnum.Mgmt},
+            ])
+            self.assertEqual(result.exit_code, 0, result.output)
+            # the command generator is shared by entries, and aaz is saved once
+            self.assertEqual(init_mock.call_count, 1)
+            self.assertEqual(save_mock.call_count, 1)
+
+        manager = AAZSpecsManager()
+        for resource_id in (self.WIDGET_RESOURCE_ID, self.GADGET_RESOURCE_ID):
+            cfg_reader = manager.load_resource_cfg_reader(PlaneEnum.Mgmt, resource_id, "2022-01-01")
+            self.assertIsNotNone(cfg_reader)
+        self.assertEqual(sorted(manager.find_command_group("test", "widget").commands), [
+            "create", "delete", "list", "show", "update"])
+        self.assertEqual(sorted(manager.find_command_group("test", "gadget").commands), [
+            "create", "delete", "show", "update"])
+        self.assertEqual(manager.find_command_group("test", "gadget").help.short, "Manage gadget")
+
+    def test_batch_generate_from_swagger_failed(self):
+        result = self.batch_generate([
+            {"module": "test", "resourceProvider": "Microsoft.Test"},
+        ])
+        self.assertEqual(result.exit_code, 1, result.output)
+
+        result = self.batch_generate({"module": "test"})
+        self.assertEqual(result.exit_code, 1, result.output)
+
+        # nothing is saved when any entry failed
+        result = self.batch_generate([
+            {"module": "test", "resourceProvider": "Microsoft.Test", "swaggerTag": "package-2022-01"},
+            {"module": "test", "resourceProvider": "Microsoft.Test", "swaggerTag": "package-not-exist"},
+        ])
+        self.assertEqual(result.exit_code, 1, result.output)
+        self.assertFalse(os.path.exists(os.path.join(self.AAZ_FOLDER, "Commands")))
+        self.assertFalse(os.path.exists(os.path.join(self.AAZ_FOLDER, "Resources")))
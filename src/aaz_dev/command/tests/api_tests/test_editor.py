@@ -1,11 +1,14 @@
 import json
 import os
+import shutil
 
 from command.controller.workspace_cfg_editor import WorkspaceCfgEditor
 from command.controller.workspace_manager import WorkspaceManager
 from command.tests.common import CommandTestCase, workspace_name
+from swagger.tests.common import TEST_SWAGGER_FOLDER
 from swagger.utils.tools import swagger_resource_path_to_resource_id
 from utils.base64 import b64encode_str
+from utils.config import Config
 from utils.plane import PlaneEnum
 from utils.stage import AAZStageEnum
 from command.model.configuration import DEFAULT_CONFIRMATION_PROMPT
@@ -81,6 +84,173 @@ class APIEditorTest(CommandTestCase):
             rv = c.delete(ws['url'])
             assert rv.status_code == 204
 
+    @workspace_name("test_workspace_session")
+    def test_workspace_session(self, ws_name):
+        from command.api.editor import _workspace_sessions
+        with self.app.test_client() as c:
+            rv = c.post(f"/AAZ/Editor/Workspaces", json={
+                "name": ws_name,
+                "plane": PlaneEnum.Mgmt,
+            })
+            assert rv.status_code == 200
+            ws_url = rv.get_json()['url']
+
+            rv = c.get(ws_url)
+            assert rv.status_code == 200
+            session = _workspace_sessions.acquire(ws_name)
+            manager = session.manager
+            _workspace_sessions.release(session)
+
+            # reuse the loaded workspace
+            rv = c.post(f"{ws_url}/CommandTree/Nodes/aaz", json={"name": "edge-order"})
+            assert rv.status_code == 200
+            session = _workspace_sessions.acquire(ws_name)
+            assert session.manager is manager
+            _workspace_sessions.release(session)
+
+            # reload the workspace when it's modified by others
+            other = WorkspaceManager(ws_name)
+            other.load()
+            other.create_command_tree_nodes("edge-order", "address")
+            other.save()
+            rv = c.get(f"{ws_url}/CommandTree/Nodes/aaz/edge-order/address")
+            assert rv.status_code == 200
+            session = _workspace_sessions.acquire(ws_name)
+            assert session.manager is not manager
+            assert session.manager.ws.version == other.ws.version
+            manager = session.manager
+            _workspace_sessions.release(session)
+
+            # discard the workspace used by failed request
+            rv = c.post(f"{ws_url}/CommandTree/Nodes/aaz/edge-order/Rename", json={})
+            assert rv.status_code == 400
+            session = _workspace_sessions.acquire(ws_name)
+            assert session.manager is not manager
+            _workspace_sessions.release(session)
+
+            rv = c.delete(ws_url)
+            assert rv.status_code == 200
+            rv = c.get(ws_url)
+            assert rv.status_code == 404
+
+    @workspace_name("test_workspace_session_reload_swagger")
+    def test_workspace_session_reload_swagger(self, ws_name):
+        from command.api.editor import _workspace_sessions
+        self.addCleanup(setattr, Config, "SWAGGER_PATH", Config.SWAGGER_PATH)
+        Config.SWAGGER_PATH = os.path.join(self.AAZ_DEV_FOLDER, "swagger")
+        shutil.copytree(TEST_SWAGGER_FOLDER, Config.SWAGGER_PATH)
+        swagger_path = os.path.join(
+            Config.SWAGGER_PATH, "specification", "test", "resource-manager", "Microsoft.Test", "stable", "2022-01-01",
+            "widgets.json")
+        resource_id = swagger_resource_path_to_resource_id(
+            "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Test/widgets/{widgetName}")
+
+        with self.app.test_client() as c:
+            rv = c.post(f"/AAZ/Editor/Workspaces", json={
+                "name": ws_name,
+                "plane": PlaneEnum.Mgmt,
+            })
+            assert rv.status_code == 200
+            ws_url = rv.get_json()['url']
+
+            rv = c.post(f"{ws_url}/CommandTree/Nodes/aaz/AddSwagger", json={
+                'module': 'test',
+                'version': '2022-01-01',
+                'resources': [{'id': resource_id}],
+            })
+            assert rv.status_code == 200
+
+            def get_create_arg_options():
+                rv = c.get(f"{ws_url}/CommandTree/Nodes/aaz/test/widget/Leaves/create")
+                assert rv.status_code == 200
+                return [arg['options'] for arg_group in rv.get_json()['argGroups'] for arg in arg_group['args']]
+
+            def reload_swagger():
+                rv = c.post(f"{ws_url}/Resources/ReloadSwagger", json={
+                    'resources': [{'id': resource_id, 'version': '2022-01-01'}],
+                })
+                assert rv.status_code == 200
+
+            reload_swagger()
+            assert ['color'] not in get_create_arg_options()
+            session = _workspace_sessions.acquire(ws_name)
+            manager = session.manager
+            _workspace_sessions.release(session)
+
+            # the swagger file changed after the last reload is loaded again in the same session
+            with open(swagger_path, 'r') as f:
+                data = json.load(f)
+            data['definitions']['WidgetProperties']['properties']['color'] = {"type": "string"}
+            with open(swagger_path, 'w') as f:
+                json.dump(data, f)
+            reload_swagger()
+            session = _workspace_sessions.acquire(ws_name)
+            assert session.manager is manager
+            _workspace_sessions.release(session)
+            assert ['color'] in get_create_arg_options()
+
+            # discard the workspace modified in memory by generating
+            for node_names in (["test"], ["test", "widget"]):
+                rv = c.patch(f"{ws_url}/CommandTree/Nodes/aaz/{'/'.join(node_names)}", json={
+                    "help": {"short": f"Manage {' '.join(node_names)}."},
+                })
+                assert rv.status_code == 200
+            rv = c.get(f"{ws_url}/CommandTree/Nodes/aaz/test/widget")
+            assert rv.status_code == 200
+            for leaf_name in rv.get_json()['commands']:
+                rv = c.patch(f"{ws_url}/CommandTree/Nodes/aaz/test/widget/Leaves/{leaf_name}", json={
+                    "help": {"short": f"Run test widget {leaf_name}."},
+                })
+                assert rv.status_code == 200
+            rv = c.post(f"{ws_url}/Generate")
+            assert rv.status_code == 200
+            assert os.path.join(Config.AAZ_DEV_WORKSPACE_FOLDER, ws_name) not in _workspace_sessions._sessions
+
+    @workspace_name("test_workspace_etag")
+    def test_workspace_etag(self, ws_name):
+        with self.app.test_client() as c:
+            rv = c.post(f"/AAZ/Editor/Workspaces", json={
+                "name": ws_name,
+                "plane": PlaneEnum.Mgmt,
+            })
+            assert rv.status_code == 200
+            ws_url = rv.get_json()['url']
+
+            rv = c.get(ws_url)
+            assert rv.status_code == 200
+            etag = rv.headers['ETag']
+            ws = rv.get_json()
+
+            rv = c.get(ws_url, headers={'If-None-Match': etag})
+            assert rv.status_code == 304
+            assert rv.headers['ETag'] == etag
+            rv = c.get(ws_url)
+            assert rv.status_code == 200
+            assert rv.headers['ETag'] == etag
+            assert rv.get_json() == ws
+
+            rv = c.post(f"{ws_url}/CommandTree/Nodes/aaz", json={"name": "edge-order"})
+            assert rv.status_code == 200
+            rv = c.get(ws_url, headers={'If-None-Match': etag})
+            assert rv.status_code == 200
+            assert rv.headers['ETag'] != etag
+            assert 'edge-order' in rv.get_json()['commandTree']['commandGroups']
+            etag = rv.headers['ETag']
+
+            # ws.json is saved by others in the same stat
+            ws_path = os.path.join(rv.get_json()['folder'], 'ws.json')
+            stat = os.stat(ws_path)
+            other = WorkspaceManager(ws_name)
+            other.load()
+            other.rename_command_tree_node("edge-order", new_node_names=["edge-ordex"])
+            other.save()
+            os.utime(ws_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert os.stat(ws_path).st_size == stat.st_size
+            rv = c.get(ws_url, headers={'If-None-Match': etag})
+            assert rv.status_code == 200
+            assert rv.headers['ETag'] != etag
+            assert 'edge-ordex' in rv.get_json()['commandTree']['commandGroups']
+
     @workspace_name("test_workspace_add_swagger")
     def test_workspace_add_swagger(self, ws_name):
         with self.app.test_client() as c:
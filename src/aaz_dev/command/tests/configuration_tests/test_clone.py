@@ -0,0 +1,126 @@
+from unittest import TestCase
+from schematics.models import Model
+from schematics.types import StringType
+from command.model.configuration import CMDObjectSchema, CMDArraySchema, CMDClsSchema, CMDStringSchema, \
+    ModelCloner
+
+
+class ModelClonerTest(TestCase):
+
+    def test_clone_object_schema(self):
+        schema = CMDObjectSchema({
+            "name": "properties",
+            "props": [
+                {
+                    "type": "string",
+                    "name": "location",
+                    "arg": "$location",
+                    "required": True,
+                    "enum": {
+                        "items": [
+                            {"value": "westus"},
+                            {"value": "eastus"},
+                        ]
+                    },
+                },
+                {
+                    "type": "array<string>",
+                    "name": "tags",
+                    "arg": "$tags",
+                    "default": {
+                        "value": ["a", "b"]
+                    },
+                    "item": {
+                        "type": "string",
+                    },
+                },
+                {
+                    "type": "string",
+                    "name": "frozenProp",
+                    "frozen": True,
+                },
+            ],
+        })
+        cloned = ModelCloner.clone(schema)
+        self.assertIsInstance(cloned, CMDObjectSchema)
+        self.assertIsNot(cloned, schema)
+        self.assertEqual(cloned.to_primitive(), schema.__class__(schema.to_primitive()).to_primitive())
+        # frozen props are ignored the same as export
+        self.assertEqual([prop.name for prop in cloned.props], ["location", "tags"])
+
+        # the cloned instance should not share mutable values with the source
+        cloned.props[0].enum.items[0].value = "northus"
+        cloned.props[1].default.value.append("c")
+        self.assertEqual(schema.props[0].enum.items[0].value, "westus")
+        self.assertEqual(schema.props[1].default.value, ["a", "b"])
+
+    def test_clone_reset_implement(self):
+        cls_schema = CMDClsSchema({
+            "type": "@Element",
+            "name": "element",
+        })
+        cls_schema.implement = CMDArraySchema({
+            "type": "array<string>",
+            "name": "elements",
+            "item": {
+                "type": "string",
+            },
+        })
+        cloned = ModelCloner.clone(cls_schema)
+        self.assertIsNone(cloned.implement)
+        self.assertEqual(cloned.type, "@Element")
+        self.assertEqual(cloned.name, "element")
+
+    def test_shallow_clone(self):
+        schema = CMDObjectSchema({
+            "name": "properties",
+            "props": [
+                {
+                    "type": "string",
+                    "name": "location",
+                },
+                {
+                    "type": "string",
+                    "name": "name",
+                },
+            ],
+        })
+        cloned = ModelCloner.shallow_clone(schema)
+        self.assertIsNot(cloned, schema)
+        self.assertIsNot(cloned.props, schema.props)
+        # children models are shared with the source instance
+        self.assertIs(cloned.props[0], schema.props[0])
+
+        cloned.props.pop()
+        cloned.name = "tags"
+        self.assertEqual([prop.name for prop in schema.props], ["location", "name"])
+        self.assertEqual(schema.name, "properties")
+
+    def test_clone_description(self):
+        # the description is dropped by to_primitive, but kept by clone
+        schema = CMDStringSchema({
+            "type": "string",
+            "name": "location",
+        })
+        schema.description = "The location of resource."
+        self.assertNotIn("description", schema.to_primitive())
+        cloned = ModelCloner.clone(schema)
+        self.assertEqual(cloned.description, "The location of resource.")
+
+    def test_clone_transient_attrs(self):
+        class _Model(Model):
+            name = StringType()
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.cache = {}
+
+        model = _Model({"name": "location"})
+        model.cache["key"] = "value"
+        cloned_1 = ModelCloner.clone(model)
+        cloned_2 = ModelCloner.shallow_clone(model)
+        self.assertEqual(cloned_1.name, "location")
+        self.assertEqual(cloned_1.cache, {})
+        self.assertIsNot(cloned_1.cache, cloned_2.cache)
+        cloned_1.cache["key"] = "value"
+        self.assertEqual(cloned_2.cache, {})
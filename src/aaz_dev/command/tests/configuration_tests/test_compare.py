@@ -0,0 +1,68 @@
+from unittest import TestCase
+from command.model.configuration import CMDObjectSchema, CMDClsSchema, CMDDiffLevelEnum, ModelCloner, ModelComparer
+
+
+class ModelComparerTest(TestCase):
+
+    @staticmethod
+    def _build_schema():
+        return CMDObjectSchema({
+            "name": "properties",
+            "props": [
+                {
+                    "type": "string",
+                    "name": "location",
+                    "required": True,
+                    "enum": {
+                        "items": [
+                            {"value": "westus"},
+                            {"value": "eastus"},
+                        ]
+                    },
+                },
+                {
+                    "type": "array<string>",
+                    "name": "tags",
+                    "default": {
+                        "value": ["a", "b"]
+                    },
+                    "item": {
+                        "type": "string",
+                    },
+                },
+            ],
+        })
+
+    def test_compare_schema(self):
+        schema = self._build_schema()
+        other = self._build_schema()
+        self.assertTrue(ModelComparer.equal(schema, other))
+
+        other.props[1].default.value.append("c")
+        self.assertFalse(ModelComparer.equal(schema, other))
+        self.assertTrue(ModelComparer.equal(schema.props[0], other.props[0]))
+
+        other.props[1].default.value.pop()
+        other.props[0].enum.items[0].value = "northus"
+        self.assertFalse(ModelComparer.equal(schema, other))
+
+    def test_compare_ignore_implement(self):
+        cls_schema = CMDClsSchema({
+            "type": "@Element",
+            "name": "element",
+        })
+        cls_schema.implement = self._build_schema()
+        cloned = ModelCloner.clone(cls_schema)
+        self.assertIsNone(cloned.implement)
+        self.assertTrue(ModelComparer.equal(cls_schema, cloned))
+
+    def test_diff_equal_schema(self):
+        schema = self._build_schema()
+        for level in (CMDDiffLevelEnum.BreakingChange, CMDDiffLevelEnum.Structure, CMDDiffLevelEnum.All):
+            self.assertEqual(schema.diff(self._build_schema(), level), {})
+
+        other = self._build_schema()
+        other.props[0].required = False
+        diff = schema.diff(other, CMDDiffLevelEnum.BreakingChange)
+        self.assertEqual(list(diff["props"].keys()), ["location"])
+        self.assertIn("required", diff["props"]["location"])
@@ -0,0 +1,80 @@
+import os
+from unittest import TestCase
+
+from schematics.models import Model
+
+from command.model.configuration import CMDConfiguration, CMDObjectSchema, TrustedModelLoader, XMLSerializer
+
+
+class TrustedModelLoaderTest(TestCase):
+
+    CFG_FOLDER = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+        "cli", "tests", "aaz_generator_tests", "databricks"
+    )
+
+    def assert_model_equal(self, trusted, expected, path="root"):
+        self.assertIs(type(trusted), type(expected), path)
+        if isinstance(expected, Model):
+            self.assertEqual(
+                {k: v for k, v in trusted.__dict__.items() if k != '_data'},
+                {k: v for k, v in expected.__dict__.items() if k != '_data'},
+                path
+            )
+            trusted_data, expected_data = dict(trusted._data), dict(expected._data)
+            self.assertEqual(trusted_data.keys(), expected_data.keys(), path)
+            for key, value in expected_data.items():
+                self.assert_model_equal(trusted_data[key], value, f"{path}.{key}")
+        elif isinstance(expected, list):
+            self.assertEqual(len(trusted), len(expected), path)
+            for idx, value in enumerate(expected):
+                self.assert_model_equal(trusted[idx], value, f"{path}[{idx}]")
+        elif isinstance(expected, dict):
+            self.assertEqual(trusted.keys(), expected.keys(), path)
+            for key, value in expected.items():
+                self.assert_model_equal(trusted[key], value, f"{path}.{key}")
+        else:
+            self.assertEqual(trusted, expected, path)
+
+    def test_load_configurations(self):
+        for file_name in sorted(os.listdir(self.CFG_FOLDER)):
+            if not file_name.endswith(".xml"):
+                continue
+            with open(os.path.join(self.CFG_FOLDER, file_name), 'r') as f:
+                data = XMLSerializer.from_xml(CMDConfiguration, f.read()).to_primitive()
+            cfg = TrustedModelLoader.load(CMDConfiguration, data)
+            self.assert_model_equal(cfg, CMDConfiguration(data), file_name)
+            self.assertEqual(cfg.to_primitive(), data)
+
+    def test_load_with_defaults(self):
+        data = {
+            "type": "object",
+            "name": "properties",
+            "props": [
+                {
+                    "type": "string",
+                    "name": "location",
+                    "required": True,
+                },
+                {
+                    "type": "@Element",
+                    "name": "element",
+                },
+                {
+                    "type": "array<integer32>",
+                    "name": "ports",
+                    "item": {
+                        "type": "integer32",
+                    },
+                },
+            ],
+            "additionalProps": {
+                "item": {
+                    "type": "string",
+                },
+            },
+        }
+        schema = TrustedModelLoader.load(CMDObjectSchema, data)
+        self.assert_model_equal(schema, CMDObjectSchema(data))
+        self.assertIsNone(schema.props[1].implement)
+        schema.validate()
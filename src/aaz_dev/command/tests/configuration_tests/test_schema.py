@@ -436,3 +436,18 @@ class SchemaTest(TestCase):
         prop.to_primitive()
 
         verify_xml(self, prop)
+
+    def test_schema_polymorphic_dispatch(self):
+        schema_field = CMDObjectSchemaBase.props.field
+        self.assertIs(schema_field.find_model({"type": "string", "name": "a"}), CMDStringSchema)
+        self.assertIs(schema_field.find_model({"type": "array<string>", "name": "a"}), CMDArraySchema)
+        self.assertIs(schema_field.find_model({"type": "@Element", "name": "a"}), CMDClsSchema)
+        with self.assertRaises(Exception):
+            # schema requires name
+            schema_field.find_model({"type": "string"})
+
+        schema_base_field = CMDArraySchemaBase.item
+        self.assertIs(schema_base_field.find_model({"type": "string"}), CMDStringSchemaBase)
+        self.assertIs(schema_base_field.find_model({"type": "integer32"}), CMDInteger32SchemaBase)
+        self.assertIs(schema_base_field.find_model({"type": "@Element"}), CMDClsSchemaBase)
+        self.assertIs(schema_base_field.find_model(CMDObjectSchemaBase()), CMDObjectSchemaBase)
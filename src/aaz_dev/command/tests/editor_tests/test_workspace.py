@@ -1,9 +1,12 @@
 from command.controller.workspace_manager import WorkspaceManager
+from command.controller.workspace_arg_index import WorkspaceArgIndex
+from command.controller.workspace_cfg_editor import WorkspaceCfgEditor
 from command.controller.cfg_reader import _SchemaIdxEnum
 from command.tests.common import CommandTestCase, workspace_name
 from utils.plane import PlaneEnum
 import os
 import json
+import stat
 from utils import exceptions
 from swagger.utils.tools import swagger_resource_path_to_resource_id
 from command.model.configuration import *
@@ -39,6 +42,62 @@ class WorkspaceManagerTest(CommandTestCase):
         with self.assertRaises(exceptions.InvalidAPIUsage):
             manager.save()
 
+    @workspace_name("test_workspace_file_mode")
+    def test_workspace_file_mode(self, ws_name):
+        manager = WorkspaceManager.new(ws_name, plane=PlaneEnum.Mgmt)
+        manager.save()
+        # the new file is created in the same mode as by open
+        default_path = os.path.join(manager.folder, "default.txt")
+        with open(default_path, 'w'):
+            pass
+        assert stat.S_IMODE(os.stat(manager.path).st_mode) == stat.S_IMODE(os.stat(default_path).st_mode)
+
+        # the mode of existing file is kept
+        os.chmod(manager.path, 0o640)
+        manager.save()
+        assert stat.S_IMODE(os.stat(manager.path).st_mode) == 0o640
+
+    @workspace_name("test_list_workspaces")
+    def test_list_workspaces(self, ws_name):
+        manager = WorkspaceManager.new(ws_name, plane=PlaneEnum.Mgmt)
+        manager.create_command_tree_nodes("edge-order", "address")
+        manager.save()
+
+        workspaces = WorkspaceManager.list_workspaces()
+        assert len(workspaces) == 1
+        ws = workspaces[0]
+        assert ws['name'] == ws_name
+        assert ws['folder'] == manager.folder
+        assert ws['plane'] == PlaneEnum.Mgmt
+        assert ws['updated'] == os.path.getmtime(manager.path)
+        assert ws['commandCount'] == 0
+        assert ws['resources'] == []
+
+        # workspace modified without index
+        with open(manager.path, 'r') as f:
+            data = json.load(f)
+        data['commandTree']['commandGroups']['edge-order']['commandGroups']['address']['commands'] = {
+            "list": {
+                "names": ["edge-order", "address", "list"],
+                "stage": "Stable",
+                "help": {"short": "List addresses."},
+                "version": "2021-12-01",
+                "resources": [{"id": "/subscriptions/{}/providers/microsoft.edgeorder/addresses", "version": "2021-12-01"}],
+            }
+        }
+        with open(manager.path, 'w') as f:
+            json.dump(data, f)
+        os.utime(manager.path, (ws['updated'] + 1, ws['updated'] + 1))
+        ws = WorkspaceManager.list_workspaces()[0]
+        assert ws['commandCount'] == 1
+        assert ws['resources'] == [{"id": "/subscriptions/{}/providers/microsoft.edgeorder/addresses", "version": "2021-12-01"}]
+
+        new_name = f"{ws_name}_renamed"
+        manager.rename(new_name)
+        assert [ws['name'] for ws in WorkspaceManager.list_workspaces()] == [new_name]
+        manager.delete()
+        assert WorkspaceManager.list_workspaces() == []
+
 
 class WorkspaceEditorTest(CommandTestCase):
 
@@ -83,6 +142,46 @@ class WorkspaceEditorTest(CommandTestCase):
         assert manager.load_cfg_editor_by_command(address_cg.commands['delete'])
         assert manager.load_cfg_editor_by_command(address_cg.commands['update'])
 
+    @workspace_name("test_workspace_editor_save_changed_cfgs")
+    def test_workspace_editor_save_changed_cfgs(self, ws_name):
+        manager = WorkspaceManager.new(ws_name, plane=PlaneEnum.Mgmt)
+        manager.add_new_resources_by_swagger(
+            mod_names="edgeorder",
+            version='2021-12-01',
+            resources=[
+                {
+                    "id": swagger_resource_path_to_resource_id('/subscriptions/{subscriptionId}/providers/Microsoft.EdgeOrder/addresses'),
+                },
+                {
+                    "id": swagger_resource_path_to_resource_id('/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.EdgeOrder/addresses/{addressName}'),
+                }
+            ]
+        )
+        manager.save()
+
+        def get_cfg_files_stat():
+            stats = {}
+            for resource in manager.get_resources():
+                path = WorkspaceCfgEditor.get_cfg_path(manager.folder, resource.id)
+                stat = os.stat(path)
+                stats[resource.id] = (stat.st_ino, stat.st_mtime_ns)
+            return stats
+
+        pre_stats = get_cfg_files_stat()
+        leaf = manager.find_command_tree_leaf('edge-order', 'address', 'create')
+        cfg_editor = manager.load_cfg_editor_by_command(leaf)
+        cfg_editor.update_command_confirmation(*leaf.names, confirmation="Are you sure?")
+        manager.save()
+
+        stats = get_cfg_files_stat()
+        changed = {resource_id for resource_id, stat in stats.items() if pre_stats[resource_id] != stat}
+        assert changed == {leaf.resources[0].id}
+
+        manager = WorkspaceManager(ws_name)
+        manager.load()
+        cfg_editor = manager.load_cfg_editor_by_command(leaf)
+        assert cfg_editor.find_command(*leaf.names).confirmation == "Are you sure?"
+
     @workspace_name("test_workspace_editor_subresource")
     def test_workspace_editor_subresource(self, ws_name):
 
@@ -607,3 +706,114 @@ class WorkspaceEditorTest(CommandTestCase):
         self.assertEqual(instance_update.ref, '$Subresource')
         self.assertEqual(instance_create.json.schema.name, 'endpoint.properties.originGroups[].properties.origins[]')
         self.assertEqual(update_command.outputs[0].ref, '$Subresource')
+
+
+class WorkspaceCfgEditorTest(CommandTestCase):
+
+    CFG_FOLDER = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+        "cli", "tests", "aaz_generator_tests", "databricks"
+    )
+
+    def load_cfg(self, file_name):
+        with open(os.path.join(self.CFG_FOLDER, file_name), 'r') as f:
+            return XMLSerializer.from_xml(CMDConfiguration, f.read())
+
+    def load_list_cfg(self, idx):
+        # split the list command of workspaces by the list operation of subscription or resource group
+        cfg = self.load_cfg("workspace-list.xml")
+        cfg.resources = [cfg.resources[idx]]
+        command = cfg.command_groups[0].commands[0]
+        command.resources = [command.resources[idx]]
+        command.conditions = None
+        operation = command.operations[idx]
+        operation.when = None
+        # the schema classes are defined in the response of the first operation
+        operation.http.responses = command.operations[0].http.responses
+        command.operations = [operation]
+        return cfg
+
+    def test_merge(self):
+        main_cfg = self.load_list_cfg(1)
+        delete_command = self.load_cfg("workspace-crud.xml").command_groups[0].commands[1]
+        self.assertEqual(delete_command.name, "delete")
+        # the args not in order are reordered by reformat
+        delete_command.arg_groups[0].args = delete_command.arg_groups[0].args[::-1]
+        main_cfg.command_groups[0].commands.append(delete_command)
+        main_editor = WorkspaceCfgEditor(main_cfg)
+        plus_editor = WorkspaceCfgEditor(self.load_list_cfg(0))
+        main_data = main_editor.cfg.to_primitive()
+        plus_data = plus_editor.cfg.to_primitive()
+
+        merged_editor = main_editor.merge(plus_editor)
+        self.assertIsNotNone(merged_editor)
+        list_command = merged_editor.find_command("databricks", "workspace", "list")
+        self.assertEqual([op.operation_id for op in list_command.operations], [
+            "Workspaces_ListBySubscription", "Workspaces_ListByResourceGroup"
+        ])
+        self.assertEqual(len(list_command.conditions), 2)
+        self.assertEqual({arg.var: arg.required for arg in list_command.arg_groups[0].args}, {
+            "$Path.resourceGroupName": False,
+            "$Path.subscriptionId": True,
+        })
+        self.assertEqual(len(merged_editor.cfg.resources), 2)
+
+        # the source editors are not changed by merge
+        self.assertEqual(main_editor.cfg.to_primitive(), main_data)
+        self.assertEqual(plus_editor.cfg.to_primitive(), plus_data)
+        self.assertIs(merged_editor.find_command("databricks", "workspace", "delete"), delete_command)
+
+
+class WorkspaceArgIndexTest(CommandTestCase):
+
+    def load_cfg_editor(self):
+        with open(os.path.join(WorkspaceCfgEditorTest.CFG_FOLDER, "workspace-crud.xml"), 'r') as f:
+            return WorkspaceCfgEditor(XMLSerializer.from_xml(CMDConfiguration, f.read()))
+
+    def test_arg_index_update_cfg(self):
+        cfg_editor = self.load_cfg_editor()
+        index = WorkspaceArgIndex()
+        index.update_cfg(cfg_editor)
+        self.assertTrue(index.has_resource(cfg_editor.resources[0].id))
+
+        entries = [*index.iter_args_by_var("$Path.workspaceName")]
+        self.assertEqual(
+            sorted(cmd_names for cmd_names, _, _ in entries),
+            [("databricks", "workspace", name) for name in ("create", "delete", "show", "update")]
+        )
+
+        # the index is not changed by the modifications of cfg
+        arg, _ = cfg_editor.find_arg_by_var("databricks", "workspace", "show", arg_var="$Path.workspaceName")
+        arg.options = ["changed"]
+        for _, indexed_arg, _ in index.iter_args_by_var("$Path.workspaceName"):
+            self.assertIsNot(indexed_arg, arg)
+            self.assertNotIn("changed", indexed_arg.options)
+
+        index.update_cfg(cfg_editor)
+        self.assertIn(["changed"], [a.options for _, a, _ in index.iter_args_by_var("$Path.workspaceName")])
+
+        index.remove_resources(cfg_editor.resources[0].id)
+        self.assertEqual([*index.iter_args_by_var("$Path.workspaceName")], [])
+
+    @workspace_name("test_find_similar_args")
+    def test_find_similar_args(self, ws_name):
+        manager = WorkspaceManager.new(ws_name, plane=PlaneEnum.Mgmt)
+        cfg_editor = self.load_cfg_editor()
+        manager.add_cfg(cfg_editor)
+        manager.save()
+
+        arg, _ = cfg_editor.find_arg_by_var("databricks", "workspace", "show", arg_var="$Path.workspaceName")
+        origin_arg = ModelCloner.clone(arg)
+        # modify the saved cfg without saving
+        arg.options = ["changed"]
+
+        other_manager = WorkspaceManager(ws_name)
+        other_manager.load()
+        results = other_manager.find_similar_args("databricks", "workspace", "show", arg=origin_arg)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[("databricks", "workspace", "show")], {"$Path.workspaceName": ["workspace-name"]})
+
+        # the modifications not saved are used by its own workspace
+        results = manager.find_similar_args("databricks", "workspace", "show", arg=origin_arg)
+        self.assertEqual(len(results), 3)
+        self.assertNotIn(("databricks", "workspace", "show"), results)
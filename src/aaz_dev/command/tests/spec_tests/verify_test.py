@@ -0,0 +1,159 @@
+import json
+import os
+import shutil
+import subprocess
+
+from click.testing import CliRunner
+
+from command.api._cmds import bp
+from command.controller.cfg_reader import CfgReader
+from command.controller.cfg_validator import CfgValidator
+from command.controller.specs_manager import AAZSpecsManager
+from command.model.configuration import CMDConfiguration, CMDHelp, XMLSerializer
+from command.tests.common import CommandTestCase
+from utils import exceptions
+
+
+class AAZSpecVerifyTest(CommandTestCase):
+
+    CFG_FOLDER = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+        "cli", "tests", "aaz_generator_tests", "databricks"
+    )
+
+    def load_cfg(self, file_name):
+        with open(os.path.join(self.CFG_FOLDER, file_name), 'r') as f:
+            return XMLSerializer.from_xml(CMDConfiguration, f.read())
+
+    def setUp(self):
+        super().setUp()
+        manager = AAZSpecsManager()
+        self.crud_cfg = self.load_cfg("workspace-crud.xml")
+        self.list_cfg = self.load_cfg("workspace-list.xml")
+        manager.update_resource_cfg(self.crud_cfg)
+        manager.update_resource_cfg(self.list_cfg)
+        for group in manager.iter_command_groups():
+            group.help = CMDHelp({"short": f"Manage {' '.join(group.names)}."})
+            manager._modified_command_groups.add(tuple(group.names))
+        for command in manager.iter_commands():
+            command.help = CMDHelp({"short": f"Run {' '.join(command.names)}."})
+            manager._modified_commands.add(tuple(command.names))
+        manager.save()
+        AAZSpecsManager.wait_xml_sidecars()
+        self.manager = AAZSpecsManager()
+
+    def get_json_path(self, cfg, idx=0):
+        resource = cfg.resources[idx]
+        json_path, _ = self.manager.get_resource_cfg_file_paths(cfg.plane, resource.id, resource.version)
+        return json_path
+
+    def get_ref_path(self, cfg, idx):
+        resource = cfg.resources[idx]
+        return self.manager.get_resource_cfg_ref_file_path(cfg.plane, resource.id, resource.version)
+
+    def invoke_verify(self, *args):
+        return CliRunner().invoke(bp.cli, ["verify", "-a", self.AAZ_FOLDER, *args])
+
+    def test_verify_outputs(self):
+        self.assertTrue(CfgValidator(CfgReader(self.crud_cfg)).verify(strict=True))
+
+        command = self.crud_cfg.command_groups[0].commands[0]
+        command.outputs[0].ref = "$NotExist"
+        with self.assertRaises(exceptions.VerificationError) as cm:
+            CfgValidator(CfgReader(self.crud_cfg)).verify(strict=True)
+        self.assertEqual(cm.exception.payload['details'], {
+            f"databricks workspace {command.name}": ["Output refers to undefined variant '$NotExist'."]
+        })
+
+        # the errors are reported as warnings when the cfg is exported
+        with self.assertLogs('backend', level='WARNING') as cm:
+            self.assertFalse(CfgValidator(CfgReader(self.crud_cfg)).verify())
+        self.assertIn("$NotExist", cm.output[0])
+        AAZSpecsManager().update_resource_cfg(self.crud_cfg)
+
+    def test_verify_instance_outputs(self):
+        # the output of delete command refers to the instance of command, which is not defined by its responses
+        cfg = self.load_cfg("sentinel-automation-rule-crud.xml")
+        self.assertTrue(CfgValidator(CfgReader(cfg)).verify(strict=True))
+        manager = AAZSpecsManager()
+        manager.update_resource_cfg(cfg)
+        resource = cfg.resources[0]
+        self.assertIsNotNone(manager.load_resource_cfg_reader(cfg.plane, resource.id, resource.version))
+
+    def test_verify_resource_cfg_file(self):
+        file_paths = [*self.manager.iter_resource_cfg_json_paths(), *self.manager.iter_resource_cfg_ref_paths()]
+        self.assertEqual(sorted(file_paths), sorted([
+            self.get_json_path(self.crud_cfg), self.get_json_path(self.list_cfg), self.get_ref_path(self.list_cfg, 1)
+        ]))
+        for file_path in file_paths:
+            self.assertEqual(self.manager.verify_resource_cfg_file(file_path), [], file_path)
+
+        # the json file is not in the path of its resource
+        json_path = self.get_json_path(self.list_cfg)
+        other_json_path = os.path.join(os.path.dirname(os.path.dirname(json_path)), "2018-04-01.json")
+        shutil.copy(self.get_json_path(self.crud_cfg), json_path)
+        errors = self.manager.verify_resource_cfg_file(json_path)
+        self.assertIn(
+            f"The first resource '{self.crud_cfg.resources[0].id}' '2018-04-01' doesn't match the file path.", errors)
+
+        # the referenced json file is removed
+        os.remove(json_path)
+        errors = self.manager.verify_resource_cfg_file(self.get_ref_path(self.list_cfg, 1))
+        self.assertEqual(errors, [f"Referenced resource '{self.list_cfg.resources[0].id}' '2018-04-01' not exist: "
+                                  f"{json_path}"])
+
+        self.assertEqual(
+            self.manager.verify_resource_cfg_file(other_json_path),
+            [f"ValueError: Invalid resource cfg file path: {other_json_path}"]
+        )
+
+    def test_verify_command_tree_resources(self):
+        self.assertEqual(self.manager.verify_command_tree_resources(), {})
+
+        os.remove(self.get_json_path(self.crud_cfg))
+        os.remove(self.get_json_path(self.crud_cfg)[:-5] + ".xml")
+        details = self.manager.verify_command_tree_resources()
+        self.assertEqual(sorted(details.keys()), sorted(
+            f"databricks workspace {command.name}" for command in self.crud_cfg.command_groups[0].commands
+        ))
+        for errors in details.values():
+            self.assertEqual(errors, [
+                f"Resource cfg of version '2018-04-01' not exist: {self.get_json_path(self.crud_cfg)}"
+            ])
+
+    def test_get_changed_resource_cfg_paths(self):
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=test", "-c", "user.email=test@test.com", *args],
+                cwd=self.AAZ_FOLDER, capture_output=True, check=True
+            )
+
+        git("init")
+        git("add", "-A")
+        git("commit", "-m", "init")
+        self.assertEqual(self.manager.get_changed_resource_cfg_paths("HEAD"), [])
+
+        # modified, untracked and removed files
+        json_path = self.get_json_path(self.crud_cfg)
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        with open(json_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        ref_path = self.get_ref_path(self.list_cfg, 1)
+        new_ref_path = os.path.join(os.path.dirname(ref_path), "2020-01-01.md")
+        shutil.copy(ref_path, new_ref_path)
+        os.remove(ref_path)
+        self.assertEqual(self.manager.get_changed_resource_cfg_paths("HEAD"), sorted([json_path, new_ref_path]))
+
+        with self.assertRaises(ValueError):
+            self.manager.get_changed_resource_cfg_paths("not-exist-ref")
+
+    def test_verify_command(self):
+        result = self.invoke_verify("-w", "1")
+        self.assertEqual(result.exit_code, 0, result.output)
+        result = self.invoke_verify("-w", "2")
+        self.assertEqual(result.exit_code, 0, result.output)
+
+        os.remove(self.get_ref_path(self.list_cfg, 1))
+        result = self.invoke_verify("-w", "1")
+        self.assertEqual(result.exit_code, 1, result.output)
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from command.api._cmds import bp
+from command.controller.specs_manager import AAZSpecsManager
+from command.model.configuration import CMDConfiguration, CMDHelp, XMLSerializer
+from command.tests.common import CommandTestCase
+from utils.config import Config
+
+
+class AAZSpecXMLSidecarTest(CommandTestCase):
+
+    CFG_FOLDER = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+        "cli", "tests", "aaz_generator_tests", "databricks"
+    )
+
+    SRC_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))))
+
+    def setUp(self):
+        super().setUp()
+        self.defer_xml_sidecar = Config.DEFER_XML_SIDECAR
+        self.addCleanup(setattr, Config, "DEFER_XML_SIDECAR", self.defer_xml_sidecar)
+
+    def load_cfg(self, file_name):
+        with open(os.path.join(self.CFG_FOLDER, file_name), 'r') as f:
+            return XMLSerializer.from_xml(CMDConfiguration, f.read())
+
+    def save_cfg(self, file_name):
+        manager = AAZSpecsManager()
+        cfg = self.load_cfg(file_name)
+        manager.update_resource_cfg(cfg)
+        for group in manager.iter_command_groups():
+            group.help = CMDHelp({"short": f"Manage {' '.join(group.names)}."})
+            manager._modified_command_groups.add(tuple(group.names))
+        for command in manager.iter_commands():
+            command.help = CMDHelp({"short": f"Run {' '.join(command.names)}."})
+            manager._modified_commands.add(tuple(command.names))
+        manager.save()
+        resource = cfg.resources[0]
+        json_path, xml_path = manager.get_resource_cfg_file_paths(cfg.plane, resource.id, resource.version)
+        return cfg, json_path, xml_path
+
+    def test_deferred_xml_sidecar(self):
+        Config.DEFER_XML_SIDECAR = True
+        cfg, json_path, xml_path = self.save_cfg("workspace-crud.xml")
+        self.assertTrue(os.path.isfile(json_path))
+
+        AAZSpecsManager.wait_xml_sidecars()
+        self.assertFalse(AAZSpecsManager.is_xml_sidecar_stale(json_path))
+        with open(xml_path, 'r') as f:
+            self.assertEqual(f.read(), AAZSpecsManager.render_resource_cfg_to_xml(cfg))
+
+        # the xml file is removed with the json file
+        os.remove(json_path)
+        AAZSpecsManager.defer_sync_xml_sidecar(json_path)
+        AAZSpecsManager.wait_xml_sidecars()
+        self.assertFalse(os.path.exists(xml_path))
+
+    def test_deferred_xml_sidecar_at_exit(self):
+        Config.DEFER_XML_SIDECAR = True
+        _, json_path, xml_path = self.save_cfg("workspace-list.xml")
+        AAZSpecsManager.wait_xml_sidecars()
+        os.remove(xml_path)
+
+        # the pending xml file is synced before the process exits
+        script = "\n".join([
+            "import sys",
+            "from command.controller.specs_manager import AAZSpecsManager",
+            "AAZSpecsManager.defer_sync_xml_sidecar(sys.argv[1])",
+        ])
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([self.SRC_FOLDER, os.path.join(self.SRC_FOLDER, "aaz_dev")])}
+        result = subprocess.run([sys.executable, "-c", script, json_path], capture_output=True, text=True, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(os.path.isfile(xml_path))
+        self.assertFalse(AAZSpecsManager.is_xml_sidecar_stale(json_path))
+
+    def test_render_xml(self):
+        Config.DEFER_XML_SIDECAR = True
+        cfg, json_path, xml_path = self.save_cfg("vnet-peering-crud.xml")
+        AAZSpecsManager.wait_xml_sidecars()
+        os.remove(xml_path)
+
+        runner = CliRunner()
+        result = runner.invoke(bp.cli, ["render-xml", "-a", self.AAZ_FOLDER])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(xml_path, 'r') as f:
+            self.assertEqual(f.read(), AAZSpecsManager.render_resource_cfg_to_xml(cfg))
+
+        # the xml files which are newer than their json files are kept without --force
+        with open(xml_path, 'w') as f:
+            f.write("outdated")
+        result = runner.invoke(bp.cli, ["render-xml", "-a", self.AAZ_FOLDER])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(xml_path, 'r') as f:
+            self.assertEqual(f.read(), "outdated")
+
+        result = runner.invoke(bp.cli, ["render-xml", "-a", self.AAZ_FOLDER, "--force"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(xml_path, 'r') as f:
+            self.assertEqual(f.read(), AAZSpecsManager.render_resource_cfg_to_xml(cfg))
@@ -0,0 +1,3 @@
+def register_blueprints(app):
+    from . import jobs
+    app.register_blueprint(jobs.bp)
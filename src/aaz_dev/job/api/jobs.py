@@ -0,0 +1,97 @@
+import json
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context, url_for
+
+from utils import exceptions
+from utils.listing import NDJSON_MIMETYPE
+from ..controller.job_manager import JobManager
+
+bp = Blueprint('jobs', __name__, url_prefix='/Jobs')
+
+_job_manager = JobManager()
+
+
+def shutdown_jobs():
+    """Cancel the pending jobs and wait for the running jobs of current process to finish."""
+    _job_manager.shutdown()
+
+
+def is_job_requested():
+    """Whether the client asks to run the operation as a job by `Prefer: respond-async` header or `async` argument.
+    The endpoints keep their synchronous responses when it's not requested.
+    """
+    if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return 'respond-async' in request.headers.get('Prefer', '')
+
+
+def job_response(func, *args, **kwargs):
+    """Run `func(*args, **kwargs)` by a job named by the request, and return the job with 202 status code. The job can
+    be polled from the url in `Location` header.
+    """
+    job = _job_manager.submit(f"{request.method} {request.path}", func, *args, **kwargs)
+    response = jsonify(_job_to_primitive(job))
+    response.status_code = 202
+    response.headers['Location'] = url_for('jobs.get_job', job_id=job.id)
+    return response
+
+
+def _job_to_primitive(job, since=0):
+    result = job.to_primitive(since=since)
+    result['url'] = url_for('jobs.get_job', job_id=job.id)
+    return result
+
+
+def _get_since():
+    since = request.args.get('since', 0, type=int)
+    if since < 0:
+        raise exceptions.InvalidAPIUsage(f"Invalid since: {since}")
+    return since
+
+
+def _get_job(job_id):
+    job = _job_manager.get(job_id)
+    if job is None:
+        raise exceptions.ResourceNotFind(f"Job not find: '{job_id}'")
+    return job
+
+
+@bp.route("", methods=("GET",))
+def list_jobs():
+    result = []
+    for job in _job_manager.list():
+        result.append({
+            "id": job.id,
+            "name": job.name,
+            "state": job.state,
+            "created": job.created,
+            "finished": job.finished,
+            "url": url_for('jobs.get_job', job_id=job.id),
+        })
+    return jsonify(result)
+
+
+@bp.route("/<job_id>", methods=("GET",))
+def get_job(job_id):
+    # only the events after `since` are returned, so the progress can be polled incrementally
+    job = _get_job(job_id)
+    return jsonify(_job_to_primitive(job, since=_get_since()))
+
+
+@bp.route("/<job_id>/Cancel", methods=("POST",))
+def cancel_job(job_id):
+    job = _job_manager.cancel(job_id)
+    return jsonify(_job_to_primitive(job))
+
+
+@bp.route("/<job_id>/Events", methods=("GET",))
+def stream_job_events(job_id):
+    # stream the events in NDJSON until the job finished, the last event is the final state of job
+    _get_job(job_id)
+    since = _get_since()
+
+    def generate():
+        for event in _job_manager.iter_events(job_id, since=since):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
@@ -0,0 +1,346 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import exceptions
+from utils.config import Config
+from utils.files import write_file_atomically
+
+logger = logging.getLogger('backend')
+
+_current = threading.local()
+
+
+class JobState:
+    Pending = "Pending"
+    Running = "Running"
+    Succeeded = "Succeeded"
+    Failed = "Failed"
+    Cancelled = "Cancelled"
+
+    FINISHED = (Succeeded, Failed, Cancelled)
+
+
+class JobCancelled(Exception):
+    """Raised in the operation of a cancelled job by `report_progress`."""
+
+
+def get_current_job():
+    """Return the job run by current thread, or None if the operation is not run by a job."""
+    return getattr(_current, 'job', None)
+
+
+def report_progress(message, **kwargs):
+    """Add a progress event to the job run by current thread, it's ignored when the operation is not run by a job.
+
+    It raises `JobCancelled` when the job is cancelled, so it should be called before the steps which could be
+    abandoned, such as the steps before the changes are saved.
+    """
+    job = get_current_job()
+    if job is None:
+        return
+    if job.is_cancel_requested():
+        raise JobCancelled()
+    job.add_event(message, **kwargs)
+
+
+class Job:
+    """A long-running operation run by the workers of `JobManager`.
+
+    The state of job is saved in `Config.AAZ_DEV_JOB_FOLDER` when it's updated, so the jobs can be polled from the
+    other processes of server. The events are appended to a separate file, so that adding an event doesn't rewrite the
+    events added before. A job is cancelled by a cancel file when it's run by other process.
+    """
+
+    _ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+    def __init__(self, name, job_id=None):
+        self.id = job_id or uuid.uuid4().hex
+        self.name = name
+        self.state = JobState.Pending
+        self.pid = os.getpid()
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.events = []
+        self.result = None
+        self.error = None
+        self._cancel_requested = False
+        self._condition = threading.Condition()
+        self._future = None
+
+    @classmethod
+    def get_path(cls, job_id):
+        return os.path.join(Config.AAZ_DEV_JOB_FOLDER, f"{job_id}.json")
+
+    @classmethod
+    def get_events_path(cls, job_id):
+        return os.path.join(Config.AAZ_DEV_JOB_FOLDER, f"{job_id}.events")
+
+    @classmethod
+    def get_cancel_path(cls, job_id):
+        return os.path.join(Config.AAZ_DEV_JOB_FOLDER, f"{job_id}.cancel")
+
+    @classmethod
+    def is_valid_id(cls, job_id):
+        return bool(cls._ID_PATTERN.match(job_id))
+
+    @classmethod
+    def load(cls, job_id):
+        """Load the job saved by other process, return None if it's not exist."""
+        if not cls.is_valid_id(job_id):
+            return None
+        try:
+            with open(cls.get_path(job_id), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        job = cls(data['name'], job_id=data['id'])
+        job.state = data['state']
+        job.pid = data['pid']
+        job.created = data['created']
+        job.started = data['started']
+        job.finished = data['finished']
+        job.events = cls._load_events(job_id)
+        job.result = data['result']
+        job.error = data['error']
+        if job.state not in JobState.FINISHED and not _is_process_alive(job.pid):
+            # the process running the job is exited
+            job.state = JobState.Failed
+            job.error = {"message": "The job is interrupted because its server process exited", "status": 500}
+        return job
+
+    @classmethod
+    def _load_events(cls, job_id):
+        events = []
+        try:
+            with open(cls.get_events_path(job_id), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        # the event is being appended by other process
+                        break
+                    events.append(json.loads(line))
+        except FileNotFoundError:
+            pass
+        return events
+
+    @property
+    def is_finished(self):
+        return self.state in JobState.FINISHED
+
+    def to_primitive(self, since=0):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "events": self.events[since:],
+            "result": self.result,
+            "error": self.error,
+        }
+
+    def save(self):
+        """Save the state of job, the events are saved by `_append_event`."""
+        data = self.to_primitive()
+        del data['events']
+        data['pid'] = self.pid
+        write_file_atomically(self.get_path(self.id), json.dumps(data, ensure_ascii=False))
+
+    def _append_event(self, event):
+        self.events.append(event)
+        with open(self.get_events_path(self.id), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    def add_event(self, message, **kwargs):
+        with self._condition:
+            self._append_event({"seq": len(self.events), "time": time.time(), "message": message, **kwargs})
+            self._condition.notify_all()
+
+    def wait(self, since, timeout):
+        """Wait for the events after `since` or the job finished. The job loaded from other process is not updated,
+        so it's required to be loaded again after waited.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self.events) > since or self.is_finished, timeout=timeout)
+
+    def cancel(self):
+        """Request to cancel the job. The pending job is cancelled directly, the running job is cancelled when it
+        reports the progress next time.
+        """
+        if self.is_finished:
+            return
+        if self._future is None:
+            # the job is run by other process
+            with open(self.get_cancel_path(self.id), 'w'):
+                pass
+            return
+        self._cancel_requested = True
+        if self._future.cancel():
+            self.set_state(JobState.Cancelled)
+
+    def is_cancel_requested(self):
+        return self._cancel_requested or os.path.exists(self.get_cancel_path(self.id))
+
+    def set_state(self, state, result=None, error=None):
+        with self._condition:
+            now = time.time()
+            if state == JobState.Running:
+                self.started = now
+            elif state in JobState.FINISHED:
+                self.finished = now
+                self.result = result
+                self.error = error
+            self.state = state
+            # the event is appended before the state is saved, so the events are complete when the job is finished
+            self._append_event({"seq": len(self.events), "time": now, "message": state, "state": state})
+            self.save()
+            self._condition.notify_all()
+        if self.is_finished and os.path.exists(self.get_cancel_path(self.id)):
+            os.remove(self.get_cancel_path(self.id))
+
+
+class JobManager:
+    """Run the long-running operations by a pool of worker threads. The finished jobs are kept for
+    `Config.JOB_RETENTION` seconds.
+    """
+
+    POLL_INTERVAL = 0.5
+
+    def __init__(self):
+        self._executor = None
+        self._jobs = {}  # job id -> Job run by current process
+        self._lock = threading.Lock()
+
+    def submit(self, name, func, *args, **kwargs):
+        """Run `func(*args, **kwargs)` by a job. Its return value is saved as the result of job, so it should be json
+        serializable.
+        """
+        job = Job(name)
+        os.makedirs(Config.AAZ_DEV_JOB_FOLDER, exist_ok=True)
+        job.save()
+        with self._lock:
+            self._evict_finished_jobs()
+            self._jobs[job.id] = job
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=Config.JOB_WORKERS, thread_name_prefix="aaz-job")
+            job._future = self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        job = self._jobs.get(job_id, None)
+        if job is None:
+            job = Job.load(job_id)
+        return job
+
+    def list(self):
+        jobs = []
+        if os.path.isdir(Config.AAZ_DEV_JOB_FOLDER):
+            for file_name in os.listdir(Config.AAZ_DEV_JOB_FOLDER):
+                if file_name.endswith('.json'):
+                    job = self.get(file_name[:-5])
+                    if job is not None:
+                        jobs.append(job)
+        return sorted(jobs, key=lambda j: j.created, reverse=True)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            raise exceptions.ResourceNotFind(f"Job not find: '{job_id}'")
+        if job.is_finished:
+            raise exceptions.ResourceConflict(f"Job is already finished: '{job_id}'")
+        job.cancel()
+        return job
+
+    def shutdown(self):
+        """Cancel the pending jobs and wait for the running jobs to finish. It's called before the server process
+        exits, because the running jobs can't be interrupted after they start to save files.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            jobs = [*self._jobs.values()]
+        if executor is None:
+            return
+        for job in jobs:
+            if job.state == JobState.Pending:
+                job.cancel()
+        executor.shutdown(wait=True)
+
+    def iter_events(self, job_id, since=0):
+        """Yield the events of job after `since` until the job finished."""
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                return
+            events = job.events[since:]
+            since += len(events)
+            yield from events
+            if job.is_finished:
+                return
+            job.wait(since, timeout=self.POLL_INTERVAL)
+
+    @staticmethod
+    def _run(job, func, args, kwargs):
+        _current.job = job
+        try:
+            if job.is_cancel_requested():
+                raise JobCancelled()
+            job.set_state(JobState.Running)
+            result = func(*args, **kwargs)
+        except JobCancelled:
+            logger.info(f"Job cancelled: {job.id} {job.name}")
+            job.set_state(JobState.Cancelled)
+        except exceptions.InvalidAPIUsage as err:
+            job.set_state(JobState.Failed, error={**err.to_dict(), "status": err.status_code})
+        except Exception as err:
+            logger.exception(f"Job failed: {job.id} {job.name}")
+            job.set_state(JobState.Failed, error={"message": str(err), "status": 500})
+        else:
+            job.set_state(JobState.Succeeded, result=result)
+        finally:
+            _current.job = None
+
+    def _evict_finished_jobs(self):
+        expired = time.time() - Config.JOB_RETENTION
+        for job_id, job in [*self._jobs.items()]:
+            if job.is_finished and job.finished < expired:
+                del self._jobs[job_id]
+        for file_name in os.listdir(Config.AAZ_DEV_JOB_FOLDER):
+            job_id, ext = os.path.splitext(file_name)
+            if ext != '.json':
+                continue
+            try:
+                job = self.get(job_id)
+                if job is None or not job.is_finished:
+                    continue
+                # the job interrupted by its exited process is not updated since its file is saved
+                finished = job.finished or os.path.getmtime(Job.get_path(job_id))
+                if finished >= expired:
+                    continue
+                for path in (Job.get_path(job_id), Job.get_events_path(job_id), Job.get_cancel_path(job_id)):
+                    if os.path.exists(path):
+                        os.remove(path)
+            except (OSError, ValueError, KeyError):
+                pass
+
+
+def _is_process_alive(pid):
+    if pid == os.getpid():
+        # the job is not kept by current process
+        return False
+    if os.name == 'nt':
+        # signal 0 is CTRL_C_EVENT on windows, where the server runs in a single process
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
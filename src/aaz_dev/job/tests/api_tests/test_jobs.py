@@ -0,0 +1,205 @@
+import json
+import os
+import threading
+import time
+
+from app.tests.common import ApiTestCase
+from job.api.jobs import _job_manager
+from job.controller.job_manager import Job, JobState, report_progress
+from utils import exceptions
+from utils.config import Config
+from utils.plane import PlaneEnum
+
+
+class JobApiTestCase(ApiTestCase):
+
+    def wait_job(self, c, url, timeout=30):
+        start = time.time()
+        while True:
+            rv = c.get(url)
+            self.assertEqual(rv.status_code, 200)
+            job = rv.get_json()
+            if job['state'] in JobState.FINISHED:
+                return job
+            self.assertLess(time.time() - start, timeout)
+            time.sleep(0.05)
+
+    def test_job(self):
+        def operation(count):
+            for idx in range(count):
+                report_progress(f"step {idx}", current=idx, total=count)
+            return {"count": count}
+
+        with self.app.test_client() as c:
+            job = _job_manager.submit("test", operation, 3)
+            job_url = f"/Jobs/{job.id}"
+            data = self.wait_job(c, job_url)
+            self.assertEqual(data['state'], JobState.Succeeded)
+            self.assertEqual(data['result'], {"count": 3})
+            self.assertEqual(data['error'], None)
+            self.assertEqual(
+                [e['message'] for e in data['events']],
+                [JobState.Running, "step 0", "step 1", "step 2", JobState.Succeeded]
+            )
+            self.assertEqual([e['seq'] for e in data['events']], [*range(5)])
+
+            rv = c.get(f"{job_url}?since=3")
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual([e['seq'] for e in rv.get_json()['events']], [3, 4])
+
+            rv = c.get(f"{job_url}/Events?since=1")
+            self.assertEqual(rv.status_code, 200)
+            events = [json.loads(line) for line in rv.get_data(as_text=True).splitlines()]
+            self.assertEqual([e['seq'] for e in events], [1, 2, 3, 4])
+            self.assertEqual(events[-1]['state'], JobState.Succeeded)
+
+            rv = c.get("/Jobs")
+            self.assertEqual(rv.status_code, 200)
+            self.assertIn(job_url, [j['url'] for j in rv.get_json()])
+
+            rv = c.post(f"{job_url}/Cancel")
+            self.assertEqual(rv.status_code, 409)
+
+            rv = c.get("/Jobs/00000000000000000000000000000000")
+            self.assertEqual(rv.status_code, 404)
+            rv = c.get("/Jobs/..%2F..%2Fws")
+            self.assertEqual(rv.status_code, 404)
+
+    def test_job_load(self):
+        def operation(count):
+            for idx in range(count):
+                report_progress(f"step {idx}")
+
+        with self.app.test_client() as c:
+            job = _job_manager.submit("test", operation, 3)
+            data = self.wait_job(c, f"/Jobs/{job.id}")
+            self.assertEqual(data['state'], JobState.Succeeded)
+
+        # the events are appended to the events file instead of rewriting the job file
+        with open(Job.get_path(job.id), 'r') as f:
+            self.assertNotIn('events', json.load(f))
+        with open(Job.get_events_path(job.id), 'r') as f:
+            self.assertEqual(len(f.readlines()), 5)
+
+        # the job is loaded by other process, the event being appended is ignored
+        with open(Job.get_events_path(job.id), 'a') as f:
+            f.write('{"seq": 5, "mess')
+        loaded = Job.load(job.id)
+        self.assertEqual(loaded.state, JobState.Succeeded)
+        self.assertEqual(loaded.to_primitive(), job.to_primitive())
+
+    def test_job_failed(self):
+        def operation():
+            raise exceptions.ResourceNotFind("Not find")
+
+        with self.app.test_client() as c:
+            job = _job_manager.submit("test", operation)
+            data = self.wait_job(c, f"/Jobs/{job.id}")
+            self.assertEqual(data['state'], JobState.Failed)
+            self.assertEqual(data['error'], {"message": "Not find", "status": 404})
+
+    def test_job_cancel(self):
+        started = threading.Event()
+
+        def operation():
+            started.set()
+            while True:
+                report_progress("waiting")
+                time.sleep(0.01)
+
+        with self.app.test_client() as c:
+            job = _job_manager.submit("test", operation)
+            self.assertTrue(started.wait(timeout=10))
+            rv = c.post(f"/Jobs/{job.id}/Cancel")
+            self.assertEqual(rv.status_code, 200)
+            data = self.wait_job(c, f"/Jobs/{job.id}")
+            self.assertEqual(data['state'], JobState.Cancelled)
+            self.assertEqual(data['events'][-1]['state'], JobState.Cancelled)
+
+    def test_job_shutdown(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def operation():
+            started.set()
+            # the files are being saved, it can't be cancelled
+            release.wait(timeout=10)
+            return "saved"
+
+        self.addCleanup(setattr, Config, "JOB_WORKERS", Config.JOB_WORKERS)
+        _job_manager.shutdown()
+        Config.JOB_WORKERS = 1
+        running_job = _job_manager.submit("test", operation)
+        self.assertTrue(started.wait(timeout=10))
+        pending_job = _job_manager.submit("test", operation)
+
+        threading.Timer(0.1, release.set).start()
+        _job_manager.shutdown()
+        self.assertEqual(running_job.state, JobState.Succeeded)
+        self.assertEqual(running_job.result, "saved")
+        self.assertEqual(pending_job.state, JobState.Cancelled)
+        self.assertEqual(Job.load(running_job.id).state, JobState.Succeeded)
+
+    def test_job_eviction(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def operation():
+            started.set()
+            release.wait(timeout=10)
+
+        self.addCleanup(setattr, Config, "JOB_RETENTION", Config.JOB_RETENTION)
+        self.addCleanup(release.set)
+        finished_job = _job_manager.submit("test", lambda: None)
+        finished_job._future.result(timeout=10)
+        running_job = _job_manager.submit("test", operation)
+        self.assertTrue(started.wait(timeout=10))
+        # the job files are not updated for a long time
+        for path in (Job.get_path(finished_job.id), Job.get_path(running_job.id)):
+            os.utime(path, (0, 0))
+        with open(Job.get_cancel_path(running_job.id), 'w'):
+            pass
+
+        Config.JOB_RETENTION = 1
+        finished_job.finished -= 10
+        with open(Job.get_path(finished_job.id), 'r') as f:
+            data = json.load(f)
+        data['finished'] -= 10
+        with open(Job.get_path(finished_job.id), 'w') as f:
+            json.dump(data, f)
+        new_job = _job_manager.submit("test", lambda: None)
+
+        # the running job is kept though its files are older than the retention
+        self.assertTrue(os.path.exists(Job.get_path(running_job.id)))
+        self.assertTrue(os.path.exists(Job.get_cancel_path(running_job.id)))
+        self.assertEqual(_job_manager.get(running_job.id).state, JobState.Running)
+        self.assertIsNone(_job_manager.get(finished_job.id))
+        self.assertFalse(os.path.exists(Job.get_events_path(finished_job.id)))
+
+        release.set()
+        running_job._future.result(timeout=10)
+        new_job._future.result(timeout=10)
+        self.assertEqual(running_job.state, JobState.Succeeded)
+
+    def test_workspace_generate_job(self):
+        with self.app.test_client() as c:
+            rv = c.post(f"/AAZ/Editor/Workspaces", json={
+                "name": "JobApiTestCase_test_workspace_generate_job",
+                "plane": PlaneEnum.Mgmt,
+            })
+            self.assertEqual(rv.status_code, 200)
+            ws_url = rv.get_json()['url']
+
+            rv = c.post(f"{ws_url}/Generate?async=true")
+            self.assertEqual(rv.status_code, 202)
+            job_url = rv.headers['Location']
+            self.assertEqual(rv.get_json()['url'], job_url)
+            data = self.wait_job(c, job_url)
+            self.assertEqual(data['state'], JobState.Succeeded, data['error'])
+            self.assertEqual(data['name'], f"POST {ws_url}/Generate")
+            self.assertIn("Save command models", [e['message'] for e in data['events']])
+
+            # the missing workspace is responded without a job
+            rv = c.post(f"/AAZ/Editor/Workspaces/NotExist/Generate", headers={"Prefer": "respond-async"})
+            self.assertEqual(rv.status_code, 404)
+            self.assertNotIn('Location', rv.headers)
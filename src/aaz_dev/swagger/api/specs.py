@@ -1,14 +1,21 @@
+import os
+
 from flask import Blueprint, jsonify, url_for
 
 from swagger.controller.specs_manager import SwaggerSpecsManager
+from utils.listing import is_listing_requested, list_response
+from utils.response_cache import ResponseCache
+from utils.url_template import URLTemplate
 
 bp = Blueprint('swagger', __name__, url_prefix='/Swagger/Specs')
 
+_response_cache = ResponseCache()
+
 
 # modules
 @bp.route("/<plane>", methods=("GET",))
 def get_modules_by(plane):
-    specs_manager = SwaggerSpecsManager()
+    specs_manager = SwaggerSpecsManager.get_shared()
     result = []
     for module in specs_manager.get_modules(plane):
         m = {
@@ -22,7 +29,7 @@ def get_modules_by(plane):
 
 @bp.route("/<plane>/<list_path:mod_names>", methods=("GET",))
 def get_module(plane, mod_names):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     module = specs_module_manager.module
     result = {
         "url": url_for('swagger.get_module', plane=plane, mod_names=mod_names),
@@ -42,7 +49,7 @@ def get_module(plane, mod_names):
 # resource providers
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders", methods=("GET",))
 def get_resource_providers_by(plane, mod_names):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     result = []
     for rp in specs_module_manager.get_resource_providers():
         result.append({
@@ -55,89 +62,106 @@ def get_resource_providers_by(plane, mod_names):
 
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>", methods=("GET",))
 def get_resource_provider(plane, mod_names, rp_name):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     rp = specs_module_manager.get_resource_provider(rp_name)
-    result = {
-        "url": url_for('swagger.get_resource_provider', plane=plane, mod_names=mod_names, rp_name=rp.name),
-        "name": rp.name,
-        "folder": rp.folder_path,
-        "resources": []
-    }
-    resource_op_group_map = specs_module_manager.get_grouped_resource_map(rp_name)
-    for op_group_name, resource_map in resource_op_group_map.items():
-        for resource_id, version_map in resource_map.items():
-            rs = {
-                "opGroup": op_group_name,
-                "url": url_for('swagger.get_resource_in_rp',
-                               plane=plane, mod_names=mod_names, rp_name=rp.name, resource_id=resource_id),
-                "id": resource_id,
-                "versions": []
+
+    if is_listing_requested():
+        def wrap(resources):
+            return {
+                "url": url_for('swagger.get_resource_provider', plane=plane, mod_names=mod_names, rp_name=rp.name),
+                "name": rp.name,
+                "folder": rp.folder_path,
+                "resources": resources
             }
-            for version, resource in version_map.items():
-                rs['versions'].append({
-                    "url": url_for('swagger.get_resource_version_in_rp',
-                                   plane=plane, mod_names=mod_names, rp_name=rp.name,
-                                   resource_id=resource.id, version=resource.version),
-                    "version": version,
-                    "file": resource.file_path,
-                    "path": resource.path,
-                    "operations": resource.operations
-                })
-            result['resources'].append(rs)
-    return jsonify(result)
+        return list_response(_iter_resource_entries(specs_module_manager, plane, mod_names, rp), wrap=wrap)
+
+    def build():
+        result = {
+            "url": url_for('swagger.get_resource_provider', plane=plane, mod_names=mod_names, rp_name=rp.name),
+            "name": rp.name,
+            "folder": rp.folder_path,
+            "resources": [
+                build_resource() for _, build_resource in _iter_resource_entries(
+                    specs_module_manager, plane, mod_names, rp)
+            ]
+        }
+        return result
+
+    # the resources are parsed again by the manager when the signature of resource provider is changed
+    version = rp.get_signature() if os.path.isdir(rp.folder_path) else None
+    return _response_cache.get_response((rp.folder_path, version) if version else None, build)
 
 
 # resources
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>/Resources", methods=("GET",))
 def get_resources_by(plane, mod_names, rp_name):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
-    result = []
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     rp = specs_module_manager.get_resource_provider(rp_name)
-    resource_op_group_map = specs_module_manager.get_grouped_resource_map(rp_name)
+    entries = _iter_resource_entries(specs_module_manager, plane, mod_names, rp, with_version_id=True)
+    if is_listing_requested():
+        return list_response(entries)
+    return jsonify([build_resource() for _, build_resource in entries])
+
+
+def _iter_resource_entries(specs_module_manager, plane, mod_names, rp, with_version_id=False):
+    """Iterate the resources of resource provider as (resource_id, build) entries for listing."""
+    resource_url, version_url = _get_resource_url_templates(plane, mod_names, rp.name)
+    resource_op_group_map = specs_module_manager.get_grouped_resource_map(rp.name)
     for op_group_name, resource_map in resource_op_group_map.items():
         for resource_id, version_map in resource_map.items():
-            rs = {
-                "opGroup": op_group_name,
-                "url": url_for('swagger.get_resource_in_rp',
-                               plane=plane, mod_names=mod_names, rp_name=rp.name, resource_id=resource_id),
-                "id": resource_id,
-                "versions": []
-            }
-            for version, resource in version_map.items():
-                rs['versions'].append({
-                    "url": url_for('swagger.get_resource_version_in_rp',
-                                   plane=plane, mod_names=mod_names, rp_name=rp.name,
-                                   resource_id=resource.id, version=resource.version),
+            def build_resource(op_group_name=op_group_name, resource_id=resource_id, version_map=version_map):
+                rs = {
+                    "opGroup": op_group_name,
+                    "url": resource_url.build(resource_id=resource_id),
                     "id": resource_id,
-                    "version": version,
-                    "file": resource.file_path,
-                    "path": resource.path,
-                    "operations": resource.operations
-                })
-            result.append(rs)
-    return jsonify(result)
+                    "versions": []
+                }
+                for version, resource in version_map.items():
+                    v = {
+                        "url": version_url.build(resource_id=resource.id, version=resource.version),
+                    }
+                    if with_version_id:
+                        v["id"] = resource_id
+                    v.update({
+                        "version": version,
+                        "file": resource.file_path,
+                        "path": resource.path,
+                        "operations": resource.operations
+                    })
+                    rs['versions'].append(v)
+                return rs
+            yield resource_id, build_resource
+
+
+def _get_resource_url_templates(plane, mod_names, rp_name):
+    """The url templates of the resources and resource versions in resource provider."""
+    resource_url = URLTemplate(
+        'swagger.get_resource_in_rp', ('resource_id',),
+        plane=plane, mod_names=mod_names, rp_name=rp_name)
+    version_url = URLTemplate(
+        'swagger.get_resource_version_in_rp', ('resource_id', 'version'),
+        plane=plane, mod_names=mod_names, rp_name=rp_name)
+    return resource_url, version_url
 
 
 # resource
 @bp.route("/<plane>/<list_path:mod_names>/ResourceProviders/<rp_name>/Resources/<base64:resource_id>",
           methods=("GET",))
 def get_resource_in_rp(plane, mod_names, rp_name, resource_id):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     version_map = specs_module_manager.get_resource_version_map(resource_id, rp_name)
     rp = list(version_map.values())[0].resource_provider
     op_group_name = specs_module_manager.get_resource_op_group_name(version_map)
+    resource_url, version_url = _get_resource_url_templates(plane, mod_names, rp.name)
     result = {
         "opGroup": op_group_name,
-        "url": url_for('swagger.get_resource_in_rp',
-                       plane=plane, mod_names=mod_names, rp_name=rp.name, resource_id=resource_id),
+        "url": resource_url.build(resource_id=resource_id),
         "id": resource_id,
         "versions": []
     }
     for version, resource in version_map.items():
         result['versions'].append({
-            "url": url_for('swagger.get_resource_version_in_rp',
-                           plane=plane, mod_names=mod_names, rp_name=rp.name,
-                           resource_id=resource.id, version=resource.version),
+            "url": version_url.build(resource_id=resource.id, version=resource.version),
             "id": resource_id,
             "version": version,
             "file": resource.file_path,
@@ -149,22 +173,20 @@ def get_resource_in_rp(plane, mod_names, rp_name, resource_id):
 
 @bp.route("/<plane>/<list_path:mod_names>/Resources/<base64:resource_id>", methods=("GET",))
 def get_resource_in_module(plane, mod_names, resource_id):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     version_map = specs_module_manager.get_resource_version_map(resource_id)
     rp = list(version_map.values())[0].resource_provider
     op_group_name = specs_module_manager.get_resource_op_group_name(version_map)
+    resource_url, version_url = _get_resource_url_templates(plane, mod_names, rp.name)
     result = {
         "opGroup": op_group_name,
-        "url": url_for('swagger.get_resource_in_rp',
-                       plane=plane, mod_names=mod_names, rp_name=rp.name, resource_id=resource_id),
+        "url": resource_url.build(resource_id=resource_id),
         "id": resource_id,
         "versions": []
     }
     for version, resource in version_map.items():
         result['versions'].append({
-            "url": url_for('swagger.get_resource_version_in_rp',
-                           plane=plane, mod_names=mod_names, rp_name=rp.name,
-                           resource_id=resource.id, version=resource.version),
+            "url": version_url.build(resource_id=resource.id, version=resource.version),
             "id": resource_id,
             "version": version,
             "file": resource.file_path,
@@ -180,7 +202,7 @@ def get_resource_in_module(plane, mod_names, resource_id):
     methods=("GET",)
 )
 def get_resource_version_in_rp(plane, mod_names, rp_name, resource_id, version):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     resource = specs_module_manager.get_resource_in_version(rp_name, resource_id, version)
     result = {
         "url": url_for('swagger.get_resource_version_in_rp',
@@ -197,7 +219,7 @@ def get_resource_version_in_rp(plane, mod_names, rp_name, resource_id, version):
 
 @bp.route("/<plane>/<list_path:mod_names>/Resources/<base64:resource_id>/V/<base64:version>", methods=("GET",))
 def get_resource_version_in_module(plane, mod_names, resource_id, version):
-    specs_module_manager = SwaggerSpecsManager().get_module_manager(plane, mod_names)
+    specs_module_manager = SwaggerSpecsManager.get_shared().get_module_manager(plane, mod_names)
     resource = specs_module_manager.get_resource_in_version(resource_id, version)
     result = {
         "url": url_for('swagger.get_resource_version_in_rp',
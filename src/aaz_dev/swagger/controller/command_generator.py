@@ -47,30 +47,38 @@ class CommandGenerator:
         command_group = CMDCommandGroup()
         command_group.commands = []
 
+        # the schemas, such as the resource in responses, are converted once and shared by the operations
+        conversion_cache = {}
+
         assert isinstance(path_item, PathItem)
         if path_item.get is not None and 'get' in methods:
-            cmd_builder = CMDBuilder(path=resource.path, method='get', mutability=MutabilityEnum.Read)
+            cmd_builder = CMDBuilder(
+                path=resource.path, method='get', mutability=MutabilityEnum.Read, conversion_cache=conversion_cache)
             show_or_list_command = self.generate_command(path_item, resource, cmd_builder)
             command_group.commands.append(show_or_list_command)
 
         if path_item.delete is not None and 'delete' in methods:
-            cmd_builder = CMDBuilder(path=resource.path, method='delete', mutability=MutabilityEnum.Create)
+            cmd_builder = CMDBuilder(
+                path=resource.path, method='delete', mutability=MutabilityEnum.Create, conversion_cache=conversion_cache)
             delete_command = self.generate_command(path_item, resource, cmd_builder)
             delete_command.confirmation = DEFAULT_CONFIRMATION_PROMPT   # add confirmation for delete command by default
             command_group.commands.append(delete_command)
 
         if path_item.put is not None and 'put' in methods:
-            cmd_builder = CMDBuilder(path=resource.path, method='put', mutability=MutabilityEnum.Create)
+            cmd_builder = CMDBuilder(
+                path=resource.path, method='put', mutability=MutabilityEnum.Create, conversion_cache=conversion_cache)
             create_command = self.generate_command(path_item, resource, cmd_builder)
             command_group.commands.append(create_command)
 
         if path_item.post is not None and 'post' in methods:
-            cmd_builder = CMDBuilder(path=resource.path, method='post', mutability=MutabilityEnum.Create)
+            cmd_builder = CMDBuilder(
+                path=resource.path, method='post', mutability=MutabilityEnum.Create, conversion_cache=conversion_cache)
             action_command = self.generate_command(path_item, resource, cmd_builder)
             command_group.commands.append(action_command)
 
         if path_item.head is not None and 'head' in methods:
-            cmd_builder = CMDBuilder(path=resource.path, method='head', mutability=MutabilityEnum.Read)
+            cmd_builder = CMDBuilder(
+                path=resource.path, method='head', mutability=MutabilityEnum.Read, conversion_cache=conversion_cache)
             head_command = self.generate_command(path_item, resource, cmd_builder)
             command_group.commands.append(head_command)
 
@@ -79,10 +87,11 @@ class CommandGenerator:
             update_by_patch_command = None
             update_by_generic_command = None
             if path_item.patch is not None and 'patch' in methods:
-                cmd_builder = CMDBuilder(path=resource.path, method='patch', mutability=MutabilityEnum.Update)
+                cmd_builder = CMDBuilder(
+                    path=resource.path, method='patch', mutability=MutabilityEnum.Update, conversion_cache=conversion_cache)
                 update_by_patch_command = self.generate_command(path_item, resource, cmd_builder)
             if path_item.get is not None and path_item.put is not None and 'get' in methods and 'put' in methods:
-                cmd_builder = CMDBuilder(path=resource.path)
+                cmd_builder = CMDBuilder(path=resource.path, conversion_cache=conversion_cache)
                 update_by_generic_command = self.generate_generic_update_command(path_item, resource, cmd_builder)
             # generic update command first, patch update command after that
             if update_by_generic_command:
@@ -95,7 +104,7 @@ class CommandGenerator:
                     raise exceptions.InvalidAPIUsage(f"Invalid update_by resource: resource needs to have 'get' and 'put' operations: '{resource}'")
                 if 'get' not in methods or 'put' not in methods:
                     raise exceptions.InvalidAPIUsage(f"Invalid update_by resource: '{resource}': 'get' or 'put' not in methods: '{methods}'")
-                cmd_builder = CMDBuilder(path=resource.path)
+                cmd_builder = CMDBuilder(path=resource.path, conversion_cache=conversion_cache)
                 generic_update_command = self.generate_generic_update_command(path_item, resource, cmd_builder)
                 if generic_update_command is None:
                     raise exceptions.InvalidAPIUsage(f"Invalid update_by resource: failed to generate generic update: '{resource}'")
@@ -107,7 +116,8 @@ class CommandGenerator:
                     raise exceptions.InvalidAPIUsage(f"Invalid update_by resource: resource needs to have 'patch' operation: '{resource}'")
                 if 'patch' not in methods:
                     raise exceptions.InvalidAPIUsage(f"Invalid update_by resource: '{resource}': 'patch' not in methods: '{methods}'")
-                cmd_builder = CMDBuilder(path=resource.path, method='patch', mutability=MutabilityEnum.Update)
+                cmd_builder = CMDBuilder(
+                    path=resource.path, method='patch', mutability=MutabilityEnum.Update, conversion_cache=conversion_cache)
                 patch_update_command = self.generate_command(path_item, resource, cmd_builder)
                 command_group.commands.append(patch_update_command)
             # elif update_by == 'GenericAndPatch':
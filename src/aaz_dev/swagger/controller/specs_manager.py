@@ -1,25 +1,40 @@
+import hashlib
+import logging
+import os
 from collections import OrderedDict
 
-from swagger.model.specs import SwaggerSpecs, SingleModuleSwaggerSpecs, ResourceProvider, SwaggerModule
+from swagger.model.specs import SwaggerSpecs, SingleModuleSwaggerSpecs, ResourceProvider, SwaggerModule, \
+    MgmtPlaneModule, DataPlaneModule
 from utils import exceptions
 from utils.config import Config
 from utils.plane import PlaneEnum
 
+logger = logging.getLogger('backend')
+
 
 class SwaggerSpecsModuleManager:
 
-    def __init__(self, plane, module):
+    def __init__(self, plane, module, rp_snapshots=None):
         self.plane = plane
         self.module = module
         self._rps_catch = None
-        self._resource_op_group_map_cache = {}
-        self._resource_map_cache = {}
+        # the snapshots of resource providers by their names in string
+        self._rp_snapshots = rp_snapshots or {}
+        # the resource maps are verified by the signatures of resource providers, because the manager can be shared by
+        # requests while the swagger files are changed
+        self._resource_op_group_map_cache = {}  # rp name -> (resource map, grouped resource map)
+        self._resource_map_cache = {}  # rp name in string -> (signature, resource map)
         assert plane in PlaneEnum.choices(), f"Invalid plane: '{self.plane}'"
         assert isinstance(module, SwaggerModule), f"Invalid module type: '{type(module)}'"
 
     def get_resource_providers(self):
         if self._rps_catch is None:
-            self._rps_catch = self.module.get_resource_providers()
+            rps = self.module.get_resource_providers()
+            for rp in rps:
+                snapshot = self._rp_snapshots.get(str(rp), None)
+                if snapshot is not None and snapshot.get('signature', None) and snapshot['folder'] == rp.folder_path:
+                    rp.load_snapshot(snapshot)
+            self._rps_catch = rps
         return self._rps_catch
 
     def get_resource_provider(self, rp_name):
@@ -36,19 +51,20 @@ class SwaggerSpecsModuleManager:
 
     def get_grouped_resource_map(self, rp_name):
         key = rp_name
-        if key in self._resource_op_group_map_cache:
-            return self._resource_op_group_map_cache[key]
-
         rp = self.get_resource_provider(rp_name)
         resource_map = self.get_resource_map(rp)
+        cached = self._resource_op_group_map_cache.get(key, None)
+        if cached is not None and cached[0] is resource_map:
+            return cached[1]
+
         resource_op_group_map = OrderedDict()
         for resource_id, version_map in resource_map.items():
             op_group_name = self.get_resource_op_group_name(version_map)
             if op_group_name not in resource_op_group_map:
                 resource_op_group_map[op_group_name] = OrderedDict()
             resource_op_group_map[op_group_name][resource_id] = version_map
-        self._resource_op_group_map_cache[key] = resource_op_group_map
-        return self._resource_op_group_map_cache[key]
+        self._resource_op_group_map_cache[key] = (resource_map, resource_op_group_map)
+        return resource_op_group_map
 
     @staticmethod
     def get_resource_op_group_name(version_map):
@@ -107,33 +123,199 @@ class SwaggerSpecsModuleManager:
         return resources[0]
 
     def get_resource_map(self, rp):
+        """Return the resource map of resource provider, it's parsed again when the files of resource provider are
+        changed.
+        """
         assert isinstance(rp, ResourceProvider)
         key = str(rp)
-        if key not in self._resource_map_cache:
-            self._resource_map_cache[key] = rp.get_resource_map()
-        return self._resource_map_cache[key]
+        # the signature is taken before parsing, so the files changed in parsing are parsed again in the next call
+        signature = rp.get_signature()
+        cached = self._resource_map_cache.get(key, None)
+        if cached is None or cached[0] != signature:
+            if cached is not None:
+                logger.info(f"Reload resources of {rp} for changed files")
+            resource_map = rp.get_resource_map(refresh=cached is not None)
+            cached = self._resource_map_cache[key] = (signature, resource_map)
+        return cached[1]
 
 
 class SwaggerSpecsManager:
 
+    # the manager shared by requests, it's set by `warm_up` when the server runs in serve mode
+    _shared = None
+
+    # the snapshot loaded for the new managers, it's set by `set_snapshot`
+    _snapshot = None
+
+    @classmethod
+    def set_snapshot(cls, snapshot):
+        """Set the snapshot dumped by `dump_snapshot`, so the new managers are loaded from it."""
+        cls._snapshot = snapshot
+
+    @classmethod
+    def get_shared(cls):
+        """Return the warmed up manager shared by requests, or a new manager if it's not warmed up."""
+        return cls._shared or cls()
+
+    @classmethod
+    def warm_up(cls, with_resources=True):
+        """Build the modules and resource providers of all the planes, and the grouped resource maps when
+        `with_resources`, in a new manager. Then share it by `get_shared`.
+        """
+        manager = cls()
+        for plane in PlaneEnum.choices():
+            try:
+                modules = manager.get_modules(plane)
+            except exceptions.InvalidAPIUsage as err:
+                logger.warning(f"Skip warming up swagger modules of {plane}: {err.message}")
+                continue
+            for module in modules:
+                module_manager = manager.get_module_manager(plane, module.names)
+                for rp in module_manager.get_resource_providers():
+                    if not with_resources:
+                        continue
+                    try:
+                        module_manager.get_grouped_resource_map(rp.name)
+                    except Exception as err:
+                        logger.warning(f"Skip warming up resources of {rp}: {err}")
+        cls._shared = manager
+        return manager
+
     def __init__(self):
         if Config.SWAGGER_PATH:
             self.specs = SwaggerSpecs(folder_path=Config.SWAGGER_PATH)
+            self._root_folder = os.path.join(Config.SWAGGER_PATH, 'specification')
         elif Config.SWAGGER_MODULE_PATH:
             if not Config.DEFAULT_SWAGGER_MODULE:
                 raise ValueError("SWAGGER_MODULE is required when using SWAGGER_MODULE_PATH")
             self.specs = SingleModuleSwaggerSpecs(
                 folder_path=Config.SWAGGER_MODULE_PATH, module_name=Config.DEFAULT_SWAGGER_MODULE)
+            self._root_folder = Config.SWAGGER_MODULE_PATH
         else:
             raise ValueError("Require SWAGGER_PATH or SWAGGER_MODULE_PATH")
 
         self._modules_cache = {}
         self._module_managers_cache = {}
+        self._plane_snapshots = {}
+        self._verified_plane_snapshots = {}
+        self._rp_snapshots = {}  # plane -> {rp name in string: snapshot}
+        if self._snapshot is not None:
+            self.load_snapshot(self._snapshot)
+
+    def dump_snapshot(self):
+        """Dump the modules, resource providers and their resources of all the planes."""
+        snapshot = {}
+        for plane in PlaneEnum.choices():
+            try:
+                modules = self.get_modules(plane)
+            except exceptions.InvalidAPIUsage as err:
+                logger.warning(f"Skip swagger modules of {plane}: {err.message}")
+                continue
+            module_snapshots = []
+            rp_snapshots = {}
+            for module in modules:
+                module_manager = self.get_module_manager(plane, module.names)
+                rp_keys = []
+                for rp in module_manager.get_resource_providers():
+                    key = str(rp)
+                    if key not in rp_snapshots:
+                        try:
+                            rp_snapshot = rp.dump_snapshot()
+                        except Exception as err:
+                            logger.warning(f"Skip resources of {rp}: {err}")
+                            rp_snapshot = {"name": rp.name, "folder": rp.folder_path, "readme": rp.readme_path}
+                        rp_snapshot["module"] = rp.swagger_module.dump_snapshot()
+                        rp_snapshots[key] = rp_snapshot
+                    rp_keys.append(key)
+                module_snapshots.append({"module": module.dump_snapshot(), "resourceProviders": rp_keys})
+            snapshot[plane] = {
+                "signature": self._get_modules_signature(module_snapshots),
+                "modules": module_snapshots,
+                "resourceProviders": rp_snapshots,
+            }
+        return snapshot
+
+    def load_snapshot(self, snapshot):
+        """Load the modules and resource providers from snapshot when the folders of modules are not changed,
+        otherwise they're scanned again. The resources of a resource provider are loaded from snapshot if its files
+        are not changed, otherwise they're parsed from swagger files. The snapshot is verified lazily by planes.
+        """
+        for plane, plane_snapshot in snapshot.items():
+            if plane in PlaneEnum.choices():
+                self._plane_snapshots[plane] = plane_snapshot
+                self._rp_snapshots[plane] = plane_snapshot['resourceProviders']
+
+    def _get_plane_snapshot(self, plane):
+        """Return the snapshot of plane if the folders of modules are not changed."""
+        if plane not in self._verified_plane_snapshots:
+            plane_snapshot = self._plane_snapshots.get(plane, None)
+            if plane_snapshot is not None and \
+                    plane_snapshot['signature'] != self._get_modules_signature(plane_snapshot['modules']):
+                logger.info(f"Scan swagger modules of {plane} for stale snapshot")
+                plane_snapshot = None
+            self._verified_plane_snapshots[plane] = plane_snapshot
+        return self._verified_plane_snapshots[plane]
+
+    def _load_module_manager_from_snapshot(self, plane, mod_names):
+        plane_snapshot = self._get_plane_snapshot(plane)
+        if plane_snapshot is None:
+            return None
+        module_cls = MgmtPlaneModule if plane == PlaneEnum.Mgmt else DataPlaneModule
+        rp_snapshots = plane_snapshot['resourceProviders']
+        for module_snapshot in plane_snapshot['modules']:
+            if [data['name'] for data in module_snapshot['module']] != list(mod_names):
+                continue
+            module = module_cls.load_snapshot(plane, module_snapshot['module'])
+            rps = []
+            for key in module_snapshot['resourceProviders']:
+                rp_snapshot = rp_snapshots[key]
+                rp = ResourceProvider(
+                    rp_snapshot['name'], rp_snapshot['folder'], rp_snapshot['readme'],
+                    swagger_module=module_cls.load_snapshot(plane, rp_snapshot['module']))
+                if rp_snapshot.get('signature', None):
+                    rp.load_snapshot(rp_snapshot)
+                rps.append(rp)
+            module_manager = SwaggerSpecsModuleManager(plane, module, rp_snapshots=rp_snapshots)
+            module_manager._rps_catch = rps
+            return module_manager
+        return None
+
+    def _get_modules_signature(self, module_snapshots):
+        """The signature of the folders scanned for the modules and resource providers, by the modification time of
+        the folders and their sub folders.
+        """
+        folders = {self._root_folder}
+        for module_snapshot in module_snapshots:
+            for data in module_snapshot['module']:
+                if data['folder']:
+                    folders.add(data['folder'])
+        digest = hashlib.sha1()
+        for folder in sorted(folders):
+            try:
+                entries = [(folder, os.stat(folder).st_mtime_ns)]
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            entries.append((entry.path, entry.stat().st_mtime_ns))
+            except OSError:
+                entries = [(folder, None)]
+            for path, mtime in sorted(entries):
+                digest.update(f"{path}:{mtime}\n".encode())
+        return digest.hexdigest()
 
     def get_modules(self, plane):
         if plane in self._modules_cache:
             return self._modules_cache[plane]
 
+        plane_snapshot = self._get_plane_snapshot(plane)
+        if plane_snapshot is not None:
+            module_cls = MgmtPlaneModule if plane == PlaneEnum.Mgmt else DataPlaneModule
+            self._modules_cache[plane] = [
+                module_cls.load_snapshot(plane, module_snapshot['module'])
+                for module_snapshot in plane_snapshot['modules']
+            ]
+            return self._modules_cache[plane]
+
         if plane == PlaneEnum.Mgmt:
             modules = self.specs.get_mgmt_plane_modules(plane=plane)
         elif plane in PlaneEnum.choices():
@@ -170,7 +352,11 @@ class SwaggerSpecsManager:
     def get_module_manager(self, plane, mod_names, without_catch=False) -> SwaggerSpecsModuleManager:
         key = (plane, tuple(mod_names))
         if without_catch or key not in self._module_managers_cache:
-            module = self.get_module(plane, mod_names)
-            self._module_managers_cache[key] = SwaggerSpecsModuleManager(plane, module)
+            module_manager = self._load_module_manager_from_snapshot(plane, mod_names)
+            if module_manager is None:
+                module = self.get_module(plane, mod_names)
+                module_manager = SwaggerSpecsModuleManager(
+                    plane, module, rp_snapshots=self._rp_snapshots.get(plane, None))
+            self._module_managers_cache[key] = module_manager
 
         return self._module_managers_cache[key]
@@ -22,17 +22,162 @@ from command.model.configuration import CMDSchemaDefault, \
     CMDClsSchema, CMDClsSchemaBase, \
     CMDHttpResponseJsonBody
 
+from schematics.models import Model, ModelDict
+from schematics.undefined import Undefined
+
 from swagger.utils import exceptions
 from .fields import MutabilityEnum
 from .schema import ReferenceSchema
 from .x_ms_pageable import XmsPageable
 from utils.case import to_camel_case
+import copy
+import enum
 import re
 
 
+class _BuildingPath:
+    """The ids of the builders which are building schemas, from the root builder to the current one.
+
+    Sub builders are created and used in depth-first order, so the ancestors of a builder are exactly the building
+    builders when it's current. The ids and traces are counted, so that loop detection costs O(1) per schema.
+    """
+
+    def __init__(self):
+        self.builders = []
+        self.ids = {}
+        self.traces = {}
+        self.recording = None
+
+    def push(self, builder):
+        self.builders.append(builder)
+        if builder.id is not None:
+            self.ids[builder.id] = self.ids.get(builder.id, 0) + 1
+            traces = builder.id[0]
+            self.traces[traces] = self.traces.get(traces, 0) + 1
+            if self.recording is not None:
+                self.recording.traces.add(traces)
+
+    def pop(self):
+        builder = self.builders.pop()
+        if builder.id is not None:
+            self._decrease(self.ids, builder.id)
+            self._decrease(self.traces, builder.id[0])
+
+    @staticmethod
+    def _decrease(counts, key):
+        if counts[key] == 1:
+            del counts[key]
+        else:
+            counts[key] -= 1
+
+    def is_current(self, builder):
+        if self.builders:
+            return self.builders[-1] is builder
+        return builder.parent is None
+
+
+class _ConversionRecording:
+    """Record the context which a schema conversion depends on, besides the builder properties.
+
+    The conversion depends on the traces of its ancestors, by loop detection and `find_traces`, and on the cls
+    definitions registered outside of it. The result can be reused when none of the traces used in the conversion is
+    in ancestors and none of the cls definitions looked up is registered.
+    """
+
+    def __init__(self, outside_traces):
+        self.outside_traces = outside_traces
+        self.traces = set()
+        self.absent_cls_names = set()
+        self.registered_cls_names = set()
+        self.cacheable = True
+
+    def query_traces(self, traces):
+        if traces in self.outside_traces:
+            self.cacheable = False
+        self.traces.add(traces)
+
+    def lookup_cls(self, name, cls_definitions):
+        if name in self.registered_cls_names:
+            return
+        if name in cls_definitions:
+            # registered outside of the conversion
+            self.cacheable = False
+        else:
+            self.absent_cls_names.add(name)
+
+    def build_entry(self, model, cls_definitions):
+        if not self.cacheable or not self.outside_traces.isdisjoint(self.traces):
+            return None
+        cls_definitions = {
+            name: cls_definitions[name] for name in self.registered_cls_names if name in cls_definitions
+        }
+        return _ConversionCacheEntry(model, cls_definitions, self.traces, self.absent_cls_names)
+
+
+class _ConversionCacheEntry:
+
+    def __init__(self, model, cls_definitions, traces, absent_cls_names):
+        # take a snapshot, because the result will be modified by its parents
+        self.model, self.cls_definitions = _clone_converted(model, cls_definitions)
+        self.traces = traces
+        self.absent_cls_names = absent_cls_names
+
+    def match(self, building_traces, cls_definitions):
+        for name in self.absent_cls_names:
+            if name in cls_definitions:
+                return False
+        for traces in self.traces:
+            if traces in building_traces:
+                return False
+        return True
+
+    def replay(self, cls_definitions):
+        model, registered = _clone_converted(self.model, self.cls_definitions)
+        cls_definitions.update(registered)
+        return model
+
+
+def _clone_converted(model, cls_definitions):
+    """Clone the converted model and the cls definitions registered in conversion, including the frozen schemas and
+    the links from cls schemas to their definitions.
+    """
+    memo = {}
+    transient_attrs = []
+
+    def _clone(value):
+        if isinstance(value, Model):
+            cloned = memo.get(id(value), None)
+            if cloned is None:
+                model_cls = type(value)
+                cloned = memo[id(value)] = model_cls.__new__(model_cls)
+                cloned._data = ModelDict(converted={k: _clone(v) for k, v in value._data.items()})
+                attrs = {k: v for k, v in value.__dict__.items() if k != '_data'}
+                if attrs:
+                    transient_attrs.append((cloned, attrs))
+            return cloned
+        if isinstance(value, list):
+            return [_clone(v) for v in value]
+        if isinstance(value, dict):
+            return {k: _clone(v) for k, v in value.items()}
+        if value is None or value is Undefined or isinstance(value, (str, int, float, bool, tuple, enum.Enum)):
+            return value
+        return copy.deepcopy(value)
+
+    model = _clone(model)
+    cls_definitions = {name: _clone(definition) for name, definition in cls_definitions.items()}
+    for cloned, attrs in transient_attrs:
+        for k, v in attrs.items():
+            if isinstance(v, Model):
+                # link to the cloned instance, such as `implement` of cls schemas
+                v = memo.get(id(v), v)
+            setattr(cloned, k, v)
+    return model, cls_definitions
+
+
 class CMDBuilder:
 
-    def __init__(self, path, method=None, mutability=None, in_base=False, frozen=False, parent_ids=None, cls_definitions=None):
+    def __init__(self, path, method=None, mutability=None, in_base=False, frozen=False, parent=None,
+                 cls_definitions=None, conversion_cache=None):
         self.path = path
         self.method = method
         self.mutability = mutability
@@ -40,8 +185,21 @@ class CMDBuilder:
         self.frozen = frozen
         self.read_only = False
         self.id = None    # used to find loop
-        self.parent_ids = parent_ids or []
+        self.parent = parent
+        self._building_path = parent._building_path if parent is not None else _BuildingPath()
         self.cls_definitions = {} if cls_definitions is None else cls_definitions
+        # the conversion results shared by the builders of a resource, see `_convert_cls_definition_with_cache`
+        self.conversion_cache = parent.conversion_cache if parent is not None else conversion_cache
+
+    @property
+    def parent_ids(self):
+        parent_ids = []
+        parent = self.parent
+        while parent is not None:
+            parent_ids.append(parent.id)
+            parent = parent.parent
+        parent_ids.reverse()
+        return parent_ids
 
     def __call__(self, schema, **kwargs):
         sub_builder = CMDBuilder(
@@ -50,7 +208,7 @@ class CMDBuilder:
             mutability=kwargs.pop('mutability', self.mutability),
             in_base=kwargs.pop('in_base', self.in_base),
             frozen=kwargs.pop('frozen', self.frozen),
-            parent_ids=[*self.parent_ids, self.id],
+            parent=self,
             cls_definitions=kwargs.pop('cls_definitions', self.cls_definitions),
         )
         if getattr(schema, 'read_only', None):
@@ -64,7 +222,7 @@ class CMDBuilder:
                     sub_builder.frozen = True
         if hasattr(schema, 'traces'):
             sub_builder.id = (schema.traces, sub_builder.mutability, sub_builder.frozen)
-            if sub_builder.id in sub_builder.parent_ids:
+            if self._is_building(sub_builder.id):
                 if len(schema.traces) == 3:
                     # make sure the trace is reference definition, the trace should be [file_path, 'definitions', name]
                     raise exceptions.InvalidSwaggerValueError(
@@ -72,10 +230,38 @@ class CMDBuilder:
                             key=sub_builder.id,
                             value=sub_builder.parent_ids.index(sub_builder.id),
                         )
-        return schema.to_cmd(sub_builder, **kwargs)
+        building_path = self._building_path
+        if not building_path.is_current(self):
+            # the builder is not used in depth-first order, don't share the building path with it
+            if building_path.recording is not None:
+                building_path.recording.cacheable = False
+            sub_builder._building_path = _BuildingPath()
+            building_path = None
+        else:
+            building_path.push(sub_builder)
+        try:
+            return schema.to_cmd(sub_builder, **kwargs)
+        finally:
+            if building_path is not None:
+                building_path.pop()
+
+    def _is_building(self, builder_id):
+        """Whether the builder id is used by self or its ancestors."""
+        if self._building_path.is_current(self):
+            return builder_id in self._building_path.ids
+        return builder_id == self.id or builder_id in self.parent_ids
 
     def find_traces(self, traces):
         assert traces is not None
+        recording = self._building_path.recording
+        if recording is not None:
+            recording.query_traces(traces)
+        if self._building_path.is_current(self):
+            count = self._building_path.traces.get(traces, 0)
+            if self.id is not None and self.id[0] == traces:
+                # exclude self
+                count -= 1
+            return count > 0
         for parent_id in self.parent_ids:
             if parent_id is None:
                 continue
@@ -234,17 +420,12 @@ class CMDBuilder:
                 model = self(schema.ref_instance, **kwargs)
             return model
 
+        recording = self._building_path.recording
+        if recording is not None:
+            recording.lookup_cls(name, self.cls_definitions)
         if name not in self.cls_definitions:
             if support_cls_schema:
-                # register in cls_definitions first in case of loop reference below
-                self.cls_definitions[name] = {"count": 1}
-                model = self(schema.ref_instance, **kwargs)
-                if isinstance(model, (CMDObjectSchemaBase, CMDArraySchemaBase)):
-                    # Important: only support object and array schema to defined as cls
-                    # when self.cls_definitions[name]['count'] > 1, the loop reference exist
-                    self.cls_definitions[name]['model'] = model
-                else:
-                    del self.cls_definitions[name]
+                model = self._convert_cls_definition_with_cache(name, schema, **kwargs)
             else:
                 model = self(schema.ref_instance, **kwargs)
         else:
@@ -274,9 +455,62 @@ class CMDBuilder:
                 model = self(schema.ref_instance, **kwargs)
         return model
 
+    def _convert_cls_definition(self, name, schema, **kwargs):
+        # register in cls_definitions first in case of loop reference below
+        self.cls_definitions[name] = {"count": 1}
+        recording = self._building_path.recording
+        if recording is not None:
+            recording.registered_cls_names.add(name)
+        model = self(schema.ref_instance, **kwargs)
+        if isinstance(model, (CMDObjectSchemaBase, CMDArraySchemaBase)):
+            # Important: only support object and array schema to defined as cls
+            # when self.cls_definitions[name]['count'] > 1, the loop reference exist
+            self.cls_definitions[name]['model'] = model
+        else:
+            del self.cls_definitions[name]
+        return model
+
+    def _convert_cls_definition_with_cache(self, name, schema, **kwargs):
+        """Convert the cls definition, or reuse the result of the same definition converted by the builders sharing
+        `conversion_cache`, such as the resource definition used by the responses of different operations.
+
+        The result is reused only when it doesn't depend on the context, which means none of the schemas converted
+        is in ancestors and none of the cls definitions looked up in conversion is registered.
+        """
+        building_path = self._building_path
+        if self.conversion_cache is None or building_path.recording is not None or \
+                not building_path.is_current(self):
+            return self._convert_cls_definition(name, schema, **kwargs)
+        try:
+            key = (name, schema.ref_instance.traces, self.mutability, self.in_base, self.frozen, self.read_only,
+                   tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return self._convert_cls_definition(name, schema, **kwargs)
+
+        entry = self.conversion_cache.get(key, None)
+        if entry is not None:
+            if entry.match(building_path.traces, self.cls_definitions):
+                return entry.replay(self.cls_definitions)
+            return self._convert_cls_definition(name, schema, **kwargs)
+
+        building_path.recording = recording = _ConversionRecording(outside_traces=set(building_path.traces))
+        try:
+            recording.lookup_cls(name, self.cls_definitions)
+            model = self._convert_cls_definition(name, schema, **kwargs)
+        finally:
+            building_path.recording = None
+        entry = recording.build_entry(model, self.cls_definitions)
+        if entry is not None:
+            self.conversion_cache[key] = entry
+        return model
+
     def get_cls_definition_model(self, model):
         assert isinstance(model, CMDClsSchemaBase)
         name = model.type[1:]
+        recording = self._building_path.recording
+        if recording is not None:
+            recording.lookup_cls(name, self.cls_definitions)
         return self.cls_definitions[name]['model']
 
     @staticmethod
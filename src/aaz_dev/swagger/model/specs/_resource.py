@@ -5,7 +5,6 @@ import os
 import re
 
 import inflect
-from fuzzywuzzy import fuzz
 
 from command.model.configuration import CMDResource
 from ._utils import map_path_2_repo
@@ -33,6 +32,24 @@ class Resource:
                 operations[v['operationId']] = method
         self.operations = operations
 
+    @classmethod
+    def load_snapshot(cls, data, resource_provider):
+        body = {method: {'operationId': operation_id} for operation_id, method in data['operations'].items()}
+        resource = cls(resource_id=data['id'], path=data['path'], version=data['version'], file_path=data['file'],
+                       resource_provider=resource_provider, body=body)
+        setattr(resource, "_op_group_name", data['opGroup'])
+        return resource
+
+    def dump_snapshot(self):
+        return {
+            "id": self.id,
+            "path": self.path,
+            "version": self.version,
+            "file": self.file_path,
+            "operations": self.operations,
+            "opGroup": self.get_operation_group_name(),
+        }
+
     @property
     def version(self):
         return self._version.version
@@ -59,6 +76,7 @@ class Resource:
         if len(operation_groups) == 1:
             return operation_groups.pop()
 
+        from fuzzywuzzy import fuzz
         op_group_name = sorted(
             operation_groups,
             key=lambda nm: fuzz.partial_ratio(self.id, nm),  # use the name which is closest to resource_id
@@ -8,6 +8,7 @@ from collections import OrderedDict
 import yaml
 
 from swagger.utils.tools import swagger_resource_path_to_resource_id
+from utils.files import get_file_version, get_folder_version
 from ._resource import Resource, ResourceVersion
 from ._utils import map_path_2_repo
 
@@ -26,12 +27,65 @@ class ResourceProvider:
             logger.warning(f"MissReadmeFile: {self} : {map_path_2_repo(folder_path)}")
         self._tags = None
         self._resource_map = None
+        self._snapshot = None
         self._ignore_resources = {f'/providers/{self.name}/operations'.lower(), }
 
     def __str__(self):
         return f'{self.swagger_module}/ResourceProviders/{self.name}'
 
+    @property
+    def readme_path(self):
+        return self._readme_path
+
+    def get_signature(self):
+        """The signature of the files in folder and the readme file, which is used to verify the snapshot."""
+        readme_version = get_file_version(self._readme_path) if self._readme_path else None
+        return f"{get_folder_version(self.folder_path)}:{readme_version}"
+
+    def dump_snapshot(self):
+        """Dump the resource map and tags, they're parsed from the swagger files and readme file."""
+        resource_map = self.get_resource_map()
+        return {
+            "name": self.name,
+            "folder": self.folder_path,
+            "readme": self.readme_path,
+            "signature": self.get_signature(),
+            "tags": [[str(tag), sorted(files)] for tag, files in self.tags.items()],
+            "resources": [
+                resource.dump_snapshot() for version_map in resource_map.values() for resource in version_map.values()
+            ],
+        }
+
+    def load_snapshot(self, snapshot):
+        """Use the resource map and tags in snapshot instead of parsing the files. The snapshot is verified by the
+        signature when it's used, and it's ignored when the files are changed.
+        """
+        self._snapshot = snapshot
+
+    def _apply_snapshot(self):
+        snapshot, self._snapshot = self._snapshot, None
+        if snapshot['signature'] != self.get_signature():
+            logger.info(f"Ignore stale snapshot of {self}")
+            return
+        tags = OrderedDict()
+        for tag, files in snapshot['tags']:
+            tags[ResourceProviderTag(tag, self)] = set(files)
+        resource_map = {}
+        for data in snapshot['resources']:
+            resource = Resource.load_snapshot(data, self)
+            if resource.id not in resource_map:
+                resource_map[resource.id] = {}
+            resource_map[resource.id][resource.version] = resource
+        self._tags = tags
+        self._resource_map = resource_map
+
     def get_resource_map(self, refresh=False):
+        if refresh:
+            # the tags are parsed from readme file again as well
+            self._snapshot = None
+            self._tags = None
+        elif self._snapshot is not None:
+            self._apply_snapshot()
         if refresh or not self._resource_map:
             resource_map = {}
             for root, dirs, files in os.walk(self.folder_path):
@@ -76,6 +130,8 @@ class ResourceProvider:
 
     @property
     def tags(self):
+        if self._tags is None and self._snapshot is not None:
+            self._apply_snapshot()
         if self._tags is None:
             self._tags = self._parse_readme_input_file_tags()
         return self._tags
@@ -35,6 +35,19 @@ class SwaggerModule:
         else:
             return [*self._parent.names, self.name]
 
+    @classmethod
+    def load_snapshot(cls, plane, snapshot):
+        module = None
+        for data in snapshot:
+            module = cls(plane=plane, name=data['name'], folder_path=data['folder'], parent=module)
+        return module
+
+    def dump_snapshot(self):
+        """Dump the module and its parents from the root."""
+        snapshot = self._parent.dump_snapshot() if self._parent is not None else []
+        snapshot.append({"name": self.name, "folder": self.folder_path})
+        return snapshot
+
 
 class MgmtPlaneModule(SwaggerModule):
 
@@ -1,4 +1,5 @@
 from swagger.tests.common import SwaggerSpecsTestCase
+import json
 import os
 import time
 from utils.plane import PlaneEnum
@@ -84,6 +85,45 @@ class SwaggerSpecsApiTestCase(SwaggerSpecsTestCase):
                         assert rv.status_code == 200, rv.get_json()['message']
         time.sleep(1)
 
+    def test_mgmt_plane_resources_pagination(self):
+        with self.app.test_client() as c:
+            rv = c.get(f'/Swagger/Specs/{PlaneEnum.Mgmt}')
+            modules = rv.get_json()
+            assert rv.status_code == 200, rv.get_json()['message']
+            for module in modules[:5]:
+                rv = c.get(f"{module['url']}/ResourceProviders")
+                assert rv.status_code == 200, rv.get_json()['message']
+                rps = rv.get_json()
+                for rp in rps:
+                    rv = c.get(f"{rp['url']}/Resources")
+                    assert rv.status_code == 200, rv.get_json()['message']
+                    resources = rv.get_json()
+
+                    paged_resources = []
+                    url = f"{rp['url']}/Resources?limit=1"
+                    while url:
+                        rv = c.get(url)
+                        assert rv.status_code == 200, rv.get_json()['message']
+                        page = rv.get_json()
+                        assert len(page) <= 1
+                        paged_resources.extend(page)
+                        link = rv.headers.get('Link', None)
+                        url = link[1:link.index('>')] if link else None
+                    assert paged_resources == resources
+
+                    rv = c.get(f"{rp['url']}/Resources?format=ndjson")
+                    assert rv.status_code == 200
+                    assert rv.mimetype == 'application/x-ndjson'
+                    lines = rv.get_data(as_text=True).splitlines()
+                    assert [json.loads(line) for line in lines] == resources
+
+                    rv = c.get(f"{rp['url']}?limit=1")
+                    assert rv.status_code == 200, rv.get_json()['message']
+                    assert [r['id'] for r in rv.get_json()['resources']] == [r['id'] for r in resources[:1]]
+
+                    rv = c.get(f"{rp['url']}/Resources?cursor={b64encode_str('invalid')}")
+                    assert rv.status_code == 400
+
     def test_data_plane_resources(self):
         with self.app.test_client() as c:
             rv = c.get(f'/Swagger/Specs/{PlaneEnum.Data}')
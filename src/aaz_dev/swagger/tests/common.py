@@ -3,6 +3,9 @@ from swagger.model.specs import SwaggerSpecs
 from app.tests.common import ApiTestCase
 from utils.plane import PlaneEnum
 
+# the swagger specs of module 'test' used by the tests which don't depend on azure-rest-api-specs repo
+TEST_SWAGGER_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+
 
 class SwaggerSpecsTestCase(ApiTestCase):
 
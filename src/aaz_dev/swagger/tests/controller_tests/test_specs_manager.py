@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+
+from app.tests.common import ApiTestCase
+from swagger.controller.specs_manager import SwaggerSpecsManager
+from swagger.tests.common import TEST_SWAGGER_FOLDER
+from swagger.utils.tools import swagger_resource_path_to_resource_id
+from utils.config import Config
+from utils.plane import PlaneEnum
+
+
+class SwaggerSpecsManagerTest(ApiTestCase):
+
+    RP_NAME = "Microsoft.Test"
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(setattr, Config, "SWAGGER_PATH", Config.SWAGGER_PATH)
+        self.addCleanup(setattr, SwaggerSpecsManager, "_shared", SwaggerSpecsManager._shared)
+        Config.SWAGGER_PATH = os.path.join(self.AAZ_DEV_FOLDER, "swagger")
+        shutil.copytree(TEST_SWAGGER_FOLDER, Config.SWAGGER_PATH)
+        self.swagger_path = os.path.join(
+            Config.SWAGGER_PATH, "specification", "test", "resource-manager", self.RP_NAME, "stable", "2022-01-01",
+            "widgets.json")
+
+    def add_subscription_list_path(self):
+        with open(self.swagger_path, 'r') as f:
+            data = json.load(f)
+        list_path = "/subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/Microsoft.Test/widgets"
+        path = "/subscriptions/{subscriptionId}/providers/Microsoft.Test/widgets"
+        path_item = json.loads(json.dumps(data['paths'][list_path]))
+        path_item['get']['operationId'] = "Widgets_ListBySubscription"
+        path_item['get']['parameters'] = [
+            p for p in path_item['get']['parameters'] if p['$ref'] != "#/parameters/ResourceGroupNameParameter"]
+        data['paths'][path] = path_item
+        with open(self.swagger_path, 'w') as f:
+            json.dump(data, f)
+        return swagger_resource_path_to_resource_id(path)
+
+    def test_shared_manager_reload_resources(self):
+        manager = SwaggerSpecsManager.warm_up()
+        self.assertIs(SwaggerSpecsManager.get_shared(), manager)
+        module_manager = manager.get_module_manager(PlaneEnum.Mgmt, ["test"])
+        grouped_map = module_manager.get_grouped_resource_map(self.RP_NAME)
+        self.assertIs(module_manager.get_grouped_resource_map(self.RP_NAME), grouped_map)
+
+        # the new resource in the changed swagger file is found by the shared manager
+        resource_id = self.add_subscription_list_path()
+        grouped_map = module_manager.get_grouped_resource_map(self.RP_NAME)
+        self.assertIn(resource_id, grouped_map["Widgets"])
+        resource = module_manager.get_resource_in_version(resource_id, "2022-01-01")
+        self.assertEqual(resource.file_path, self.swagger_path)
+
+    def test_resource_provider_etag(self):
+        SwaggerSpecsManager.warm_up()
+        rp_url = f"/Swagger/Specs/{PlaneEnum.Mgmt}/test/ResourceProviders/{self.RP_NAME}"
+        with self.app.test_client() as c:
+            rv = c.get(rp_url)
+            self.assertEqual(rv.status_code, 200)
+            etag = rv.headers['ETag']
+
+            resource_id = self.add_subscription_list_path()
+            rv = c.get(rp_url, headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 200)
+            self.assertNotEqual(rv.headers['ETag'], etag)
+            self.assertIn(resource_id, [resource['id'] for resource in rv.get_json()['resources']])
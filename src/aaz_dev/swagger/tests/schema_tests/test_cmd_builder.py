@@ -0,0 +1,225 @@
+from unittest import TestCase, mock
+
+from command.model.configuration import CMDClsSchema, CMDHttpOperation, CMDObjectSchema, CMDStringSchema
+from swagger.controller.command_generator import CommandGenerator
+from swagger.model.schema.cmd_builder import CMDBuilder, _ConversionCacheEntry, _clone_converted
+from swagger.model.schema.fields import MutabilityEnum
+from swagger.model.specs import SwaggerSpecs
+from swagger.tests.common import TEST_SWAGGER_FOLDER
+from swagger.utils import exceptions
+from utils.plane import PlaneEnum
+
+
+class _Schema:
+    """A schema which converts its children by the builder, and calls `on_build` with the builder of itself."""
+
+    def __init__(self, name, *children, on_build=None, **kwargs):
+        self.traces = ("test.json", "definitions", name)
+        self.children = children
+        self.on_build = on_build
+        self.kwargs = kwargs
+        self.builders = []
+
+    def to_cmd(self, builder, **kwargs):
+        self.builders.append(builder)
+        if self.on_build is not None:
+            self.on_build(builder)
+        return [builder(child, **child.kwargs) for child in self.children]
+
+
+class BuildingPathTest(TestCase):
+
+    def new_builder(self):
+        return CMDBuilder(path="/test", method="get", mutability=MutabilityEnum.Read)
+
+    def assert_path_empty(self, builder):
+        building_path = builder._building_path
+        self.assertEqual(building_path.builders, [])
+        self.assertEqual(building_path.ids, {})
+        self.assertEqual(building_path.traces, {})
+
+    def test_building_path(self):
+        checked = []
+
+        def on_build(builder):
+            schema_a_builder, schema_b_builder = schema_a.builders[0], schema_b.builders[0]
+            self.assertIs(builder._building_path, root._building_path)
+            self.assertEqual(builder._building_path.builders, [schema_a_builder, schema_b_builder, builder])
+            self.assertTrue(builder._building_path.is_current(builder))
+            self.assertFalse(builder._building_path.is_current(schema_b_builder))
+            self.assertEqual(builder.parent_ids, [None, schema_a_builder.id, schema_b_builder.id])
+
+            # ancestor lookup
+            self.assertTrue(builder._is_building(schema_a_builder.id))
+            self.assertTrue(builder._is_building(builder.id))
+            self.assertFalse(builder._is_building((schema_a.traces, MutabilityEnum.Create, False)))
+            self.assertTrue(builder.find_traces(schema_a.traces))
+            self.assertTrue(builder.find_traces(schema_b.traces))
+            # exclude self
+            self.assertFalse(builder.find_traces(schema_c.traces))
+            self.assertFalse(builder.find_traces(("test.json", "definitions", "D")))
+            checked.append(builder)
+
+        schema_c = _Schema("C", on_build=on_build)
+        schema_b = _Schema("B", schema_c)
+        schema_a = _Schema("A", schema_b)
+
+        root = self.new_builder()
+        self.assertTrue(root._building_path.is_current(root))
+        root(schema_a)
+        self.assertEqual(len(checked), 1)
+        self.assertEqual(checked[0].id, (schema_c.traces, MutabilityEnum.Read, False))
+        self.assert_path_empty(root)
+
+    def test_building_path_with_same_traces(self):
+        checked = []
+
+        def on_build_sibling(builder):
+            # the previous sibling is popped
+            self.assertEqual(builder._building_path.ids[builder.id], 1)
+            self.assertFalse(builder.find_traces(schema_b.traces))
+            checked.append(builder)
+
+        def on_build_child(builder):
+            # the same schema in different mutability is not a loop, but its traces are in ancestors
+            self.assertEqual(builder._building_path.traces[schema_a.traces], 2)
+            self.assertTrue(builder.find_traces(schema_a.traces))
+            self.assertFalse(builder._is_building((schema_a.traces, MutabilityEnum.Update, False)))
+            checked.append(builder)
+
+        schema_b = _Schema("B", on_build=on_build_sibling)
+        schema_a_update = _Schema("A", _Schema("C", on_build=on_build_child), mutability=MutabilityEnum.Create)
+        schema_a = _Schema("A", schema_b, schema_b, schema_a_update)
+
+        root = self.new_builder()
+        root(schema_a)
+        self.assertEqual(len(checked), 3)
+        self.assert_path_empty(root)
+
+    def test_reference_loop(self):
+        schema_a = _Schema("A")
+        schema_b = _Schema("B", schema_a)
+        schema_a.children = (schema_b,)
+
+        root = self.new_builder()
+        with self.assertRaises(exceptions.InvalidSwaggerValueError) as cm:
+            root(schema_a)
+        self.assertEqual(cm.exception.msg, "Find invalid reference loop")
+        self.assertEqual(cm.exception.key, (schema_a.traces, MutabilityEnum.Read, False))
+        # the index of the looped builder in parent ids
+        self.assertEqual(cm.exception.value, 1)
+        self.assert_path_empty(root)
+
+    def test_building_path_not_in_depth_first_order(self):
+        checked = []
+
+        def on_build(builder):
+            schema_a_builder, schema_b_builder = schema_a.builders[0], schema_b.builders[0]
+            # the builder of a finished parent uses a new building path, and ancestors are looked up by parents
+            self.assertIsNot(builder._building_path, root._building_path)
+            self.assertEqual(builder.parent_ids, [None, schema_a_builder.id, schema_b_builder.id])
+            self.assertTrue(builder._is_building(schema_a_builder.id))
+            self.assertTrue(builder.find_traces(schema_a.traces))
+            self.assertFalse(builder.find_traces(schema_c.traces))
+            checked.append(builder)
+
+        schema_c = _Schema("C", on_build=on_build)
+        schema_b = _Schema("B")
+        schema_a = _Schema("A", schema_b)
+
+        root = self.new_builder()
+        root(schema_a)
+        self.assert_path_empty(root)
+
+        schema_b_builder = schema_b.builders[0]
+        schema_b_builder(schema_c)
+        self.assertEqual(len(checked), 1)
+        with self.assertRaises(exceptions.InvalidSwaggerValueError):
+            schema_b_builder(schema_a)
+        self.assert_path_empty(root)
+
+
+class ConversionCacheTest(TestCase):
+
+    def get_resources(self):
+        specs = SwaggerSpecs(folder_path=TEST_SWAGGER_FOLDER)
+        module = next(iter(specs.get_mgmt_plane_modules(PlaneEnum.Mgmt)))
+        rp = next(iter(module.get_resource_providers()))
+        return [resource for version_map in rp.get_resource_map_by_tag("package-2022-01").values()
+                for resource in version_map.values()]
+
+    def generate_command_groups(self):
+        resources = self.get_resources()
+        generator = CommandGenerator()
+        generator.load_resources(resources)
+        return [generator.create_draft_command_group(resource) for resource in resources]
+
+    @staticmethod
+    def iter_response_schemas(command):
+        for operation in command.operations:
+            if not isinstance(operation, CMDHttpOperation):
+                continue
+            for response in operation.http.responses:
+                if response.body is not None and not response.is_error:
+                    yield operation.operation_id, response.body.json.schema
+
+    def test_conversion_cache(self):
+        replay = _ConversionCacheEntry.replay
+        with mock.patch.object(_ConversionCacheEntry, "replay", autospec=True, side_effect=replay) as replay_mock:
+            command_groups = self.generate_command_groups()
+            # the widget in the responses of operations is converted once
+            self.assertGreater(replay_mock.call_count, 0)
+
+        def convert_without_cache(builder, name, schema, **kwargs):
+            return builder._convert_cls_definition(name, schema, **kwargs)
+
+        with mock.patch.object(CMDBuilder, "_convert_cls_definition_with_cache", autospec=True,
+                               side_effect=convert_without_cache):
+            expected_command_groups = self.generate_command_groups()
+
+        self.assertEqual(
+            [group.to_primitive() for group in command_groups],
+            [group.to_primitive() for group in expected_command_groups]
+        )
+
+    def test_conversion_cache_results_not_shared(self):
+        command_group = self.generate_command_groups()[0]
+        commands = {command.name: command for command in command_group.commands}
+        _, show_schema = next(self.iter_response_schemas(commands["show"]))
+        _, create_schema = next(self.iter_response_schemas(commands["create"]))
+        self.assertIsNot(show_schema, create_schema)
+        self.assertEqual(show_schema.to_primitive(), create_schema.to_primitive())
+
+        create_data = commands["create"].to_primitive()
+        update_data = commands["update"].to_primitive()
+        for prop in show_schema.props:
+            prop.name = f"changed_{prop.name}"
+            if isinstance(prop, CMDObjectSchema) and prop.props:
+                prop.props.pop()
+        self.assertEqual(commands["create"].to_primitive(), create_data)
+        self.assertEqual(commands["update"].to_primitive(), update_data)
+
+    def test_clone_converted(self):
+        definition = CMDObjectSchema()
+        definition.name = "config"
+        definition.props = [CMDStringSchema({"name": "mode"})]
+        cls_schema = CMDClsSchema()
+        cls_schema.name = "backupConfig"
+        cls_schema._type = "@Config_read"
+        cls_schema.implement = definition
+        model = CMDObjectSchema()
+        model.name = "properties"
+        model.props = [definition, cls_schema]
+        cls_definitions = {"Config_read": {"count": 2, "model": definition}}
+
+        cloned_model, cloned_cls_definitions = _clone_converted(model, cls_definitions)
+        self.assertEqual(cloned_model.to_primitive(), model.to_primitive())
+        cloned_definition = cloned_cls_definitions["Config_read"]["model"]
+        self.assertIsNot(cloned_definition, definition)
+        self.assertEqual(cloned_cls_definitions["Config_read"]["count"], 2)
+        # the links to the definitions are kept in the cloned instances
+        self.assertIs(cloned_model.props[0], cloned_definition)
+        self.assertIs(cloned_model.props[1].implement, cloned_definition)
+
+        cloned_definition.props[0].name = "changed"
+        self.assertEqual(definition.props[0].name, "mode")
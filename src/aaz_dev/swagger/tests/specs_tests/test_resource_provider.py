@@ -1,4 +1,5 @@
 from swagger.tests.common import SwaggerSpecsTestCase
+from swagger.model.specs import ResourceProvider
 from datetime import datetime
 import time
 
@@ -53,3 +54,24 @@ class ResourceProviderLoaderTest(SwaggerSpecsTestCase):
         delta = datetime.now() - start
         print(delta.total_seconds())
         time.sleep(1)
+
+    def test_resource_map_snapshot(self):
+        for rp in self.get_mgmt_plane_resource_providers():
+            snapshot = rp.dump_snapshot()
+            resource_map = rp.get_resource_map()
+
+            restored = ResourceProvider(rp.name, rp.folder_path, rp.readme_path, swagger_module=rp.swagger_module)
+            restored.load_snapshot(snapshot)
+            restored_map = restored.get_resource_map()
+            self.assertEqual(restored._snapshot, None)
+            self.assertEqual(list(restored_map.keys()), list(resource_map.keys()))
+            for resource_id, version_map in resource_map.items():
+                for version, resource in version_map.items():
+                    restored_resource = restored_map[resource_id][version]
+                    self.assertEqual(restored_resource.path, resource.path)
+                    self.assertEqual(restored_resource.file_path, resource.file_path)
+                    self.assertEqual(restored_resource.operations, resource.operations)
+                    self.assertEqual(
+                        restored_resource.get_operation_group_name(), resource.get_operation_group_name())
+            self.assertEqual([str(tag) for tag in restored.tags], [str(tag) for tag in rp.tags])
+            break
@@ -25,6 +25,28 @@ class Config:
         os.environ.get("AAZ_DEV_WORKSPACE_FOLDER", os.path.join(AAZ_DEV_FOLDER, "workspaces"))
     )
 
+    # render the xml files of command models in a background worker instead of during saving
+    DEFER_XML_SIDECAR = os.environ.get("AAZ_DEFER_XML_SIDECAR", "").lower() in ("1", "true", "yes")
+
+    # load the command model json files written by aaz-dev without schematics conversion
+    TRUSTED_CFG_LOAD = os.environ.get("AAZ_TRUSTED_CFG_LOAD", "true").lower() in ("1", "true", "yes")
+
+    # the snapshot of swagger specs and aaz resources built by `aaz-dev cache build`, it's loaded at server startup
+    CACHE_SNAPSHOT_PATH = os.path.expanduser(
+        os.environ.get("AAZ_CACHE_SNAPSHOT_PATH", os.path.join(AAZ_DEV_FOLDER, "cache", "snapshot.json"))
+    )
+
+    # keep the workspaces loaded by editor requests in memory until they are idle for the seconds, 0 to disable it
+    WORKSPACE_SESSION_IDLE_TIMEOUT = int(os.environ.get("AAZ_WORKSPACE_SESSION_IDLE_TIMEOUT", 30 * 60))
+
+    # the long-running operations requested to run asynchronously are run as jobs by the worker threads, the states
+    # of jobs are saved in the folder, and the finished jobs are removed after the seconds of retention
+    AAZ_DEV_JOB_FOLDER = os.path.expanduser(
+        os.environ.get("AAZ_DEV_JOB_FOLDER", os.path.join(AAZ_DEV_FOLDER, "jobs"))
+    )
+    JOB_WORKERS = int(os.environ.get("AAZ_JOB_WORKERS", 2))
+    JOB_RETENTION = int(os.environ.get("AAZ_JOB_RETENTION", 24 * 60 * 60))
+
     # Flask configurations
     HOST = os.environ.get("AAZ_HOST", '127.0.0.1')
     PORT = int(os.environ.get("AAZ_PORT", 5000))
@@ -78,6 +100,11 @@ class Config:
                 raise ValueError(f"Path '{cls.SWAGGER_MODULE_PATH}' does not exist.")
         return cls.SWAGGER_MODULE_PATH
 
+    @classmethod
+    def validate_and_setup_cache_snapshot_path(cls, ctx, param, value):
+        cls.CACHE_SNAPSHOT_PATH = os.path.expanduser(value)
+        return cls.CACHE_SNAPSHOT_PATH
+
     @classmethod
     def validate_and_setup_default_swagger_module(cls, ctx, param, value):
         cls.DEFAULT_SWAGGER_MODULE = value
@@ -115,5 +142,10 @@ class Config:
                 raise ValueError(f"Path '{cls.AAZ_DEV_WORKSPACE_FOLDER}' is not a folder.")
         return cls.AAZ_DEV_WORKSPACE_FOLDER
 
+    @classmethod
+    def validate_and_setup_defer_xml_sidecar(cls, ctx, param, value):
+        cls.DEFER_XML_SIDECAR = value
+        return cls.DEFER_XML_SIDECAR
+
 
 __all__ = ["Config"]
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import stat
+import tempfile
+
+
+def _get_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# the mode of new files created by `open`, the temporary file is created by `mkstemp` with 0o600
+_DEFAULT_FILE_MODE = 0o666 & ~_get_umask()
+
+
+def write_file_atomically(path, data):
+    """Write the file by replacing it with a temporary file, so that it's never read partially written. The mode of
+    the existing file is kept.
+    """
+    folder, name = os.path.split(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = _DEFAULT_FILE_MODE
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def get_file_version(path):
+    """The version of file by its stat, None if file not exist."""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def get_file_digest(path):
+    """The digest of file content, None if file not exist. It tells the changes which keep the stat of file, such as
+    the writes in the granularity of file system timestamp.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    return hashlib.sha1(data).hexdigest()
+
+
+def get_folder_version(path):
+    """The version of folder by the stat of all the files in it, None if folder not exist."""
+    if not os.path.isdir(path):
+        return None
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            digest.update(f"{os.path.relpath(file_path, path)}:{file_stat.st_mtime_ns}:{file_stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+__all__ = ['write_file_atomically', 'get_file_version', 'get_file_digest', 'get_folder_version']
@@ -0,0 +1,72 @@
+import json
+
+from flask import Response, jsonify, request, stream_with_context, url_for
+
+from utils import exceptions
+from utils.base64 import b64encode_str, b64decode_str
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def is_listing_requested():
+    """Whether the client asks for a page or an NDJSON stream by `limit`, `cursor` or `format=ndjson` arguments or
+    the Accept header. The endpoints keep their original responses when it's not requested.
+    """
+    return 'limit' in request.args or 'cursor' in request.args or _is_ndjson_requested()
+
+
+def list_response(entries, wrap=None):
+    """Build the response of a page of entries.
+
+    `entries` is an iterable of (key, build), where key is a unique string used as cursor and build() returns the
+    item of the entry. Only the items of the page are built, and they are built lazily when streaming. The cursor of
+    the next page is returned in the `Link` header. `wrap(items)` returns the json result of the items, it's ignored
+    when streaming.
+    """
+    limit = request.args.get('limit', None, type=int)
+    if limit is not None and limit < 1:
+        raise exceptions.InvalidAPIUsage(f"Invalid limit: {limit}")
+    cursor = request.args.get('cursor', None)
+    if cursor is not None:
+        try:
+            cursor = b64decode_str(cursor)
+        except ValueError:
+            raise exceptions.InvalidAPIUsage(f"Invalid cursor: {cursor}")
+
+    page = []
+    next_key = None
+    started = cursor is None
+    for key, build in entries:
+        if not started:
+            if key != cursor:
+                continue
+            started = True
+        if limit is not None and len(page) >= limit:
+            next_key = key
+            break
+        page.append(build)
+    if not started:
+        raise exceptions.InvalidAPIUsage(f"Invalid cursor: {request.args['cursor']}")
+
+    if _is_ndjson_requested():
+        def generate():
+            for build in page:
+                yield json.dumps(build(), ensure_ascii=False) + "\n"
+        response = Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+    else:
+        items = [build() for build in page]
+        response = jsonify(wrap(items) if wrap else items)
+
+    if next_key is not None:
+        args = {**request.view_args, **request.args.to_dict(), "cursor": b64encode_str(next_key)}
+        response.headers['Link'] = f'<{url_for(request.endpoint, **args)}>; rel="next"'
+    return response
+
+
+def _is_ndjson_requested():
+    if request.args.get('format', None) == 'ndjson':
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+__all__ = ['NDJSON_MIMETYPE', 'is_listing_requested', 'list_response']
@@ -0,0 +1,50 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import current_app, jsonify, request
+
+
+class ResponseCache:
+    """Cache the serialized json responses of GET requests by the version of their content.
+
+    The version should be cheap to get without loading the models, such as the stat of files. The strong ETag of a
+    response is derived from the request path and the version, so `If-None-Match` requests are answered with 304
+    without building the response.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._entries = OrderedDict()  # etag -> json data
+        self._lock = threading.Lock()
+
+    def get_response(self, version, build):
+        """Return the response of current request. `build` returns the result to jsonify, it's only called when the
+        response of the version isn't cached. The response isn't cached when version is None.
+        """
+        if version is None:
+            return jsonify(build())
+
+        etag = hashlib.sha1(repr((request.full_path, version)).encode()).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        with self._lock:
+            data = self._entries.get(etag, None)
+            if data is not None:
+                self._entries.move_to_end(etag)
+        if data is None:
+            response = jsonify(build())
+            with self._lock:
+                self._entries[etag] = response.get_data()
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        else:
+            response = current_app.response_class(data, mimetype=current_app.config["JSONIFY_MIMETYPE"])
+        response.set_etag(etag)
+        return response
+
+
+__all__ = ['ResponseCache']
@@ -0,0 +1,59 @@
+import re
+from functools import lru_cache
+
+from flask import url_for
+from werkzeug.urls import url_quote
+
+from utils.base64 import b64encode_str
+
+
+@lru_cache(maxsize=65536)
+def b64encode_url(value):
+    """The url segment of value encoded by the `base64` url converter."""
+    return url_quote(b64encode_str(value), safe="/:")
+
+
+@lru_cache(maxsize=65536)
+def _quote_url(value):
+    return url_quote(value, safe="/:")
+
+
+class URLTemplate:
+    """The precompiled url of an endpoint.
+
+    The url is built by `url_for` once with markers in place of the variables, so the urls of the endpoint are
+    generated by filling the encoded values of the variables into the template, without matching the url rules.
+    Both string and `base64` converters are supported for the variables.
+    """
+
+    _MARKER_PREFIX = "aazurlvar"
+
+    def __init__(self, endpoint, variables, **values):
+        markers = {name: f"{self._MARKER_PREFIX}{idx}" for idx, name in enumerate(variables)}
+        url = url_for(endpoint, **values, **markers)
+
+        encoded_markers = {}
+        for name, marker in markers.items():
+            encoded_markers[marker] = (name, _quote_url)
+            encoded_markers[b64encode_url(marker)] = (name, b64encode_url)
+        pattern = re.compile("|".join(re.escape(m) for m in sorted(encoded_markers, key=len, reverse=True)))
+
+        self.encoders = {}
+        template = []
+        pos = 0
+        for match in pattern.finditer(url):
+            name, encoder = encoded_markers[match.group()]
+            template.append(url[pos:match.start()].replace("{", "{{").replace("}", "}}"))
+            template.append("{" + name + "}")
+            self.encoders[name] = encoder
+            pos = match.end()
+        template.append(url[pos:].replace("{", "{{").replace("}", "}}"))
+        if set(self.encoders) != set(variables):
+            raise ValueError(f"Variables not in url of endpoint '{endpoint}': {set(variables) - set(self.encoders)}")
+        self.template = "".join(template)
+
+    def build(self, **variables):
+        return self.template.format(**{name: self.encoders[name](value) for name, value in variables.items()})
+
+
+__all__ = ['b64encode_url', 'URLTemplate']